@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from rubiks_cube.compact import CompactRubikCube, to_compact
+from rubiks_cube.cube import RubikCube
+from rubiks_cube.movements import CubeMove
+from rubiks_cube.tables import MoveTable, get_move_table
+from rubiks_cube.utils import sticker_count
+
+
+class CubeBatch:
+    """
+    Class that holds N Rubik's Cubes of the same dimensions as an (N, stickers) array of color codes, with the
+    layout of CompactRubikCube. Every move is applied to all the cubes with a single NumPy operation.
+    """
+
+    def __init__(self, states: np.ndarray, dims: tuple[int, int, int], permitted_movements: set[CubeMove] = None):
+        # Array of states, one cube per row
+        states = np.asarray(states, dtype=np.uint8)
+        if states.ndim != 2 or states.shape[1] != sticker_count(dims):
+            raise ValueError(f"The states must have shape (N, {sticker_count(dims)}), not {states.shape}.")
+        self.states: np.ndarray = states
+
+        # Dimensions
+        self.dims: tuple[int, int, int] = tuple(dims)
+
+        # Set of permitted movements
+        self.permitted_movements: frozenset[CubeMove] = frozenset(permitted_movements or CubeMove)
+
+    @classmethod
+    def from_dims(cls, dims: tuple[int, int, int], n: int = 1, permitted_movements: set[CubeMove] = None) -> CubeBatch:
+        """
+        Factory method that generates a batch of `n` solved cubes.
+
+        :param dims: The dimensions in the standard (height, width, length).
+        :param n: The number of cubes.
+        :param permitted_movements: A set of permitted movements.
+        :return: A batch with `n` solved cubes.
+        """
+        rc = CompactRubikCube.from_dims(dims, permitted_movements)
+        return cls(np.tile(rc.stickers, (n, 1)), dims, permitted_movements)
+
+    @classmethod
+    def from_cubes(cls, cubes: Iterable[RubikCube | CompactRubikCube]) -> CubeBatch:
+        """
+        Factory method that stacks the given cubes into a batch. Every cube must have the same dimensions, and the
+        permitted movements of the first cube are used.
+
+        :param cubes: An iterable of RubikCube or CompactRubikCube instances.
+        :return: A batch with the cubes.
+        """
+        compact_cubes = [to_compact(rc) for rc in cubes]
+        if not compact_cubes:
+            raise ValueError("At least one cube is needed to create a batch.")
+        dims = compact_cubes[0].dims
+        if any(rc.dims != dims for rc in compact_cubes):
+            raise ValueError("Every cube of a batch must have the same dimensions.")
+        return cls(np.stack([rc.stickers for rc in compact_cubes]), dims, compact_cubes[0].permitted_movements)
+
+    def to_cubes(self) -> list[CompactRubikCube]:
+        """Returns the cubes of the batch as CompactRubikCube instances."""
+        return [CompactRubikCube(row, self.dims, self.permitted_movements) for row in self.states]
+
+    @property
+    def table(self) -> MoveTable:
+        """The (shared) table of permutations of the permitted movements."""
+        return get_move_table(self.dims, self.permitted_movements)
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def __getitem__(self, index: int) -> CompactRubikCube:
+        return CompactRubikCube(self.states[index], self.dims, self.permitted_movements)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(n={len(self)}, dims={self.dims})"
+
+    def _new(self, states: np.ndarray) -> CubeBatch:
+        """Make a new batch with the same dimensions and permitted movements."""
+        return self.__class__(states, self.dims, self.permitted_movements)
+
+    def apply(self, move: CubeMove) -> CubeBatch:
+        """
+        Applies the same move to every cube of the batch.
+
+        :param move: A permitted move.
+        :return: A new batch with the move applied.
+        """
+        return self._new(self.table.apply(self.states, move))
+
+    def apply_each(self, moves: Sequence[CubeMove] | np.ndarray) -> CubeBatch:
+        """
+        Applies a different move to every cube of the batch.
+
+        :param moves: One move per cube, given as CubeMoves or as integer rows of `self.table`.
+        :return: A new batch where the i-th cube has the i-th move applied.
+        """
+        table = self.table
+        if not isinstance(moves, np.ndarray):
+            moves = np.array([table.index(m) for m in moves], dtype=np.intp)
+        if moves.ndim != 1:
+            raise ValueError(f"The moves must be a 1-dimensional array, not one of shape {moves.shape}.")
+        if len(moves) != len(self):
+            raise ValueError(f"One move per cube is needed, got {len(moves)} moves for {len(self)} cubes.")
+        return self._new(np.take_along_axis(self.states, table.permutations[moves], axis=1))
+
+    def expand(self) -> np.ndarray:
+        """
+        Applies every permitted move to every cube of the batch.
+
+        :return: An (N * M, stickers) array, where the row `i * M + k` is the k-th move of `self.table` applied to
+         the i-th cube.
+        """
+        return self.states[:, self.table.permutations].reshape(-1, self.states.shape[1])
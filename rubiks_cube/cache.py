@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import zipfile
+from typing import Callable, Iterable
+
+import numpy as np
+
+from rubiks_cube import __version__
+from rubiks_cube.explorer import StateGraph, explore
+from rubiks_cube.movements import CubeMove
+from rubiks_cube.solver import DEFAULT_PATTERNS, PatternDatabase
+from rubiks_cube.storage import load_graph, save_graph
+from rubiks_cube.tables import MoveTable, get_move_table
+from rubiks_cube.utils import Color
+
+# Default directory of the cache, unless the environment variable RUBIKS_CUBE_CACHE is set
+DEFAULT_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache", "rubiks_cube")
+
+# Default budget of the cache (1 GiB)
+DEFAULT_MAX_BYTES = 1 << 30
+
+# Errors raised when an entry is missing or corrupted (e.g. truncated)
+_LOAD_ERRORS = (ValueError, OSError, EOFError, KeyError, zipfile.BadZipFile)
+
+# Extension of the files of every kind of entry
+_EXTENSIONS = {"graph": ".graph", "table": ".npy", "pdb": ".npz"}
+
+
+class GraphCache:
+    """
+    Class that keeps explored graphs, move tables and pattern databases in a directory, so they are computed once and
+    shared between processes. Every entry is a file whose name is the SHA-256 hash of its dimensions, its permitted
+    movements and the version of the library, so a new version never reads the entries of an old one.
+
+    The files are written to a temporary file and renamed, so a process never reads an incomplete entry. The last
+    modification time of an entry is updated when it is used, and the least recently used entries are removed when
+    the files exceed `max_bytes`.
+    """
+
+    def __init__(self, directory: str = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory: str = directory or os.environ.get("RUBIKS_CUBE_CACHE", DEFAULT_DIRECTORY)
+        self.max_bytes: int = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(directory={self.directory!r}, max_bytes={self.max_bytes})"
+
+    def key(self, kind: str, dims: tuple[int, int, int], permitted_movements: Iterable[CubeMove] = None,
+            *extra) -> str:
+        """
+        Returns the name of the file of an entry.
+
+        :param kind: The kind of the entry: "graph", "table" or "pdb".
+        :param dims: A tuple with the dimensions of a Rubik's Cube
+        :param permitted_movements: A set of permitted movements. By default, every movement.
+        :param extra: Other values that identify the entry (e.g. the colors of a pattern database).
+        :return: The name of the file.
+        """
+        codes = sorted(m.code for m in set(permitted_movements or CubeMove))
+        content = repr((kind, tuple(dims), codes, __version__) + extra)
+        return f"{kind}-{hashlib.sha256(content.encode()).hexdigest()}{_EXTENSIONS[kind]}"
+
+    def _entries(self) -> list[os.DirEntry]:
+        """Returns the files of the entries of the cache."""
+        return [entry for entry in os.scandir(self.directory)
+                if entry.is_file() and entry.name.endswith(tuple(_EXTENSIONS.values()))]
+
+    def size(self) -> int:
+        """Returns the number of bytes of the entries of the cache."""
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def evict(self, keep: str = None) -> None:
+        """
+        Removes the least recently used entries until the cache fits in its budget.
+
+        :param keep: The name of an entry that is never removed (e.g. the one that was just written).
+        :return: Nothing.
+        """
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, entry.name, stat.st_size))
+        entries.sort()
+        total = sum(size for *_, size in entries)
+        for _, name, size in entries:
+            if total <= self.max_bytes:
+                break
+            if name == keep:
+                continue
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                # Removed by another process
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        """Removes every entry of the cache."""
+        for entry in self._entries():
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+
+    def _get(self, name: str, load: Callable[[str], object], save: Callable[[str], None]):
+        """Loads an entry, or makes it, saves it and evicts the old entries if it is not in the cache."""
+        path = os.path.join(self.directory, name)
+        try:
+            value = load(path)
+        except _LOAD_ERRORS:
+            # The entry is missing or corrupted, so it is made again
+            pass
+        else:
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                # Removed by another process after it was loaded
+                pass
+            return value
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            save(tmp_path)
+            # Loaded before it is renamed, so another process can not remove it in between
+            value = load(tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self.evict(keep=name)
+        return value
+
+    def state_graph(self, dims: tuple[int, int, int], permitted_movements: set[CubeMove] = None) -> StateGraph:
+        """
+        Returns the graph of `explore`, memory-mapped from the cache.
+
+        :param dims: A tuple with the dimensions of a Rubik's Cube
+        :param permitted_movements: A set of permitted movements
+        :return: The state space as a StateGraph
+        """
+        return self._get(self.key("graph", dims, permitted_movements), load_graph,
+                         lambda path: save_graph(explore(dims, permitted_movements), path))
+
+    def move_table(self, dims: tuple[int, int, int], moves: set[CubeMove] = None) -> MoveTable:
+        """
+        Returns the table of permutations of `tables.get_move_table`, loaded from the cache.
+
+        :param dims: The dimensions in the standard (height, width, length).
+        :param moves: A set of moves. By default, every move.
+        :return: A MoveTable instance.
+        """
+        def save(path: str):
+            with open(path, "wb") as f:
+                np.save(f, get_move_table(dims, moves).permutations)
+
+        return self._get(self.key("table", dims, moves),
+                         lambda path: MoveTable.from_permutations(dims, moves or set(CubeMove), np.load(path)), save)
+
+    def pattern_database(self, dims: tuple[int, int, int], permitted_movements: set[CubeMove] = None,
+                         colors: Iterable[Color] = DEFAULT_PATTERNS[0]) -> PatternDatabase:
+        """
+        Returns the pattern database of `PatternDatabase.build`, loaded from the cache.
+
+        :param dims: A tuple with the dimensions of a Rubik's Cube
+        :param permitted_movements: A set of permitted movements
+        :param colors: The colors tracked by the pattern.
+        :return: The pattern database.
+        """
+        colors = tuple(colors)
+
+        def save(path: str):
+            with open(path, "wb") as f:
+                PatternDatabase.build(dims, permitted_movements, colors).save(f)
+
+        return self._get(self.key("pdb", dims, permitted_movements, sorted(c.code for c in colors)),
+                         PatternDatabase.load, save)
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import numpy as np
+
+from rubiks_cube.cube import NotPermittedMovementError, RubikCube
+from rubiks_cube.faces import Face
+from rubiks_cube.movements import CubeMove
+from rubiks_cube.tables import compile_move
+from rubiks_cube.utils import COLORS, face_shapes, sticker_count
+
+# Array to decode the color codes into colors.
+_CODE_TO_COLOR: np.ndarray = np.array(COLORS, dtype=object)
+
+
+def _encode_face(face: Face) -> np.ndarray:
+    """Function that maps a face of colors into a flat array of color codes."""
+    return np.fromiter((c.code for c in face.central_face.flat), dtype=np.uint8, count=face.central_face.size)
+
+
+def to_compact(cube: RubikCube | CompactRubikCube) -> CompactRubikCube:
+    """Returns the compact representation of a cube (the same instance if it is already compact)."""
+    return cube if isinstance(cube, CompactRubikCube) else CompactRubikCube.from_rubik_cube(cube)
+
+
+class CompactRubikCube:
+    """
+    Class that represents a Rubik's Cube as a single contiguous vector of color codes (`uint8`).
+
+    The stickers are stored face by face in the order (up, left, front, right, back, down), every face
+    flattened in row-major order. The colors only appear when the cube is printed or converted.
+    """
+    __slots__ = ("stickers", "dims", "permitted_movements", "_key")
+
+    def __init__(self, stickers: np.ndarray | list[int], dims: tuple[int, int, int],
+                 permitted_movements: set[CubeMove] | frozenset[CubeMove] = None):
+        # Vector of stickers
+        stickers = np.array(stickers, dtype=np.uint8).ravel()
+        if stickers.size != sticker_count(dims):
+            raise ValueError(f"A cube of dimensions {dims} has {sticker_count(dims)} stickers, not {stickers.size}.")
+        stickers.flags.writeable = False
+        self.stickers: np.ndarray = stickers
+
+        # Dimensions
+        self.dims: tuple[int, int, int] = tuple(dims)
+
+        # Set of permitted movements. It is shared between the cubes obtained by moves.
+        self.permitted_movements: frozenset[CubeMove] = frozenset(permitted_movements or CubeMove)
+
+        # Key of the state, computed when it is needed
+        self._key: bytes | None = None
+
+    @classmethod
+    def _from_valid_stickers(cls, stickers: np.ndarray, dims: tuple[int, int, int],
+                             permitted_movements: frozenset[CubeMove]) -> CompactRubikCube:
+        """Creates an instance without validating nor copying the (already owned) vector of stickers."""
+        new = cls.__new__(cls)
+        stickers.flags.writeable = False
+        new.stickers, new.dims, new.permitted_movements, new._key = stickers, dims, permitted_movements, None
+        return new
+
+    @classmethod
+    def from_dims(cls, dims: tuple[int, int, int],
+                  permitted_movements: set[CubeMove] = None) -> CompactRubikCube:
+        """
+        Factory method that generates a solved CompactRubikCube given the dimensions and permitted movements.
+
+        :param dims: The dimensions in the standard (height, width, length).
+        :param permitted_movements: A set of permitted movements.
+        :return: An instance of the Rubik's Cube with the desired dimension.
+        """
+        return cls.from_rubik_cube(RubikCube.from_dims(dims, permitted_movements))
+
+    @classmethod
+    def from_rubik_cube(cls, rc: RubikCube) -> CompactRubikCube:
+        """
+        Factory method that converts a RubikCube into its compact representation.
+
+        :param rc: A Rubik's Cube.
+        :return: The same Rubik's Cube as a CompactRubikCube.
+        """
+        stickers = np.concatenate([_encode_face(f) for f in rc.faces])
+        return cls(stickers, rc.dims, rc.permitted_movements)
+
+    def to_rubik_cube(self) -> RubikCube:
+        """Converts the current cube into a RubikCube instance."""
+        return RubikCube(*self.faces, permitted_movements=set(self.permitted_movements))
+
+    @property
+    def key(self) -> bytes:
+        """The bytes of the color codes. It identifies the state among the cubes of the same dimensions."""
+        if self._key is None:
+            self._key = self.stickers.tobytes()
+        return self._key
+
+    def face_arrays(self) -> tuple[np.ndarray, ...]:
+        """
+        Returns read-only views of the color codes of every face, in the order (up, left, front, right, back, down).
+        """
+        arrays, start = [], 0
+        for shape in face_shapes(self.dims):
+            end = start + shape[0] * shape[1]
+            arrays.append(self.stickers[start:end].reshape(shape))
+            start = end
+        return tuple(arrays)
+
+    @property
+    def faces(self) -> tuple[Face, ...]:
+        """Returns new faces with colors, in the order (up, left, front, right, back, down)."""
+        return tuple(Face(_CODE_TO_COLOR[arr]) for arr in self.face_arrays())
+
+    def __eq__(self, other):
+        if other is self:
+            return True
+        if not isinstance(other, CompactRubikCube):
+            return False
+        other: CompactRubikCube
+        return self.dims == other.dims and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __repr__(self):
+        return repr(self.to_rubik_cube())
+
+    def _make_a_move_from_cube_move(self, movement: CubeMove) -> CompactRubikCube:
+        """Make a new cube with the selected move."""
+        # Check if the movement is permitted (or if it is even a movement).
+        if movement not in self.permitted_movements:
+            raise NotPermittedMovementError(
+                f"Movement not allowed. Please choose one of the list: {set(self.permitted_movements)}.")
+        # The move is a precompiled permutation of the stickers
+        stickers = self.stickers[compile_move(self.dims, movement)]
+        return self._from_valid_stickers(stickers, self.dims, self.permitted_movements)
+
+    def _make_movements_from_list(self, list_of_moves: list[CubeMove]) -> CompactRubikCube:
+        """Make movements from a list of CubeMoves."""
+        rc = self
+        for move in list_of_moves:
+            rc = rc._make_a_move_from_cube_move(move)
+        return rc
+
+    def _make_movements_from_str(self, str_of_moves: str) -> CompactRubikCube:
+        """Make movements from a string, separated by spaces."""
+        list_of_moves: list[CubeMove] = [CubeMove.parse_move(m_str) for m_str in str_of_moves.split()]
+        return self._make_movements_from_list(list_of_moves)
+
+    def make_movements(self, movement: CubeMove | list[CubeMove] | str) -> CompactRubikCube:
+        """
+        Make a move on the Rubik's Cube given a movement. It can be whether a CubeMove, a list of CubeMoves or a
+        string with representations of movements.
+
+        :param movement: The movement to apply on the Rubik's cube.
+        :return: The Rubik's cube with the movement applied.
+        """
+        if isinstance(movement, CubeMove):
+            return self._make_a_move_from_cube_move(movement)
+        if isinstance(movement, list):
+            return self._make_movements_from_list(movement)
+        if isinstance(movement, str):
+            return self._make_movements_from_str(movement)
+        raise NotPermittedMovementError("Please give a list of CubeMove or give a valid string format.")
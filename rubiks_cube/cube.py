@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import copy
 
+import numpy as np
+
 from rubiks_cube.faces import Face
 from rubiks_cube.movements import CubeMove
-from rubiks_cube.utils import Color, Direction
+from rubiks_cube.utils import Color, Direction, face_shapes
 
 # Directions
 _U, _R, _D, _L = Direction.U, Direction.R, Direction.D, Direction.L
@@ -62,11 +64,11 @@ class RubikCube:
         :param permitted_movements: A set of permitted movements.
         :return: An instance of the Rubik's Cube with the desired dimension.
         """
-        height, width, length = dims
+        up, left, front, right, back, down = face_shapes(dims)
         cls_to_return = cls(
-            front=Face.from_color(Color.RED, (height, width)), back=Face.from_color(Color.ORANGE, (height, width)),
-            left=Face.from_color(Color.GREEN, (height, length)), right=Face.from_color(Color.BLUE, (height, length)),
-            up=Face.from_color(Color.WHITE, (length, width)), down=Face.from_color(Color.YELLOW, (length, width)),
+            front=Face.from_color(Color.RED, front), back=Face.from_color(Color.ORANGE, back),
+            left=Face.from_color(Color.GREEN, left), right=Face.from_color(Color.BLUE, right),
+            up=Face.from_color(Color.WHITE, up), down=Face.from_color(Color.YELLOW, down),
             permitted_movements=permitted_movements,
         )
         return cls_to_return
@@ -147,13 +149,27 @@ class RubikCube:
 
         return str_to_return
 
+    def _successor(self) -> RubikCube:
+        """
+        Make a copy of the current cube to apply a movement on it. Unlike a deepcopy, every face is a view of a single
+        new buffer. The set of permitted movements is copied (it is small), so changing it does not change the current
+        cube.
+        """
+        buffer = np.concatenate([f.central_face.reshape(-1) for f in self.faces])
+        faces, start = [], 0
+        for f in self.faces:
+            end = start + f.central_face.size
+            faces.append(Face(buffer[start:end].reshape(f.central_face.shape)))
+            start = end
+        return self.__class__(*faces, permitted_movements=set(self.permitted_movements))
+
     def _make_a_move_from_cube_move(self, movement: CubeMove) -> RubikCube:
         """Make a copy with the selected move."""
         # Check if the movement is permitted (or if it is even a movement).
         if movement not in self.permitted_movements:
             raise NotPermittedMovementError(
                 f"Movement not allowed. Please choose one of the list: {self.permitted_movements}.")
-        self_copy: RubikCube = copy.deepcopy(self)
+        self_copy: RubikCube = self._successor()
         movement.move_the_cube(self_copy)
         return self_copy
 
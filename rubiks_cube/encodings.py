@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import functools
+from itertools import combinations
+from typing import Callable, Iterator
+
+# Size of the groups of the commander encoding
+_COMMANDER_GROUP_SIZE = 3
+
+
+class VariablePool:
+    """Class that gives new (auxiliary) variables, after the largest variable already in use."""
+
+    def __init__(self, top: int = 0):
+        # Largest variable in use
+        self.top: int = top
+
+    def new(self) -> int:
+        """Returns a new variable."""
+        self.top += 1
+        return self.top
+
+
+def pairwise(literals: list[int], variables: VariablePool) -> Iterator[list[int]]:
+    """
+    At-most-one encoding with a clause for every pair of literals. It has no auxiliary variables, but it has a
+    quadratic number of clauses.
+    """
+    for u, v in combinations(literals, 2):
+        yield [-u, -v]
+
+
+def sequential(literals: list[int], variables: VariablePool) -> Iterator[list[int]]:
+    """
+    At-most-one encoding with a sequential counter (Sinz, 2005): the auxiliary variable `s_i` is true if one of the
+    first i literals is true. It has n - 1 auxiliary variables and 3n - 4 clauses.
+    """
+    if len(literals) <= 1:
+        return
+    s = [variables.new() for _ in range(len(literals) - 1)]
+    yield [-literals[0], s[0]]
+    for i in range(1, len(literals) - 1):
+        yield [-literals[i], s[i]]
+        yield [-s[i - 1], s[i]]
+        yield [-literals[i], -s[i - 1]]
+    yield [-literals[-1], -s[-1]]
+
+
+def ladder(literals: list[int], variables: VariablePool) -> Iterator[list[int]]:
+    """
+    At-most-one encoding with a ladder (Gent and Nightingale, 2004): the auxiliary variables `y_i` are a decreasing
+    sequence, and the i-th literal implies that the ladder goes down exactly at the i-th step. It has n - 1 auxiliary
+    variables and 3n - 4 clauses.
+    """
+    if len(literals) <= 1:
+        return
+    y = [variables.new() for _ in range(len(literals) - 1)]
+    for i in range(len(y) - 1):
+        yield [-y[i + 1], y[i]]
+    yield [-literals[0], -y[0]]
+    for i in range(1, len(literals) - 1):
+        yield [-literals[i], y[i - 1]]
+        yield [-literals[i], -y[i]]
+    yield [-literals[-1], y[-1]]
+
+
+def commander(literals: list[int], variables: VariablePool) -> Iterator[list[int]]:
+    """
+    At-most-one encoding with commander variables (Klieber and Kwon, 2007): the literals are split into small groups
+    with pairwise constraints, every group has a commander that is true if and only if one of its literals is true,
+    and the commanders are constrained recursively. It has a linear number of clauses and auxiliary variables.
+    """
+    if len(literals) <= _COMMANDER_GROUP_SIZE + 1:
+        yield from pairwise(literals, variables)
+        return
+    commanders = []
+    for g in range(0, len(literals), _COMMANDER_GROUP_SIZE):
+        group = literals[g:g + _COMMANDER_GROUP_SIZE]
+        c = variables.new()
+        commanders.append(c)
+        yield from pairwise(group, variables)
+        yield [-c] + group
+        for x in group:
+            yield [-x, c]
+    yield from commander(commanders, variables)
+
+
+def totalizer(literals: list[int], variables: VariablePool) -> Iterator[list[int]]:
+    """
+    At-most-one encoding with a totalizer (Bailleux and Boufkhad, 2003): a binary tree whose nodes count (in unary,
+    up to 2) the true literals below them. It has a linear number of clauses and auxiliary variables.
+    """
+
+    def count(leaves: list[int]) -> Iterator[list[int]]:
+        """Generates the clauses of a subtree, returning its outputs (at least one, at least two)."""
+        if len(leaves) == 1:
+            return leaves
+        left = yield from count(leaves[:len(leaves) // 2])
+        right = yield from count(leaves[len(leaves) // 2:])
+        outputs = [variables.new() for _ in range(min(2, len(left) + len(right)))]
+        for i, a in enumerate(left):
+            yield [-a, outputs[i]]
+        for j, b in enumerate(right):
+            yield [-b, outputs[j]]
+        for i, a in enumerate(left):
+            for j, b in enumerate(right):
+                if i + j + 1 < len(outputs):
+                    yield [-a, -b, outputs[i + j + 1]]
+        return outputs
+
+    if len(literals) <= 1:
+        return
+    outputs = yield from count(literals)
+    yield [-outputs[1]]
+
+
+# At-most-one encodings by name
+ENCODINGS: dict[str, Callable[[list[int], VariablePool], Iterator[list[int]]]] = {
+    "pairwise": pairwise,
+    "sequential": sequential,
+    "commander": commander,
+    "totalizer": totalizer,
+    "ladder": ladder,
+}
+
+
+def at_most_one(literals: list[int], variables: VariablePool, encoding: str = "pairwise") -> Iterator[list[int]]:
+    """
+    Generates the clauses that allow at most one of the literals to be true.
+
+    :param literals: A list of literals.
+    :param variables: The pool of the auxiliary variables.
+    :param encoding: The name of the encoding (one of `ENCODINGS`).
+    :return: An iterator of the clauses.
+    """
+    try:
+        encode = ENCODINGS[encoding]
+    except KeyError:
+        raise ValueError(f"Unknown encoding {encoding!r}. Please choose one of the list: {list(ENCODINGS)}.") from None
+    return encode(literals, variables)
+
+
+def exactly_one(literals: list[int], variables: VariablePool, encoding: str = "pairwise") -> Iterator[list[int]]:
+    """
+    Generates the clauses that make exactly one of the literals true.
+
+    :param literals: A list of literals.
+    :param variables: The pool of the auxiliary variables.
+    :param encoding: The name of the encoding of the at-most-one part (one of `ENCODINGS`).
+    :return: An iterator of the clauses.
+    """
+    yield list(literals)
+    yield from at_most_one(literals, variables, encoding)
+
+
+@functools.lru_cache(maxsize=None)
+def encoding_size(encoding: str, n: int) -> tuple[int, int]:
+    """
+    Computes the size of the at-most-one encoding of `n` literals, which only depends on `n`.
+
+    :param encoding: The name of the encoding (one of `ENCODINGS`).
+    :param n: The number of literals.
+    :return: The number of auxiliary variables and the number of clauses.
+    """
+    variables = VariablePool(n)
+    n_clauses = sum(1 for _ in at_most_one(list(range(1, n + 1)), variables, encoding))
+    return variables.top - n, n_clauses
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import networkx as nx
+import numpy as np
+
+from rubiks_cube.compact import CompactRubikCube
+from rubiks_cube.cube import RubikCube
+from rubiks_cube.movements import MOVES, CubeMove
+from rubiks_cube.packing import WORD, n_words, pack, packed_keys, unpack
+from rubiks_cube.ranking import StateRanking
+from rubiks_cube.tables import get_move_table
+
+
+class VisitedStates:
+    """
+    Class that holds the keys of a set of visited states, sorted to search them, with their ids. The keys are the
+    packed states (see `packing.pack`), so every state takes 3 bits per sticker and the states are compared by words.
+    """
+
+    def __init__(self, n_stickers: int):
+        self.n_stickers: int = n_stickers
+        self.keys: np.ndarray = np.empty(0, dtype=np.dtype((np.void, n_words(n_stickers) * WORD.itemsize)))
+        self.ids: np.ndarray = np.empty(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, states: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Adds several states (that may be repeated or already visited). The new states are numbered after the visited
+        ones, in the order of their keys.
+
+        :param states: An (N, stickers) array of color codes.
+        :return: The id of every row of `states`, and the new states (in the order of their ids).
+        """
+        keys, first, inverse = np.unique(packed_keys(pack(states)), return_index=True, return_inverse=True)
+
+        # Find the states already visited
+        positions = np.searchsorted(self.keys, keys)
+        found = positions < len(self.keys)
+        found[found] = self.keys[positions[found]] == keys[found]
+        ids = np.empty(len(keys), dtype=np.int64)
+        ids[found] = self.ids[positions[found]]
+
+        # Number the new states
+        new = ~found
+        ids[new] = np.arange(len(self), len(self) + np.count_nonzero(new))
+
+        # Add the new states, keeping the keys sorted
+        insert_at = np.searchsorted(self.keys, keys[new])
+        self.keys = np.insert(self.keys, insert_at, keys[new])
+        self.ids = np.insert(self.ids, insert_at, ids[new])
+
+        return ids[inverse.reshape(-1)], states[first[new]]
+
+    def states(self) -> np.ndarray:
+        """Returns the visited states in the order of their keys, as an (N, stickers) array of color codes."""
+        return unpack(self.keys.view(WORD).reshape(len(self.keys), -1), self.n_stickers)
+
+
+class StateGraph:
+    """
+    Class that represents the state space of a Rubik's Cube with CSR adjacency arrays. The state with id `i` is the
+    row `i` of `states`, and its out-edges are `indices[indptr[i]:indptr[i + 1]]`, labelled with the codes of the
+    moves in `moves[indptr[i]:indptr[i + 1]]`.
+    """
+
+    def __init__(self, dims: tuple[int, int, int], permitted_movements: set[CubeMove],
+                 states: np.ndarray, indptr: np.ndarray, indices: np.ndarray, moves: np.ndarray,
+                 depth: np.ndarray = None):
+        self.dims: tuple[int, int, int] = tuple(dims)
+        self.permitted_movements: frozenset[CubeMove] = frozenset(permitted_movements)
+
+        # States and CSR adjacency
+        self.states: np.ndarray = states
+        self.indptr: np.ndarray = indptr
+        self.indices: np.ndarray = indices
+        self.moves: np.ndarray = moves
+
+        # Distance of every state to the solved cube (the state 0), if it is known
+        self.depth: np.ndarray | None = depth
+
+        # Bipartition of the states (see `graph.find_bipartite`)
+        self.bipartite: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(dims={self.dims}, n_states={len(self)}, n_edges={self.n_edges})"
+
+    @property
+    def n_edges(self) -> int:
+        """Number of (directed) edges, one per state and permitted movement."""
+        return len(self.indices)
+
+    def depth_distribution(self) -> np.ndarray:
+        """Returns the number of states at every distance of the solved cube. Its last index is the God's number."""
+        if self.depth is None:
+            raise ValueError("The depth of the states is not known.")
+        return np.bincount(self.depth)
+
+    def neighbours(self, i: int) -> np.ndarray:
+        """Returns the ids of the states reached from the state `i` with one movement."""
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def cube(self, i: int) -> CompactRubikCube:
+        """Returns the state with id `i` as a cube."""
+        return CompactRubikCube(self.states[i], self.dims, self.permitted_movements)
+
+    def ranking(self) -> StateRanking:
+        """Returns a ranking that maps every state into its id."""
+        return StateRanking(self.states, self.dims, self.permitted_movements)
+
+    def edge_list(self) -> np.ndarray:
+        """
+        Returns the undirected edges of the graph (self-loops included) as an (E, 2) array of sorted pairs of ids,
+        without repetitions and in lexicographic order.
+        """
+        sources = np.repeat(np.arange(len(self), dtype=self.indices.dtype), np.diff(self.indptr))
+        pairs = np.stack([np.minimum(sources, self.indices), np.maximum(sources, self.indices)], axis=1)
+        return np.unique(pairs, axis=0)
+
+    def to_networkx(self, cube_class: type = RubikCube, label: bool = True) -> nx.Graph:
+        """
+        Makes the graph that `graph.make_graph` would make: the nodes are cubes with an "id" and their "depth" (if it
+        is known), and the edges have a set of movements in "move". The movements of every pair of states are grouped
+        with the CSR arrays, so every edge is added once.
+
+        :param cube_class: The class of the nodes, RubikCube or CompactRubikCube.
+        :param label: To give the nodes the ids of `graph.make_graph` (see `node_ids`). Otherwise, the id of a node
+         is its id in this graph.
+        :return: The graph as a nx.Graph instance.
+        """
+        nodes = [self.cube(i) for i in range(len(self))]
+        if cube_class is not CompactRubikCube:
+            nodes = [rc.to_rubik_cube() for rc in nodes]
+        ids = node_ids(nodes) if label else np.arange(len(self))
+        g = nx.Graph()
+        if self.depth is None:
+            g.add_nodes_from((rc, {"id": i}) for rc, i in zip(nodes, ids.tolist()))
+        else:
+            g.add_nodes_from((rc, {"id": i, "depth": d}) for rc, i, d in zip(nodes, ids.tolist(), self.depth.tolist()))
+
+        # Sort the directed edges by their pair of states, and group the movements of every pair
+        sources = np.repeat(np.arange(len(self)), np.diff(self.indptr))
+        first, second = np.minimum(sources, self.indices), np.maximum(sources, self.indices)
+        order = np.lexsort((second, first))
+        first, second = first[order], second[order]
+        starts = np.flatnonzero(np.diff(first, prepend=-1) | np.diff(second, prepend=-1))
+        ends = np.append(starts[1:], len(first))
+        moves = [MOVES[m] for m in self.moves[order].tolist()]
+        g.add_edges_from((nodes[u], nodes[v], {"move": set(moves[start:end])}) for u, v, start, end in
+                         zip(first[starts].tolist(), second[starts].tolist(), starts.tolist(), ends.tolist()))
+        return g
+
+
+def node_ids(cubes: list[RubikCube] | list[CompactRubikCube]) -> np.ndarray:
+    """
+    Computes the ids that `graph.make_graph` gives to some cubes: their positions in the order of the hashes of their
+    faces. The hashes of the faces do not depend on the process (unlike the hash of a CompactRubikCube), and they are
+    the same for a RubikCube and a CompactRubikCube, so both graphs have the same ids.
+
+    :param cubes: A list of different cubes.
+    :return: An array with the id of every cube.
+    """
+    hashes = np.array([hash(rc.faces) for rc in cubes], dtype=np.int64)
+    ids = np.empty(len(cubes), dtype=np.int64)
+    ids[np.argsort(hashes, kind="stable")] = np.arange(len(cubes))
+    return ids
+
+
+def explore(dims: tuple[int, int, int], permitted_movements: set[CubeMove] = None) -> StateGraph:
+    """
+    Enumerates every state reachable from the solved Rubik's Cube of dimensions `dims` with the permitted movements,
+    processing the states layer by layer as arrays (a level-synchronous breadth-first search). The solved cube has
+    id 0, and the states of every layer are numbered after the previous layers, in the order of their keys. The
+    layer of every state is its distance to the solved cube and it is saved in `depth`.
+
+    :param dims: A tuple with the dimensions of a Rubik's Cube
+    :param permitted_movements: A set of permitted movements
+    :return: The state space as a StateGraph
+    """
+    table = get_move_table(dims, permitted_movements)
+    start = CompactRubikCube.from_dims(dims, permitted_movements).stickers
+    n_moves, n_stickers = len(table), len(start)
+
+    visited = VisitedStates(n_stickers)
+    frontier = visited.add(start[None, :])[1]
+    states_layers: list[np.ndarray] = [frontier]
+    indices_layers: list[np.ndarray] = []
+    while len(frontier):
+        if len(states_layers) > np.iinfo(np.uint8).max + 1:
+            raise OverflowError("The depth of the states does not fit in an uint8.")
+        # Every movement applied to every state of the frontier
+        ids, frontier = visited.add(frontier[:, table.permutations].reshape(-1, n_stickers))
+        indices_layers.append(ids)
+        states_layers.append(frontier)
+    n_states = len(visited)
+
+    return StateGraph(
+        dims, table.moves,
+        states=np.concatenate(states_layers),
+        indptr=np.arange(0, n_states * n_moves + 1, n_moves, dtype=np.int32),
+        indices=np.concatenate(indices_layers).astype(np.int32),
+        moves=np.tile(np.array([m.code for m in table.moves], dtype=np.uint8), n_states),
+        depth=np.repeat(np.arange(len(states_layers)), [len(layer) for layer in states_layers]).astype(np.uint8),
+    )
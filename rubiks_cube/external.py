@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from rubiks_cube.compact import CompactRubikCube
+from rubiks_cube.explorer import StateGraph
+from rubiks_cube.movements import CubeMove
+from rubiks_cube.packing import WORD, n_words, pack, packed_keys, unpack
+from rubiks_cube.tables import get_move_table
+
+
+def _open_rows(path: str, n_columns: int, dtype=np.uint8) -> np.ndarray:
+    """Function that opens a raw binary file of rows as a read-only memory-mapped array."""
+    n_rows = os.path.getsize(path) // (n_columns * np.dtype(dtype).itemsize)
+    if n_rows == 0:
+        return np.empty((0, n_columns), dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", shape=(n_rows, n_columns))
+
+
+def _create_array(path: str, shape: tuple[int, ...], dtype) -> np.ndarray:
+    """Function that creates a memory-mapped array (that can be empty) in the file `path`."""
+    if np.prod(shape) == 0:
+        open(path, "wb").close()
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="w+", shape=shape)
+
+
+def _merge_unique(a: np.ndarray, b: np.ndarray, path: str, block: int) -> None:
+    """
+    Function that merges two arrays of packed states sorted by their keys (e.g. two run files) into the file `path`,
+    removing the repeated states. Only `block` rows of every array are loaded at the same time.
+    """
+    a_keys, b_keys = packed_keys(a), packed_keys(b)
+    i = j = 0
+    with open(path, "wb") as f:
+        while i < len(a) or j < len(b):
+            a_block, b_block = a_keys[i:i + block], b_keys[j:j + block]
+            # Every key up to the smallest last key of the blocks can be written
+            if not len(a_block) or (len(b_block) and b_block[-1].tobytes() < a_block[-1].tobytes()):
+                limit = b_block[-1]
+            else:
+                limit = a_block[-1]
+            n_a = int(np.searchsorted(a_block, limit, side="right"))
+            n_b = int(np.searchsorted(b_block, limit, side="right"))
+            # The keys are the bytes of the rows (np.concatenate may change the byte order of the words)
+            keys = packed_keys(np.concatenate([a[i:i + n_a], b[j:j + n_b]]))
+            _, first = np.unique(keys, return_index=True)
+            f.write(keys[first].tobytes())
+            i, j = i + n_a, j + n_b
+
+
+def _find_ids(keys: np.ndarray, layers_keys: list[np.ndarray], offsets: np.ndarray) -> np.ndarray:
+    """Function that finds the id of every key, searching it in every (sorted) layer."""
+    ids = np.full(len(keys), -1, dtype=np.int64)
+    for layer_keys, offset in zip(layers_keys, offsets):
+        missing = np.flatnonzero(ids < 0)
+        if not len(missing) or not len(layer_keys):
+            continue
+        positions = np.minimum(np.searchsorted(layer_keys, keys[missing]), len(layer_keys) - 1)
+        found = layer_keys[positions] == keys[missing]
+        ids[missing[found]] = offset + positions[found]
+    return ids
+
+
+def external_explore(dims: tuple[int, int, int], permitted_movements: set[CubeMove] = None,
+                     directory: str = None, memory_budget: int = 2 ** 28) -> StateGraph:
+    """
+    Enumerates every state reachable from the solved Rubik's Cube keeping the states on disk, for state spaces
+    larger than the memory. Every layer of the breadth-first search is expanded by chunks into sorted run files,
+    which are merged and deduplicated against the (memory-mapped) visited states. The files of the search keep the
+    states packed with 3 bits per sticker (see `packing.pack`).
+
+    The result is the same as `explorer.explore`, but its arrays are memory-mapped files of `directory`.
+
+    :param dims: A tuple with the dimensions of a Rubik's Cube
+    :param permitted_movements: A set of permitted movements
+    :param directory: The directory where the files are saved. By default, a new temporary directory.
+    :param memory_budget: Approximate number of bytes used by the arrays loaded in memory.
+    :return: The state space as a StateGraph
+    """
+    table = get_move_table(dims, permitted_movements)
+    start = CompactRubikCube.from_dims(dims, permitted_movements).stickers
+    n_moves, n_stickers = len(table), len(start)
+    n_columns = n_words(n_stickers)
+    directory = directory or tempfile.mkdtemp(prefix="rubiks-cube-")
+    os.makedirs(directory, exist_ok=True)
+    work = tempfile.mkdtemp(prefix="bfs-", dir=directory)
+
+    # Number of states expanded at the same time, and number of rows merged at the same time
+    chunk = max(1, memory_budget // (4 * n_stickers * n_moves))
+    block = max(1, memory_budget // (4 * n_stickers))
+
+    try:
+        # Breadth-first search: every layer is a file of states sorted by their keys
+        layer_paths = [os.path.join(work, "layer-0.bin")]
+        pack(start[None, :]).tofile(layer_paths[0])
+        visited_path = os.path.join(work, "visited-0.bin")
+        shutil.copyfile(layer_paths[0], visited_path)
+        while True:
+            depth = len(layer_paths) - 1
+            layer = _open_rows(layer_paths[depth], n_columns, WORD)
+            if not len(layer):
+                break
+            if depth + 1 > np.iinfo(np.uint8).max:
+                raise OverflowError("The depth of the states does not fit in an uint8.")
+            visited_keys = packed_keys(_open_rows(visited_path, n_columns, WORD))
+
+            # Expand the layer by chunks into sorted run files without visited states
+            runs: list[str] = []
+            for c in range(0, len(layer), chunk):
+                children = pack(unpack(layer[c:c + chunk], n_stickers)[:, table.permutations].reshape(-1, n_stickers))
+                keys, first = np.unique(packed_keys(children), return_index=True)
+                positions = np.searchsorted(visited_keys, keys)
+                found = positions < len(visited_keys)
+                found[found] = visited_keys[positions[found]] == keys[found]
+                runs.append(os.path.join(work, f"run-{depth + 1}-{len(runs)}.bin"))
+                children[first[~found]].tofile(runs[-1])
+
+            # Merge the runs into the next layer
+            while len(runs) > 1:
+                merged = os.path.join(work, f"run-{depth + 1}-{len(runs)}-merged.bin")
+                _merge_unique(_open_rows(runs[0], n_columns, WORD), _open_rows(runs[1], n_columns, WORD), merged, block)
+                for run in runs[:2]:
+                    os.remove(run)
+                runs = runs[2:] + [merged]
+            layer_paths.append(os.path.join(work, f"layer-{depth + 1}.bin"))
+            os.replace(runs[0], layer_paths[-1])
+
+            # Add the next layer to the visited states
+            new_visited_path = os.path.join(work, f"visited-{depth + 1}.bin")
+            _merge_unique(_open_rows(visited_path, n_columns, WORD), _open_rows(layer_paths[-1], n_columns, WORD),
+                          new_visited_path, block)
+            os.remove(visited_path)
+            visited_path = new_visited_path
+        os.remove(visited_path)
+        layer_paths.pop()
+
+        # The states are numbered layer by layer, and by their keys in every layer
+        layers = [_open_rows(path, n_columns, WORD) for path in layer_paths]
+        layers_keys = [packed_keys(layer) for layer in layers]
+        offsets = np.concatenate([[0], np.cumsum([len(layer) for layer in layers])])
+        n_states = int(offsets[-1])
+
+        states = _create_array(os.path.join(directory, "states.bin"), (n_states, n_stickers), np.uint8)
+        depth = _create_array(os.path.join(directory, "depth.bin"), (n_states,), np.uint8)
+        indptr = _create_array(os.path.join(directory, "indptr.bin"), (n_states + 1,), np.int32)
+        indices = _create_array(os.path.join(directory, "indices.bin"), (n_states * n_moves,), np.int32)
+        moves = _create_array(os.path.join(directory, "moves.bin"), (n_states * n_moves,), np.uint8)
+        codes = np.array([m.code for m in table.moves], dtype=np.uint8)
+        indptr[-1] = n_states * n_moves
+        for d, layer in enumerate(layers):
+            for c in range(0, len(layer), chunk):
+                rows = unpack(layer[c:c + chunk], n_stickers)
+                first, last = offsets[d] + c, offsets[d] + c + len(rows)
+                states[first:last] = rows
+                depth[first:last] = d
+                indptr[first:last] = np.arange(first, last) * n_moves
+                children = rows[:, table.permutations].reshape(-1, n_stickers)
+                indices[first * n_moves:last * n_moves] = _find_ids(packed_keys(pack(children)), layers_keys, offsets)
+                moves[first * n_moves:last * n_moves] = np.tile(codes, len(rows))
+        for array in [states, depth, indptr, indices, moves]:
+            if isinstance(array, np.memmap):
+                array.flush()
+        del layers, layers_keys
+    finally:
+        # The work files are removed even if the search fails
+        shutil.rmtree(work, ignore_errors=True)
+
+    return StateGraph(dims, table.moves, states=states, indptr=indptr, indices=indices, moves=moves, depth=depth)
@@ -39,7 +39,8 @@ def _rotate_pieces(list_of_pieces, times) -> list[list[Color]]:
 
 
 def _as_tuple(arr: np.ndarray) -> tuple[tuple, ...]:
-    return tuple([tuple(row) for row in arr])
+    # `tolist` makes the rows in C, which is much faster than iterating over the rows of an array of objects
+    return tuple(map(tuple, arr.tolist()))
 
 
 class Face:
@@ -1,56 +1,105 @@
-from typing import Iterable
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING
 
 import networkx as nx
+import numpy as np
 
 from rubiks_cube.cube import RubikCube
+from rubiks_cube.explorer import StateGraph, node_ids
 from rubiks_cube.movements import CubeMove
 
+if TYPE_CHECKING:
+    from rubiks_cube.cache import GraphCache
+
+
+def _label_nodes(g: nx.Graph) -> None:
+    """Function that gives an "id" to every node of a graph (see `explorer.node_ids`)."""
+    nodes = list(g.nodes)
+    for rc, i in zip(nodes, node_ids(nodes).tolist()):
+        g.nodes[rc]["id"] = i
+
 
-def make_graph(dims: tuple[int, int, int], permitted_movements: set[CubeMove] = None) -> nx.Graph:
+def make_graph(dims: tuple[int, int, int], permitted_movements: set[CubeMove] = None,
+               cube_class: type = RubikCube, cache: GraphCache = None) -> nx.Graph:
     """
     Creates a graph using a Rubik's Cube with dimensions `dims` and permitted movements `permitted_movements`, using
     the Rubik's Cubes as nodes. Two Rubik's Cubes are connected if you can draw it with one movement.
+    Every node has its distance to the solved cube in the attribute "depth".
 
     :param dims: A tuple with the dimensions of a Rubik's Cube
     :param permitted_movements: A set of permitted movements
+    :param cube_class: The class used to represent the cubes, e.g. RubikCube or CompactRubikCube.
+    :param cache: A GraphCache. If it is given, the states are explored once and saved in the cache, and the graph
+     is made from the saved states.
     :return: A graph as described
     """
+    if cache is not None:
+        return cache.state_graph(dims, permitted_movements).to_networkx(cube_class)
+
     # Principal Rubik's Cube
-    rc = RubikCube.from_dims(dims, permitted_movements)
+    rc = cube_class.from_dims(dims, permitted_movements)
     # Queue to make a BFS
-    queue = [rc]
+    queue = deque([rc])
     # The graph
     g = nx.Graph()
-    g.add_node(rc)
+    g.add_node(rc, depth=0)
     while queue:  # While d is not empty
-        current_rc = queue.pop()  # Actualize the current cube
+        current_rc = queue.popleft()  # Actualize the current cube
+        depth = g.nodes[current_rc]["depth"]
         # Make every permitted movement and add the new cube to the graph
         for m in permitted_movements:
             other_rc = current_rc.make_movements(m)
             if other_rc not in g.nodes:
                 queue.append(other_rc)  # Add to the queue
-                g.add_node(other_rc)  # Add to the graph
+                g.add_node(other_rc, depth=depth + 1)  # Add to the graph
             if other_rc not in g[current_rc]:
                 g.add_edge(current_rc, other_rc, move=set())
             g[current_rc][other_rc]["move"].add(m)
 
-    def order_list_of_rc(iterable: Iterable[RubikCube]) -> list[RubikCube]:
-        ordered_iterable: list[RubikCube] = list(iterable)
-        ordered_iterable.sort(key=lambda x: hash(x))
-        return ordered_iterable
-
-    for i, rc in enumerate(order_list_of_rc(g.nodes)):
-        g.nodes[rc]["id"] = i
+    _label_nodes(g)
     return g
 
 
-def find_bipartite(g: nx.Graph) -> tuple[set[RubikCube], set[RubikCube]]:
+def _find_bipartite_of_state_graph(g: StateGraph) -> tuple[set[int], set[int]]:
+    """Find a bipartite of a StateGraph with a breadth-first search over its undirected edges."""
+    edges = g.edge_list()
+    n = len(g)
+    # Undirected CSR adjacency
+    sources = np.concatenate([edges[:, 0], edges[:, 1]])
+    targets = np.concatenate([edges[:, 1], edges[:, 0]])
+    order = np.argsort(sources, kind="stable")
+    targets = targets[order]
+    indptr = np.concatenate([[0], np.cumsum(np.bincount(sources, minlength=n))])
+    # Label every node with the parity of its distance to the node 0
+    side = np.full(n, -1, dtype=np.int8)
+    side[0] = 0
+    frontier = np.array([0])
+    parity = 0
+    while len(frontier):
+        parity = 1 - parity
+        counts = indptr[frontier + 1] - indptr[frontier]
+        starts = np.repeat(indptr[frontier] - np.cumsum(counts) + counts, counts)
+        neighbours = np.unique(targets[starts + np.arange(counts.sum())])
+        frontier = neighbours[side[neighbours] < 0]
+        side[frontier] = parity
+    if (side[edges[:, 0]] == side[edges[:, 1]]).any() or (side < 0).any():
+        raise nx.NetworkXError("Graph is not bipartite.")
+    g.bipartite = side.astype(np.uint8)
+    return set(np.flatnonzero(side == 0).tolist()), set(np.flatnonzero(side == 1).tolist())
+
+
+def find_bipartite(g: nx.Graph | StateGraph) -> tuple[set[RubikCube], set[RubikCube]] | tuple[set[int], set[int]]:
     """
     Find a bipartite in the graph g and label it. Returns the sets of nodes that make the graph bipartite.
+    In the case of a StateGraph, the nodes are ids and the labels are saved in `g.bipartite`.
 
     :param g: A graph.
     :return: two sets of nodes that makes the partition.
     """
+    if isinstance(g, StateGraph):
+        return _find_bipartite_of_state_graph(g)
     U, V = nx.algorithms.bipartite.sets(g)
     for n in g.nodes:
         if n in U:
@@ -60,22 +109,28 @@ def find_bipartite(g: nx.Graph) -> tuple[set[RubikCube], set[RubikCube]]:
     return U, V
 
 
-def make_simple_graph(complex_graph: nx.Graph) -> dict[int, set[int]]:
+def make_simple_graph(complex_graph: nx.Graph | StateGraph) -> dict[int, set[int]]:
     """
-    Make a simple graph (a dict of sets) from a complex graph (the nx.Graph instance).
+    Make a simple graph (a dict of sets) from a complex graph (the nx.Graph or StateGraph instance).
     It can be seen as a dictionary of neighbours.
 
     :param complex_graph: A complex graph.
     :return: A simple graph as described.
     """
     simple_graph: dict[int, set[int]] = {}
+    if isinstance(complex_graph, StateGraph):
+        simple_graph = {n_id: set() for n_id in range(len(complex_graph))}
+        for u, v in complex_graph.edge_list().tolist():
+            simple_graph[u].add(v)
+            simple_graph[v].add(u)
+        return simple_graph
     for n in complex_graph.nodes:
         n_id: int = complex_graph.nodes[n]["id"]
         simple_graph[n_id] = {complex_graph.nodes[other]["id"] for other in complex_graph[n]}
     return simple_graph
 
 
-def generate_file(g: nx.Graph, path=None):
+def generate_file(g: nx.Graph | StateGraph, path=None):
     """
     Creates a file in the format "'number of nodes' 'number of edges'"
     and the different edges with its nodes.
@@ -86,6 +141,15 @@ def generate_file(g: nx.Graph, path=None):
     """
     path = path or "graph.txt"
 
+    if isinstance(g, StateGraph):
+        edges = g.edge_list()
+        with open(path, "w") as f:
+            # Write n and m
+            f.write(f"{len(g)} {len(edges)}\n")
+            # Write the edges
+            f.writelines(f"{u} {v}\n" for u, v in edges[edges[:, 0] < edges[:, 1]].tolist())
+        return
+
     simple_graph = make_simple_graph(g)
 
     def sort_list(other):
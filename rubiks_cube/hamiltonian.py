@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import time
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+import networkx as nx
+
+from rubiks_cube.cube import RubikCube
+from rubiks_cube.graph import find_bipartite, make_simple_graph
+from rubiks_cube.preprocessing import GraphPreprocessing
+from rubiks_cube.satisfiability import solve_incremental
+
+# Number of steps of the search between two checks of the time limit
+_CHECK_EVERY = 1024
+
+
+def _popcount(mask: int) -> int:
+    """Function that counts the vertices of a bitset."""
+    return bin(mask).count("1")
+
+
+def _vertices(mask: int) -> Iterator[int]:
+    """Function that iterates over the vertices of a bitset."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _search(adjacency: list[int], s: int, t: Optional[int], cycle: bool, deadline: Optional[float]
+            ) -> Optional[list[int]]:
+    """
+    Backtracking search of a Hamiltonian path from `s` (to `t` if it is given, or back to `s` if `cycle`), with the
+    neighbours of every vertex as a bitset. The next vertices are tried from the one with less unvisited neighbours
+    (Warnsdorff's rule), and a partial path is abandoned if the unvisited vertices are disconnected from its end or
+    if they do not have enough free neighbours to be crossed.
+    """
+    n = len(adjacency)
+    full = (1 << n) - 1
+    # Number of unvisited vertices that can end the path with a single free neighbour
+    free_ends = 0 if t is not None or cycle else 1
+
+    def candidates(u: int, visited: int, length: int) -> list[int]:
+        """The unvisited neighbours of u, the best one last."""
+        unvisited = full & ~visited
+        mask = adjacency[u] & unvisited
+        if t is not None and length < n - 1:
+            mask &= ~(1 << t)
+        return sorted(_vertices(mask), key=lambda v: (_popcount(adjacency[v] & unvisited), v), reverse=True)
+
+    def dead_end(u: int, visited: int) -> bool:
+        """Checks if the path that ends in u can not be completed."""
+        unvisited = full & ~visited
+        # Every unvisited vertex must be reachable from u through unvisited vertices
+        reached, frontier = 0, adjacency[u] & unvisited
+        while frontier:
+            reached |= frontier
+            following = 0
+            for v in _vertices(frontier):
+                following |= adjacency[v]
+            frontier = following & unvisited & ~reached
+        if reached != unvisited:
+            return True
+        # Every unvisited vertex needs two free neighbours (one if it ends the path)
+        free = unvisited | (1 << u) | ((1 << s) if cycle else 0)
+        ends = 0
+        for v in _vertices(unvisited):
+            degree = _popcount(adjacency[v] & free)
+            if degree == 0:
+                return True
+            if degree == 1 and v != t:
+                ends += 1
+                if ends > free_ends:
+                    return True
+        return False
+
+    path = [s]
+    visited = 1 << s
+    stack = [candidates(s, visited, 1)]
+    steps = 0
+    while stack:
+        steps += 1
+        if deadline is not None and steps % _CHECK_EVERY == 0 and time.perf_counter() > deadline:
+            raise TimeoutError("The search of the Hamiltonian path exceeded the time limit.")
+        if not stack[-1]:
+            stack.pop()
+            visited ^= 1 << path.pop()
+            continue
+        v = stack[-1].pop()
+        path.append(v)
+        visited |= 1 << v
+        if len(path) == n:
+            if not cycle or adjacency[v] >> s & 1:
+                return path
+        elif not dead_end(v, visited):
+            stack.append(candidates(v, visited, len(path)))
+            continue
+        visited ^= 1 << path.pop()
+    return None
+
+
+def _bitsets(neighbours: dict[int, set[int]]) -> list[int]:
+    """Function that translates the neighbours of every vertex into bitsets."""
+    adjacency = [0] * len(neighbours)
+    for u, vs in neighbours.items():
+        for v in vs:
+            if v != u:
+                adjacency[u] |= 1 << v
+    return adjacency
+
+
+def hamiltonian_path(neighbours: dict[int, set[int]], s: int, t: int = None,
+                     time_limit: float = None) -> Optional[list[int]]:
+    """
+    Finds a Hamiltonian path of a simple graph (as the one of `make_simple_graph`) with a backtracking search.
+
+    :param neighbours: The neighbours of every vertex, with the vertices as integers from 0 to n - 1.
+    :param s: The start vertex.
+    :param t: The final vertex. By default, the path can end in any vertex.
+    :param time_limit: The largest time (in seconds) of the search. A TimeoutError is raised if it is exceeded.
+    :return: The vertices of the path, or None if there is no Hamiltonian path.
+    """
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    if len(neighbours) == 1:
+        return [s] if t is None or t == s else None
+    if s == t:
+        return None
+    return _search(_bitsets(neighbours), s, t, False, deadline)
+
+
+def hamiltonian_cycle(neighbours: dict[int, set[int]], time_limit: float = None) -> Optional[list[int]]:
+    """
+    Finds a Hamiltonian cycle of a simple graph (as the one of `make_simple_graph`) with a backtracking search.
+
+    :param neighbours: The neighbours of every vertex, with the vertices as integers from 0 to n - 1.
+    :param time_limit: The largest time (in seconds) of the search. A TimeoutError is raised if it is exceeded.
+    :return: The vertices of the cycle starting from 0 (without repeating it at the end), or None if there is none.
+    """
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    if len(neighbours) < 3:
+        return None
+    return _search(_bitsets(neighbours), 0, None, True, deadline)
+
+
+class HamiltonianResult(NamedTuple):
+    """
+    The result of the search of a Hamiltonian path from a start node. The status is "found", "impossible" or
+    "timeout", and the path is None unless it is found.
+    """
+    source: RubikCube
+    path: Optional[list[RubikCube]]
+    status: str
+    seconds: float
+
+
+def find_hamiltonian_paths(graph: nx.Graph, t: RubikCube, sources: Iterable[RubikCube] = None,
+                           time_limit: float = None) -> Iterator[HamiltonianResult]:
+    """
+    Searches the Hamiltonian paths of the graph that end in `t` for every start node, as `solve_incremental` does
+    with a SAT Solver. The graph of every start node is reduced with a GraphPreprocessing before the search.
+
+    :param graph: A graph of `make_graph`.
+    :param t: The final node as a RubikCube instance
+    :param sources: The start nodes. By default, the nodes of the class of the bipartition that does not contain t.
+    :param time_limit: The largest time (in seconds) of the search of every start node.
+    :return: An iterator of HamiltonianResult.
+    """
+    neighbours = make_simple_graph(graph)
+    id_to_rc = {graph.nodes[node]["id"]: node for node in graph.nodes}
+    t_ = graph.nodes[t]["id"]
+    preprocessing = GraphPreprocessing(neighbours, t_)
+    if sources is None:
+        U, V = find_bipartite(graph)
+        sources = V if t in U else U
+
+    for s in sources:
+        start = time.perf_counter()
+        pruned = preprocessing.prune(graph.nodes[s]["id"])
+        try:
+            path = None if pruned is None else hamiltonian_path(pruned, graph.nodes[s]["id"], t_, time_limit)
+            status = "impossible" if path is None else "found"
+        except TimeoutError:
+            path, status = None, "timeout"
+        seconds = time.perf_counter() - start
+        yield HamiltonianResult(s, None if path is None else [id_to_rc[u] for u in path], status, seconds)
+
+
+class EngineBenchmark(NamedTuple):
+    """The time taken by an engine to search the Hamiltonian paths of every start node."""
+    engine: str
+    n_paths: int
+    seconds: float
+
+
+def benchmark_engines(graph: nx.Graph, t: RubikCube, sources: Iterable[RubikCube] = None,
+                      solver_name="cd") -> list[EngineBenchmark]:
+    """
+    Compares the backtracking search with the (incremental) SAT Solver on the same queries, to choose the faster
+    engine for a graph.
+
+    :param graph: A graph of `make_graph`.
+    :param t: The final node as a RubikCube instance
+    :param sources: The start nodes. By default, the nodes of the class of the bipartition that does not contain t.
+    :param solver_name: The name of the SAT Solver.
+    :return: A list with the results of every engine.
+    """
+    sources = None if sources is None else list(sources)
+    results = []
+    start = time.perf_counter()
+    n_paths = sum(r.status == "found" for r in find_hamiltonian_paths(graph, t, sources))
+    results.append(EngineBenchmark("backtracking", n_paths, time.perf_counter() - start))
+    start = time.perf_counter()
+    n_paths = sum(model is not None for _, model in solve_incremental(graph, t, sources, solver_name))
+    results.append(EngineBenchmark("sat", n_paths, time.perf_counter() - start))
+    return results
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import abc
 from enum import Enum
-from typing import Optional
+from typing import Iterable, Optional
+
+import numpy as np
 
 from rubiks_cube.faces import Face
 
@@ -211,7 +213,74 @@ class CubeMove(Enum):
         """To use double dispatch over RubikCube."""
         self.value().move_the_cube(cube)
 
+    @property
+    def code(self) -> int:
+        """Integer code of the move: its position in the enumerator."""
+        return _MOVE_CODES[self]
+
+    @classmethod
+    def from_code(cls, code: int) -> CubeMove:
+        """Returns the move identified by the integer `code`."""
+        return MOVES[code]
+
     @classmethod
     def parse_move(cls, move_as_str: str) -> Optional[CubeMove]:
         """Returns a CubeMove given a string that represents it."""
-        return {m.name: getattr(cls, m.name) for m in cls}.get(move_as_str, None)
+        return _MOVES_BY_NAME.get(move_as_str, None)
+
+
+# Moves ordered by their integer code.
+MOVES: tuple[CubeMove, ...] = tuple(CubeMove)
+
+# Interned tables to look up the moves.
+_MOVES_BY_NAME: dict[str, CubeMove] = {m.name: m for m in MOVES}
+_MOVE_CODES: dict[CubeMove, int] = {m: i for i, m in enumerate(MOVES)}
+
+# Tables that map the bytes of a move into its face (the code divided by 3) and its suffix (the code modulo 3).
+_INVALID = 255
+_FACE_TABLE: np.ndarray = np.full(256, _INVALID, dtype=np.uint8)
+_SUFFIX_TABLE: np.ndarray = np.full(256, _INVALID, dtype=np.uint8)
+for _i, _face in enumerate(b"FBUDLR"):
+    _FACE_TABLE[_face] = _i
+for _i, _suffix in enumerate(b"\0p2"):
+    _SUFFIX_TABLE[_suffix] = _i
+
+
+def _parse_tokens(tokens: list[str]) -> np.ndarray:
+    """Function that maps a list of tokens into their move codes, using only array operations."""
+    try:
+        as_bytes = np.array(tokens, dtype="S3").view(np.uint8).reshape(-1, 3)
+    except UnicodeEncodeError:
+        raise ValueError("The moves must be ASCII strings.") from None
+    faces = _FACE_TABLE[as_bytes[:, 0]]
+    suffixes = _SUFFIX_TABLE[as_bytes[:, 1]]
+    invalid = (faces == _INVALID) | (suffixes == _INVALID) | (as_bytes[:, 2] != 0)
+    if invalid.any():
+        raise ValueError(f"Invalid move: '{tokens[int(np.argmax(invalid))]}'.")
+    return faces * 3 + suffixes
+
+
+def parse_moves(str_of_moves: str) -> np.ndarray:
+    """
+    Parses a string of moves separated by spaces into an array of move codes, in one pass.
+
+    :param str_of_moves: A string like "R2 U Fp".
+    :return: A uint8 array with the code of every move.
+    """
+    return _parse_tokens(str_of_moves.split())
+
+
+def parse_algorithms(lines: Iterable[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Parses several strings of moves (e.g. the lines of a scramble file) at once.
+
+    :param lines: An iterable of strings of moves separated by spaces.
+    :return: A uint8 array with the codes of every move, and an array of offsets such that the moves of the i-th
+     string are `codes[offsets[i]:offsets[i + 1]]`.
+    """
+    tokens: list[str] = []
+    offsets: list[int] = [0]
+    for line in lines:
+        tokens.extend(line.split())
+        offsets.append(len(tokens))
+    return _parse_tokens(tokens), np.array(offsets, dtype=np.int64)
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+
+from rubiks_cube.compact import CompactRubikCube, to_compact
+from rubiks_cube.cube import RubikCube
+from rubiks_cube.movements import CubeMove
+from rubiks_cube.utils import sticker_count
+
+# Bits of every sticker: the 6 color codes (and the wildcard of the pattern databases) fit in 3 bits.
+BITS: int = 3
+
+# Stickers packed in every 64-bit word
+STICKERS_PER_WORD: int = 64 // BITS
+
+# Words of the packed states. They are big-endian, so comparing the bytes of two rows compares their stickers in
+# order, and the packed states are sorted as the unpacked ones.
+WORD: np.dtype = np.dtype(">u8")
+
+# Bits of a sticker in a word
+_MASK = np.uint64((1 << BITS) - 1)
+
+
+def _shift(k: int) -> tuple[int, np.uint64]:
+    """Function that returns the word of the sticker `k` and its shift (the first sticker goes to the highest bits)."""
+    word, position = divmod(k, STICKERS_PER_WORD)
+    return word, np.uint64(BITS * (STICKERS_PER_WORD - 1 - position))
+
+
+def n_words(n_stickers: int) -> int:
+    """Returns the number of words of a packed state with `n_stickers` stickers."""
+    return -(-n_stickers // STICKERS_PER_WORD)
+
+
+def pack(states: np.ndarray) -> np.ndarray:
+    """
+    Packs several states with 3 bits per sticker, 21 stickers per 64-bit word. Two states are equal if and only if
+    their packed rows are equal, and the packed rows are in the same order as the states.
+
+    :param states: An (N, stickers) array of color codes (smaller than 8).
+    :return: An (N, words) array of big-endian words.
+    """
+    states = np.asarray(states, dtype=np.uint8)
+    n_states, n_stickers = states.shape
+    # The stickers are added one by one, so there is no (N, stickers) array of words
+    words = np.zeros((n_states, n_words(n_stickers)), dtype=np.uint64)
+    for k in range(n_stickers):
+        word, shift = _shift(k)
+        words[:, word] |= states[:, k].astype(np.uint64) << shift
+    return words.astype(WORD)
+
+
+def unpack(packed: np.ndarray, n_stickers: int) -> np.ndarray:
+    """
+    Unpacks the states packed with `pack`.
+
+    :param packed: An (N, words) array of packed states.
+    :param n_stickers: The number of stickers of the states.
+    :return: An (N, stickers) array of color codes.
+    """
+    words = np.asarray(packed).astype(np.uint64)
+    states = np.empty((len(words), n_stickers), dtype=np.uint8)
+    for k in range(n_stickers):
+        word, shift = _shift(k)
+        states[:, k] = (words[:, word] >> shift) & _MASK
+    return states
+
+
+def packed_keys(packed: np.ndarray) -> np.ndarray:
+    """
+    Returns the keys of several packed states, as a NumPy array of fixed-size bytes (one per row of `packed`), as
+    `ranking.state_keys` does with the unpacked states. The keys are sorted in the same order.
+
+    :param packed: An (N, words) array of packed states.
+    :return: An array with N keys.
+    """
+    packed = np.ascontiguousarray(packed, dtype=WORD)
+    return packed.view(np.dtype((np.void, packed.shape[1] * WORD.itemsize))).reshape(len(packed))
+
+
+def hash_packed(packed: np.ndarray) -> np.ndarray:
+    """
+    Returns a 64-bit hash of several packed states, mixing their words (with the finalizer of SplitMix64). Unlike
+    `hash`, it does not depend on the process, so it can be used to split the states between processes or files.
+
+    :param packed: An (N, words) array of packed states.
+    :return: An uint64 array with N hashes.
+    """
+    words = np.asarray(packed).astype(np.uint64)
+    h = np.zeros(len(words), dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for j in range(words.shape[1]):
+            h = (h ^ words[:, j]) * np.uint64(0x9E3779B97F4A7C15)
+            h ^= h >> np.uint64(30)
+            h *= np.uint64(0xBF58476D1CE4E5B9)
+            h ^= h >> np.uint64(27)
+            h *= np.uint64(0x94D049BB133111EB)
+            h ^= h >> np.uint64(31)
+    return h
+
+
+def pack_cubes(cubes: Iterable[RubikCube | CompactRubikCube]) -> np.ndarray:
+    """
+    Packs several cubes of the same dimensions.
+
+    :param cubes: An iterable of Rubik's Cubes.
+    :return: An (N, words) array of packed states.
+    """
+    stickers = [to_compact(cube).stickers for cube in cubes]
+    if not stickers:
+        return np.empty((0, 0), dtype=WORD)
+    return pack(np.stack(stickers))
+
+
+def unpack_cubes(packed: np.ndarray, dims: tuple[int, int, int], permitted_movements: set[CubeMove] = None,
+                 cube_class: type = RubikCube) -> list[RubikCube] | list[CompactRubikCube]:
+    """
+    Unpacks several cubes packed with `pack_cubes`.
+
+    :param packed: An (N, words) array of packed states.
+    :param dims: The dimensions of the cubes.
+    :param permitted_movements: A set of permitted movements
+    :param cube_class: The class of the cubes, RubikCube or CompactRubikCube.
+    :return: A list with the N cubes.
+    """
+    cubes = [CompactRubikCube(row, dims, permitted_movements) for row in unpack(packed, sticker_count(dims))]
+    if cube_class is CompactRubikCube:
+        return cubes
+    return [cube.to_rubik_cube() for cube in cubes]
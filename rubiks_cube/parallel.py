@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+from multiprocessing.connection import Connection, wait
+
+import numpy as np
+
+from rubiks_cube.compact import CompactRubikCube
+from rubiks_cube.explorer import StateGraph, VisitedStates
+from rubiks_cube.movements import CubeMove
+from rubiks_cube.packing import hash_packed, pack
+from rubiks_cube.ranking import state_keys
+from rubiks_cube.tables import get_move_table
+from rubiks_cube.utils import sticker_count
+
+
+def _owners(states: np.ndarray, n_owners: int) -> np.ndarray:
+    """
+    Function that computes the process that owns every state (row of `states`). The hash of the packed states does
+    not depend on the process (unlike the built-in `hash` of bytes), so every process computes the same owners.
+    """
+    return (hash_packed(pack(states)) % np.uint64(n_owners)).astype(np.intp)
+
+
+def _exchange(w: int, inboxes: list[mp.Queue], tag: str, parts: list[np.ndarray],
+              pending: list[tuple[str, int, np.ndarray]]) -> list[np.ndarray]:
+    """
+    Function that sends a part to every process (through their inboxes) and receives the part of every process,
+    ordered by the sender. The messages with another tag are kept in `pending` until they are received.
+    """
+    for owner, part in enumerate(parts):
+        inboxes[owner].put((tag, w, part))
+    received: list[np.ndarray | None] = [None] * len(inboxes)
+    n_received = 0
+    for message in [m for m in pending if m[0] == tag]:
+        pending.remove(message)
+        received[message[1]] = message[2]
+        n_received += 1
+    while n_received < len(inboxes):
+        message = inboxes[w].get()
+        if message[0] != tag:
+            pending.append(message)
+            continue
+        received[message[1]] = message[2]
+        n_received += 1
+    return received
+
+
+def _worker(w: int, connection: Connection, inboxes: list[mp.Queue], dims: tuple[int, int, int],
+            permitted_movements: frozenset[CubeMove]):
+    """
+    Loop of a process of the enumeration. The process owns a partition of the states: it keeps its visited states
+    and the edges that leave them. In every layer, it sends the children of its frontier to their owners, adds the
+    children sent to it (its new frontier) and sends back their local ids.
+    """
+    table = get_move_table(dims, permitted_movements)
+    n_moves, n_stickers = len(table), sticker_count(dims)
+    n_owners = len(inboxes)
+
+    visited = VisitedStates(n_stickers)
+    start = CompactRubikCube.from_dims(dims, permitted_movements).stickers[None, :]
+    frontier = visited.add(start[_owners(start, n_owners) == w])[1]
+    states_layers: list[np.ndarray] = [frontier]
+    depth_layers: list[np.ndarray] = [np.zeros(len(frontier), dtype=np.uint8)]
+    # Owner and local id of the target of every movement applied to every state
+    targets_layers: list[tuple[np.ndarray, np.ndarray]] = []
+    pending: list[tuple[str, int, np.ndarray]] = []
+    while True:
+        command, depth = connection.recv()
+        if command == "expand":
+            # Every movement applied to every state of the frontier, sent to their owners
+            children = frontier[:, table.permutations].reshape(-1, n_stickers)
+            owners = _owners(children, n_owners)
+            received = _exchange(w, inboxes, "children", [children[owners == o] for o in range(n_owners)],
+                                 pending)
+
+            # Add the children sent to this process, and send back their local ids
+            ids, frontier = visited.add(np.concatenate(received))
+            splits = np.cumsum([len(r) for r in received])[:-1]
+            received_ids = _exchange(w, inboxes, "ids", np.split(ids, splits), pending)
+
+            targets_local = np.empty(len(children), dtype=np.int64)
+            for o, owner_ids in enumerate(received_ids):
+                targets_local[owners == o] = owner_ids
+            targets_layers.append((owners.reshape(-1, n_moves), targets_local.reshape(-1, n_moves)))
+            states_layers.append(frontier)
+            depth_layers.append(np.full(len(frontier), depth, dtype=np.uint8))
+            connection.send(len(frontier))
+        elif command == "collect":
+            connection.send((np.concatenate(states_layers), np.concatenate(depth_layers),
+                             np.concatenate([o for o, _ in targets_layers]),
+                             np.concatenate([t for _, t in targets_layers])))
+        else:
+            break
+    connection.close()
+
+
+def _receive(connections: list[Connection], workers: list[mp.Process]) -> list:
+    """Function that receives a message from every process, raising an error if one of them stops before."""
+    replies = [None] * len(connections)
+    waiting = {connection: i for i, connection in enumerate(connections)}
+    sentinels = {worker.sentinel for worker in workers}
+    while waiting:
+        ready = wait(list(waiting) + list(sentinels))
+        try:
+            for connection in [c for c in ready if c in waiting]:
+                replies[waiting.pop(connection)] = connection.recv()
+        except EOFError:
+            # The connection was closed by a process that stopped
+            raise RuntimeError("A process of the enumeration stopped unexpectedly.") from None
+        if waiting and any(r in sentinels for r in ready):
+            raise RuntimeError("A process of the enumeration stopped unexpectedly.")
+    return replies
+
+
+def parallel_explore(dims: tuple[int, int, int], permitted_movements: set[CubeMove] = None,
+                     processes: int = None) -> StateGraph:
+    """
+    Enumerates every state reachable from the solved Rubik's Cube with a pool of processes. Every state is owned by
+    one process (chosen by a hash of the state), which deduplicates it locally and keeps the edges that leave it.
+    The processes send the children of every layer directly to their owners; the main process only synchronizes the
+    layers and merges the results.
+
+    The result is the same as `explorer.explore`, including the ids of the states.
+
+    :param dims: A tuple with the dimensions of a Rubik's Cube
+    :param permitted_movements: A set of permitted movements
+    :param processes: The number of processes. By default, the number of CPUs.
+    :return: The state space as a StateGraph
+    """
+    processes = processes or os.cpu_count() or 1
+    table = get_move_table(dims, permitted_movements)
+    n_moves = len(table)
+
+    # Start the processes, each one with an inbox for the states and ids sent by the others
+    context = mp.get_context()
+    inboxes = [context.Queue() for _ in range(processes)]
+    connections: list[Connection] = []
+    workers: list[mp.Process] = []
+    stopped = False
+    try:
+        for w in range(processes):
+            connection, worker_connection = context.Pipe()
+            worker = context.Process(target=_worker,
+                                     args=(w, worker_connection, inboxes, table.dims, frozenset(table.moves)))
+            worker.start()
+            worker_connection.close()
+            connections.append(connection)
+            workers.append(worker)
+
+        depth = 0
+        while True:
+            depth += 1
+            for connection in connections:
+                connection.send(("expand", min(depth, np.iinfo(np.uint8).max)))
+            if not sum(_receive(connections, workers)):
+                break
+            if depth > np.iinfo(np.uint8).max:
+                raise OverflowError("The depth of the states does not fit in an uint8.")
+
+        for connection in connections:
+            connection.send(("collect", None))
+        results = _receive(connections, workers)
+        for connection in connections:
+            connection.send(("stop", None))
+        stopped = True
+    finally:
+        # After an error, the processes may be blocked waiting for each other, so they are terminated
+        for worker in workers:
+            if not stopped:
+                worker.terminate()
+            worker.join()
+        for inbox in inboxes:
+            inbox.close()
+
+    # Merge the states of every process: provisional ids are the local ids shifted by the owner
+    offsets = np.concatenate([[0], np.cumsum([len(r[0]) for r in results])])
+    states = np.concatenate([r[0] for r in results])
+    depth = np.concatenate([r[1] for r in results])
+    n_states = len(states)
+    targets = np.concatenate([offsets[owners] + local for *_, owners, local in results]).reshape(n_states, n_moves)
+
+    # Number the states as `explore` does: layer by layer and in the order of their keys
+    order = np.argsort(state_keys(states), kind="stable")
+    order = order[np.argsort(depth[order], kind="stable")]
+    new_ids = np.empty(n_states, dtype=np.int64)
+    new_ids[order] = np.arange(n_states)
+
+    return StateGraph(
+        dims, table.moves,
+        states=states[order],
+        indptr=np.arange(0, n_states * n_moves + 1, n_moves, dtype=np.int32),
+        indices=new_ids[targets[order]].reshape(-1).astype(np.int32),
+        moves=np.tile(np.array([m.code for m in table.moves], dtype=np.uint8), n_states),
+        depth=depth[order],
+    )
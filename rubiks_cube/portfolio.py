@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+import time
+from collections import deque
+from multiprocessing.connection import Connection, wait
+from typing import Iterable, NamedTuple, Optional, Union
+
+from pysat.formula import CNF
+from pysat.solvers import Solver
+
+# Default solvers of the portfolio: CaDiCaL, Glucose 4 and MapleCM
+DEFAULT_SOLVERS: tuple[str, ...] = ("cd", "g4", "mcm")
+
+# A formula given as the path of a CNF file, a CNF instance or a list of clauses
+Formula = Union[str, CNF, list[list[int]]]
+
+
+class PortfolioResult(NamedTuple):
+    """
+    The result of a solver on a formula. The status is "sat", "unsat", "timeout", "cancelled" (another solver
+    answered first) or "error" (the solver crashed), and the number of conflicts is None if the solver did not
+    finish.
+    """
+    formula: str
+    solver: str
+    status: str
+    seconds: float
+    conflicts: Optional[int]
+
+
+def _solve(connection: Connection, formula: Formula, solver_name: str):
+    """Process of the portfolio: solves a formula and sends the status and the number of conflicts."""
+    if isinstance(formula, str):
+        formula = CNF(from_file=formula)
+    clauses = formula.clauses if isinstance(formula, CNF) else formula
+    with Solver(name=solver_name, bootstrap_with=clauses) as solver:
+        status = "sat" if solver.solve() else "unsat"
+        stats = solver.accum_stats() or {}
+    connection.send((status, stats.get("conflicts")))
+    connection.close()
+
+
+def run_portfolio(formulas: Union[str, dict[str, Formula]], solvers: Iterable[str] = DEFAULT_SOLVERS,
+                  processes: int = None, timeout: float = None) -> list[PortfolioResult]:
+    """
+    Runs a portfolio of SAT Solvers on several formulas, with a pool of processes. Every solver runs in its own
+    process, so it can be stopped: when a solver answers, the other solvers of the same formula are cancelled, and a
+    solver that runs for longer than `timeout` is stopped.
+
+    :param formulas: A directory with `.cnf` files (as the one of `generate_cnf_file`), or a dictionary from names to
+     formulas (paths of CNF files, CNF instances or lists of clauses).
+    :param solvers: The names of the pysat solvers of the portfolio.
+    :param processes: The number of processes. By default, the number of CPUs.
+    :param timeout: The largest time (in seconds) of every solver. By default, there is no limit.
+    :return: A list with the results of every pair of formula and solver, in the order of the formulas.
+    """
+    processes = processes or os.cpu_count() or 1
+    solvers = list(solvers)
+    if isinstance(formulas, str):
+        formulas = {name: os.path.join(formulas, name)
+                    for name in sorted(os.listdir(formulas)) if name.endswith(".cnf")}
+
+    context = mp.get_context()
+    pending = deque((name, solver_name) for name in formulas for solver_name in solvers)
+    running: dict[Connection, tuple[str, str, mp.Process, float]] = {}
+    results: dict[tuple[str, str], PortfolioResult] = {}
+    decided: set[str] = set()
+
+    def stop(connection: Connection, status: str):
+        """Stop a running solver with the given status."""
+        name, solver_name, process, start = running.pop(connection)
+        process.terminate()
+        process.join()
+        connection.close()
+        results[name, solver_name] = PortfolioResult(name, solver_name, status, time.perf_counter() - start, None)
+
+    try:
+        while pending or running:
+            # Start new solvers (skipping the formulas that are already decided)
+            while pending and len(running) < processes:
+                name, solver_name = pending.popleft()
+                if name in decided:
+                    results[name, solver_name] = PortfolioResult(name, solver_name, "cancelled", 0., None)
+                    continue
+                connection, process_connection = context.Pipe(duplex=False)
+                process = context.Process(target=_solve, args=(process_connection, formulas[name], solver_name))
+                process.start()
+                process_connection.close()
+                running[connection] = (name, solver_name, process, time.perf_counter())
+            if not running:
+                continue
+
+            # Wait until a solver answers or the first deadline
+            wait_time = None
+            if timeout is not None:
+                first_start = min(start for *_, start in running.values())
+                wait_time = max(0., first_start + timeout - time.perf_counter())
+            for connection in wait(list(running), wait_time):
+                if connection not in running:
+                    # Cancelled by another solver of the same formula
+                    continue
+                name, solver_name, process, start = running[connection]
+                try:
+                    status, conflicts = connection.recv()
+                except EOFError:
+                    # The process died without answering
+                    stop(connection, "error")
+                    continue
+                seconds = time.perf_counter() - start
+                running.pop(connection)
+                process.join()
+                connection.close()
+                results[name, solver_name] = PortfolioResult(name, solver_name, status, seconds, conflicts)
+                decided.add(name)
+                for other in [c for c, (other_name, *_) in running.items() if other_name == name]:
+                    stop(other, "cancelled")
+
+            # Stop the solvers that exceed the timeout
+            if timeout is not None:
+                now = time.perf_counter()
+                for connection in [c for c, (*_, start) in running.items() if now - start >= timeout]:
+                    stop(connection, "timeout")
+    finally:
+        for connection in list(running):
+            stop(connection, "cancelled")
+
+    return [results[name, solver_name] for name in formulas for solver_name in solvers]
+
+
+def format_table(results: list[PortfolioResult]) -> str:
+    """
+    Formats the results of a portfolio as a text table.
+
+    :param results: A list of PortfolioResult.
+    :return: The table as a string, with a row for every result.
+    """
+    header = ("formula", "solver", "status", "time", "conflicts")
+    rows = [(r.formula, r.solver, r.status, f"{r.seconds:.3f}", "-" if r.conflicts is None else str(r.conflicts))
+            for r in results]
+    widths = [max(len(row[j]) for row in [header] + rows) for j in range(len(header))]
+    return "\n".join("  ".join(cell.ljust(w) for cell, w in zip(row, widths)).rstrip() for row in [header] + rows)
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Optional
+
+
+def _two_coloring(neighbours: dict[int, set[int]]) -> Optional[list[int]]:
+    """Function that finds the class (0 or 1) of every vertex of a bipartite graph, or None if it is not bipartite."""
+    side = [-1] * len(neighbours)
+    for root in range(len(neighbours)):
+        if side[root] >= 0:
+            continue
+        side[root] = 0
+        queue = deque([root])
+        while queue:
+            u = queue.popleft()
+            for v in neighbours[u]:
+                if side[v] < 0:
+                    side[v] = 1 - side[u]
+                    queue.append(v)
+                elif side[v] == side[u]:
+                    return None
+    return side
+
+
+def _is_connected(neighbours: dict[int, set[int]]) -> bool:
+    """Function that checks if a graph is connected."""
+    if not neighbours:
+        return True
+    seen = {0}
+    queue = deque([0])
+    while queue:
+        for v in neighbours[queue.popleft()]:
+            if v not in seen:
+                seen.add(v)
+                queue.append(v)
+    return len(seen) == len(neighbours)
+
+
+class GraphPreprocessing:
+    """
+    Class that finds structure of a graph before the codification of the Hamiltonian paths that end in the node
+    `t`, to make a smaller formula and to reject the impossible start nodes without calling the SAT Solver.
+
+    If the graph is bipartite, a Hamiltonian path alternates between the classes, so the vertex `u` can only be at
+    the positions `i` with the parity given by the class of `u` and the class of `t`: half of the X_{u, i} variables
+    are removed. Vertices with as many neighbours as edges they need in the path force those edges, which removes
+    the other edges of their neighbours, until nothing changes.
+    """
+
+    def __init__(self, neighbours: dict[int, set[int]], t: int):
+        # Simple graph, with the nodes as integers from 0 to n - 1
+        self.neighbours: dict[int, set[int]] = neighbours
+        self.n: int = len(neighbours)
+
+        # Final node
+        self.t: int = t
+
+        # Class of every vertex (None if the graph is not bipartite)
+        self.side: Optional[list[int]] = _two_coloring(neighbours)
+
+        # Connectivity of the graph
+        self.connected: bool = _is_connected(neighbours)
+
+    def feasible(self, u: int, i: int) -> bool:
+        """Returns whether the vertex `u` can be at the position `i` of the path."""
+        if self.side is None:
+            return True
+        # The position n - 1 has the class of t, and the classes alternate
+        return (self.side[u] == self.side[self.t]) == ((self.n - 1 - i) % 2 == 0)
+
+    def prune(self, s: int) -> Optional[dict[int, set[int]]]:
+        """
+        Removes the edges that can not be in a Hamiltonian path from `s` to `t`.
+
+        :param s: The start node's id.
+        :return: The neighbours of every vertex without the removed edges, or None if there is no Hamiltonian path.
+        """
+        n, t = self.n, self.t
+        if n == 1:
+            return {u: set(vs) for u, vs in self.neighbours.items()} if s == t else None
+        if s == t or not self.connected:
+            return None
+
+        # The classes of a bipartite graph must have the right sizes for a path from s to t
+        if self.side is not None:
+            if not self.feasible(s, 0):
+                return None
+            # The positions with the parity of t are ceil(n / 2)
+            if sum(side == self.side[t] for side in self.side) != (n + 1) // 2:
+                return None
+
+        # Number of edges of every vertex in the path
+        required = {u: 2 for u in range(n)}
+        required[s] = required[t] = 1
+
+        adjacency = {u: set(vs) for u, vs in self.neighbours.items()}
+        forced: dict[int, set[int]] = {u: set() for u in range(n)}
+        changed = True
+        while changed:
+            changed = False
+            for u in range(n):
+                if len(adjacency[u]) < required[u]:
+                    return None
+                # Every edge of the vertex is needed
+                if len(adjacency[u]) == required[u] and forced[u] != adjacency[u]:
+                    for v in adjacency[u] - forced[u]:
+                        forced[u].add(v)
+                        forced[v].add(u)
+                    changed = True
+                if any(len(forced[v]) > required[v] for v in adjacency[u] | {u}):
+                    return None
+                # The vertex has all its edges, so the other ones are removed
+                if len(forced[u]) == required[u] and adjacency[u] != forced[u]:
+                    for v in adjacency[u] - forced[u]:
+                        adjacency[v].discard(u)
+                    adjacency[u] = set(forced[u])
+                    changed = True
+
+        if any(len(forced[u]) > required[u] for u in range(n)):
+            return None
+
+        # The forced edges can not close a cycle, nor join s and t (unless they are the whole path)
+        if n > 2 and t in forced[s]:
+            return None
+        parent = list(range(n))
+
+        def find(u: int) -> int:
+            while parent[u] != u:
+                parent[u] = parent[parent[u]]
+                u = parent[u]
+            return u
+
+        for u in range(n):
+            for v in forced[u]:
+                if u < v:
+                    root_u, root_v = find(u), find(v)
+                    if root_u == root_v:
+                        return None
+                    parent[root_u] = root_v
+
+        return adjacency if _is_connected(adjacency) else None
+
+    def is_possible(self, s: int) -> bool:
+        """Returns False if it is proved that there is no Hamiltonian path from `s` to `t`."""
+        return self.prune(s) is not None
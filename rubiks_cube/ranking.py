@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import math
+from typing import Iterable
+
+import numpy as np
+
+from rubiks_cube.compact import CompactRubikCube, to_compact
+from rubiks_cube.cube import RubikCube
+from rubiks_cube.movements import CubeMove
+
+
+def state_key(cube: RubikCube | CompactRubikCube) -> bytes:
+    """
+    Returns a key of the state of a cube: the bytes of its color codes. Two cubes of the same dimensions have the
+    same key if and only if they are equal, and the key does not depend on the process (unlike `hash`).
+
+    :param cube: A Rubik's Cube.
+    :return: The key as bytes.
+    """
+    return to_compact(cube).key
+
+
+def state_id(cube: RubikCube | CompactRubikCube) -> int:
+    """
+    Returns the state of a cube as a (big) integer, reading its color codes as digits.
+
+    :param cube: A Rubik's Cube.
+    :return: An integer that identifies the state among the cubes of the same dimensions.
+    """
+    return int.from_bytes(state_key(cube), "big")
+
+
+def state_keys(states: np.ndarray) -> np.ndarray:
+    """
+    Returns the keys of several states at once, as a NumPy array of fixed-size bytes (one per row of `states`).
+    The keys can be sorted, compared and searched with NumPy functions.
+
+    :param states: An (N, stickers) array of color codes.
+    :return: An array with N keys.
+    """
+    states = np.ascontiguousarray(states, dtype=np.uint8)
+    return states.view(np.dtype((np.void, states.shape[1]))).reshape(len(states))
+
+
+class StateRanking:
+    """
+    Class that makes a perfect ranking of a set of states: every state is mapped to a dense integer in [0, N),
+    namely its row in `states`, and every integer is mapped back to its state.
+    """
+
+    def __init__(self, states: np.ndarray, dims: tuple[int, int, int], permitted_movements: set[CubeMove] = None):
+        # States, one per row. The rank of a state is its row.
+        self.states: np.ndarray = np.ascontiguousarray(states, dtype=np.uint8)
+        self.dims: tuple[int, int, int] = tuple(dims)
+        self.permitted_movements: frozenset[CubeMove] = frozenset(permitted_movements or CubeMove)
+
+        # Sorted keys, to rank with a binary search
+        keys = state_keys(self.states)
+        self._order: np.ndarray = np.argsort(keys, kind="stable")
+        self._sorted_keys: np.ndarray = keys[self._order]
+        if len(keys) > 1 and (self._sorted_keys[1:] == self._sorted_keys[:-1]).any():
+            raise ValueError("The states of a ranking must be different.")
+
+    @classmethod
+    def from_cubes(cls, cubes: Iterable[RubikCube | CompactRubikCube]) -> StateRanking:
+        """
+        Factory method that ranks the given cubes in the given order.
+
+        :param cubes: An iterable of different cubes with the same dimensions.
+        :return: A ranking of the cubes.
+        """
+        compact_cubes = [to_compact(rc) for rc in cubes]
+        if not compact_cubes:
+            raise ValueError("At least one cube is needed to create a ranking.")
+        first = compact_cubes[0]
+        return cls(np.stack([rc.stickers for rc in compact_cubes]), first.dims, first.permitted_movements)
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def __contains__(self, cube) -> bool:
+        return self.rank_states(to_compact(cube).stickers[None, :], default=-1)[0] >= 0
+
+    def rank_states(self, states: np.ndarray, default: int = None) -> np.ndarray:
+        """
+        Ranks several states at once.
+
+        :param states: An (N, stickers) array of color codes.
+        :param default: The rank of the states that are not in the ranking. If it is None, a KeyError is raised.
+        :return: An array of N ranks.
+        """
+        keys = state_keys(states)
+        positions = np.searchsorted(self._sorted_keys, keys)
+        found = positions < len(self._sorted_keys)
+        found[found] = self._sorted_keys[positions[found]] == keys[found]
+        if default is None and not found.all():
+            raise KeyError(f"{np.count_nonzero(~found)} states are not in the ranking.")
+        ranks = np.full(len(keys), -1 if default is None else default, dtype=np.int64)
+        ranks[found] = self._order[positions[found]]
+        return ranks
+
+    def rank(self, cube: RubikCube | CompactRubikCube) -> int:
+        """Returns the rank of a cube."""
+        return int(self.rank_states(to_compact(cube).stickers[None, :])[0])
+
+    def unrank_states(self, ranks: np.ndarray) -> np.ndarray:
+        """Returns the states (one per row) of the given ranks."""
+        return self.states[np.asarray(ranks)]
+
+    def unrank(self, rank: int) -> CompactRubikCube:
+        """Returns the cube of the given rank."""
+        return CompactRubikCube(self.states[rank], self.dims, self.permitted_movements)
+
+
+def _binomials(n: int) -> np.ndarray:
+    """Function that makes the table of the binomial coefficients C(i, j) for 0 <= i, j <= n."""
+    table = np.zeros((n + 1, n + 1), dtype=np.int64)
+    table[:, 0] = 1
+    for i in range(1, n + 1):
+        table[i, 1:] = table[i - 1, 1:] + table[i - 1, :-1]
+    return table
+
+
+class MultisetRanking:
+    """
+    Class that makes a perfect ranking of every state with the same number of stickers of every color as the state
+    `solved`, without keeping any state: these are the permutations of a multiset, and every permutation is mapped
+    to an integer in [0, N) with the combinatorial number system. The stickers of the first color are ranked as a
+    combination of the positions, then the ones of the second color as a combination of the remaining positions, and
+    so on.
+
+    The moves permute the stickers, so every state reached from `solved` has a rank (e.g. the abstract states of a
+    pattern database, where most of the stickers are the same wildcard).
+    """
+
+    def __init__(self, solved: np.ndarray):
+        solved = np.asarray(solved, dtype=np.uint8)
+        self.n_stickers: int = len(solved)
+
+        # Colors and number of stickers of every color. The positions of the last color are the remaining ones.
+        codes, counts = np.unique(solved, return_counts=True)
+        self.codes: tuple[int, ...] = tuple(codes.tolist())
+        self.counts: tuple[int, ...] = tuple(counts.tolist())
+
+        # Number of combinations of every color, and number of states
+        self._sizes: list[int] = []
+        remaining = self.n_stickers
+        size = 1
+        for count in self.counts:
+            self._sizes.append(math.comb(remaining, count))
+            size *= self._sizes[-1]
+            remaining -= count
+        if size > np.iinfo(np.int64).max:
+            raise ValueError(f"There are {size} states, too many to rank them with 64-bit integers.")
+        self.size: int = size
+        self._binomials: np.ndarray = _binomials(self.n_stickers)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def rank_states(self, states: np.ndarray, default: int = None) -> np.ndarray:
+        """
+        Ranks several states at once.
+
+        :param states: An (N, stickers) array of color codes.
+        :param default: The rank of the states with other numbers of stickers of every color. If it is None, a
+         KeyError is raised.
+        :return: An int64 array of N ranks.
+        """
+        states = np.asarray(states, dtype=np.uint8)
+        valid = np.ones(len(states), dtype=bool)
+        ranks = np.zeros(len(states), dtype=np.int64)
+        remaining = np.ones(states.shape, dtype=bool)
+        for code, count, size in zip(self.codes, self.counts, self._sizes):
+            is_color = states == code
+            valid &= np.count_nonzero(is_color, axis=1) == count
+            # The j-th sticker of the color (from 1) at the i-th remaining position (from 0) adds C(i, j)
+            positions = np.cumsum(remaining, axis=1) - 1
+            occurrences = np.cumsum(is_color, axis=1)
+            terms = self._binomials[np.maximum(positions, 0), np.minimum(occurrences, self.n_stickers)]
+            ranks = ranks * size + np.where(is_color & remaining, terms, 0).sum(axis=1)
+            remaining &= ~is_color
+        valid &= ~remaining.any(axis=1)
+        if not valid.all():
+            if default is None:
+                raise KeyError(f"{np.count_nonzero(~valid)} states do not have the stickers of the ranking.")
+            ranks[~valid] = default
+        return ranks
+
+    def unrank_states(self, ranks: np.ndarray) -> np.ndarray:
+        """Returns the states (one per row) of the given ranks."""
+        ranks = np.asarray(ranks, dtype=np.int64)
+        n = len(ranks)
+        states = np.empty((n, self.n_stickers), dtype=np.uint8)
+        remaining = np.ones((n, self.n_stickers), dtype=bool)
+
+        # Rank of the combination of every color (the first color is the most significant digit)
+        digits = []
+        for size in reversed(self._sizes):
+            digits.append(ranks % size)
+            ranks = ranks // size
+        digits.reverse()
+
+        rows = np.arange(n)
+        for code, count, digit in zip(self.codes, self.counts, digits):
+            free = np.nonzero(remaining)[1].reshape(n, -1)
+            for j in range(count, 0, -1):
+                # Largest position i with C(i, j) <= digit
+                i = np.searchsorted(self._binomials[:free.shape[1], j], digit, side="right") - 1
+                digit = digit - self._binomials[i, j]
+                columns = free[rows, i]
+                states[rows, columns] = code
+                remaining[rows, columns] = False
+        return states
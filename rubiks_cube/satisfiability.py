@@ -1,51 +1,198 @@
 import os
-from itertools import product, combinations
-from typing import Optional
+import shutil
+import tempfile
+import time
+from bisect import bisect_right
+from typing import Iterable, Iterator, NamedTuple, Optional, TextIO, Union
+from weakref import WeakKeyDictionary
 
 import networkx as nx
+import numpy as np
 from pysat.formula import CNF
 from pysat.solvers import Solver
 
 from rubiks_cube.cube import RubikCube
+from rubiks_cube.encodings import ENCODINGS, VariablePool, at_most_one, encoding_size
 from rubiks_cube.graph import make_simple_graph, find_bipartite
+from rubiks_cube.movements import CubeMove
+from rubiks_cube.preprocessing import GraphPreprocessing
 
+# Size of the buffer of the CNF files
+_WRITE_BUFFER_SIZE = 2 ** 20
 
-def generate_variables(graph: nx.Graph) -> tuple[dict[tuple[int, int], int], dict[int, tuple[int, int]]]:
+
+class VariableMap:
+    """
+    Numbering of the X_{u, i} variables (the vertex u is at the position i of the path). The number is computed
+    arithmetically, X_{u, i} = u * n + i + 1, and so is its inverse, so nothing of size n^2 is kept in memory.
+    """
+
+    def __init__(self, n: int):
+        # Number of nodes of the graph
+        self.n: int = n
+
+    def __len__(self) -> int:
+        return self.n * self.n
+
+    def __contains__(self, key: tuple[int, int]) -> bool:
+        u, i = key
+        return 0 <= u < self.n and 0 <= i < self.n
+
+    def __getitem__(self, key: tuple[int, int]) -> int:
+        if key not in self:
+            raise KeyError(key)
+        u, i = key
+        return u * self.n + i + 1
+
+    def pair(self, variable: int) -> tuple[int, int]:
+        """Returns the pair (u, i) of a variable."""
+        if not 0 < variable <= len(self):
+            raise KeyError(variable)
+        return divmod(variable - 1, self.n)
+
+    def decode(self, variables: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the vertices and the positions of several variables, ignoring the other ones (e.g. the negative
+        literals or the auxiliary variables of the encodings).
+        """
+        variables = np.asarray(variables, dtype=np.int64)
+        variables = variables[(variables > 0) & (variables <= len(self))]
+        return np.divmod(variables - 1, self.n)
+
+    def vertices(self, i: int) -> list[int]:
+        """Returns the vertices that can be at the position i, in increasing order."""
+        return list(range(self.n))
+
+    def positions(self, u: int) -> list[int]:
+        """Returns the positions where the vertex u can be, in increasing order."""
+        return list(range(self.n))
+
+
+class ParityVariableMap(VariableMap):
+    """
+    Numbering of the X_{u, i} variables of a bipartite graph, where the vertex u can only be at the positions whose
+    parity agrees with its class (see `GraphPreprocessing`). Only these pairs have a variable: the variables are
+    numbered position by position, and by the rank of the vertex in its class.
+    """
+
+    def __init__(self, side: list[int], t: int):
+        super().__init__(len(side))
+        n = self.n
+        # Class of every vertex, and class of the vertices at every position (the position n - 1 has the class of t)
+        self.side: list[int] = list(side)
+        self.position_side: list[int] = [side[t] if (n - 1 - i) % 2 == 0 else 1 - side[t] for i in range(n)]
+
+        # Vertices of every class, and rank of every vertex in its class
+        self.members: list[list[int]] = [[u for u in range(n) if side[u] == c] for c in (0, 1)]
+        self.rank: list[int] = [0] * n
+        for members in self.members:
+            for r, u in enumerate(members):
+                self.rank[u] = r
+
+        # Number of the variables before every position
+        self.offsets: list[int] = [0]
+        for c in self.position_side:
+            self.offsets.append(self.offsets[-1] + len(self.members[c]))
+
+    def __len__(self) -> int:
+        return self.offsets[-1]
+
+    def __contains__(self, key: tuple[int, int]) -> bool:
+        u, i = key
+        return 0 <= u < self.n and 0 <= i < self.n and self.side[u] == self.position_side[i]
+
+    def __getitem__(self, key: tuple[int, int]) -> int:
+        if key not in self:
+            raise KeyError(key)
+        u, i = key
+        return self.offsets[i] + self.rank[u] + 1
+
+    def pair(self, variable: int) -> tuple[int, int]:
+        if not 0 < variable <= len(self):
+            raise KeyError(variable)
+        i = bisect_right(self.offsets, variable - 1) - 1
+        return self.members[self.position_side[i]][variable - 1 - self.offsets[i]], i
+
+    def decode(self, variables: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        variables = np.asarray(variables, dtype=np.int64)
+        variables = variables[(variables > 0) & (variables <= len(self))] - 1
+        offsets = np.array(self.offsets)
+        positions = np.searchsorted(offsets, variables, side="right") - 1
+        # Vertices of every class one after the other, to pick them by class and rank
+        members = np.array(self.members[0] + self.members[1], dtype=np.int64)
+        first = np.array([0, len(self.members[0])])[np.array(self.position_side)[positions]]
+        return members[first + variables - offsets[positions]], positions
+
+    def vertices(self, i: int) -> list[int]:
+        return list(self.members[self.position_side[i]])
+
+    def positions(self, u: int) -> list[int]:
+        return [i for i in range(self.n) if self.position_side[i] == self.side[u]]
+
+
+def make_variable_map(n: int, preprocessing: GraphPreprocessing = None) -> VariableMap:
+    """
+    Makes the numbering of the X_{u, i} variables of a graph.
+
+    :param n: The number of nodes of the graph.
+    :param preprocessing: If it is given and the graph is bipartite, only the pairs (u, i) with the right parity
+     have a variable.
+    :return: A VariableMap.
+    """
+    if preprocessing is not None and preprocessing.side is not None:
+        return ParityVariableMap(preprocessing.side, preprocessing.t)
+    return VariableMap(n)
+
+
+def generate_variables(graph: nx.Graph, preprocessing: GraphPreprocessing = None
+                       ) -> tuple[dict[tuple[int, int], int], dict[int, tuple[int, int]]]:
     """
     Given a graph, generates tho dictionaries with a convention to name variables. It also returns other dictionary,
-     that given an integer, returns the tuple as the convention.
+     that given an integer, returns the tuple as the convention. The convention is the one of `make_variable_map`,
+     which should be preferred since it does not build the dictionaries.
 
     :param graph: A graph to generate the variables.
+    :param preprocessing: If it is given, only the feasible pairs (u, i) have a variable.
     :return: Two dictionaries. One that receives a tuple and returns an integer,
      and the other is the "inverse function".
     """
-    # Making the X_{u, i} variables
-    n: int = len(graph)  # Number of nodes in the graph
-    X: dict[tuple[int, int], int] = {}
-    for index, (u, i) in enumerate(product(range(n), repeat=2)):
-        X[u, i] = index + 1
-
-    X_: set[int, tuple[int, int]] = {X[k]: k for k in X.keys()}
-
+    variable_map = make_variable_map(len(graph), preprocessing)
+    X_: dict[int, tuple[int, int]] = {k: variable_map.pair(k) for k in range(1, len(variable_map) + 1)}
+    X: dict[tuple[int, int], int] = {X_[k]: k for k in sorted(X_, key=X_.get)}
     return X, X_
 
 
-def generate_clauses(g: nx.Graph, s: int, t: int) -> list[list[int, ...]]:
+def iter_clauses(g: nx.Graph, s: Optional[int], t: int, encoding: str = "pairwise",
+                 vertex_at_most_one: bool = False, preprocessing: GraphPreprocessing = None) -> Iterator[list[int]]:
     """
-    Generates a codification for the SAT Solver.
+    Generates the codification for the SAT Solver one clause at a time, so the clauses are never kept in memory.
 
     :param g: A nx.Graph instance.
-    :param s: The start node's id.
+    :param s: The start node's id. If it is None, the start node is not fixed (one clause less), so it can be given
+     later as an assumption.
     :param t: The final node's id.
-    :return: A list of list with the desired clauses.
+    :param encoding: The at-most-one encoding of the cardinality constraints (one of `encodings.ENCODINGS`). The
+     auxiliary variables are numbered after the X_{u, i} variables.
+    :param vertex_at_most_one: To also impose that each vertex has at most one position. It is implied by the other
+     constraints, but it may help the solver.
+    :param preprocessing: The preprocessing of the graph for the final node t. If it is given, only the feasible
+     pairs (u, i) have a variable, and the edges that can not be in the path are removed. If the path is proved
+     impossible, the formula is the empty clause.
+    :return: An iterator of the clauses, in the order of `generate_clauses`.
     """
-    X, _ = generate_variables(g)
     neighbours: dict[int, set[int]] = make_simple_graph(g)
     n: int = len(neighbours)
+    X: VariableMap = make_variable_map(n, preprocessing)
+    if preprocessing is not None and s is not None:
+        neighbours = preprocessing.prune(s)
+        if neighbours is None:
+            yield []
+            return
 
-    # Making the clauses
     # Impose that node s has the position 0 and the node t the position (n-1)
-    clauses: list[list[int, ...]] = [[X[s, 0]], [X[t, n - 1]]]
+    if s is not None:
+        yield [X[s, 0]]
+    yield [X[t, n - 1]]
 
     # The set V - t
     V_m_t: set[int] = set(range(n))
@@ -54,27 +201,118 @@ def generate_clauses(g: nx.Graph, s: int, t: int) -> list[list[int, ...]]:
     # Verify that the path is Hamiltonian
     for i in range(n - 1):
         for u in V_m_t:
-            clauses.append([-X[u, i]] + [X[v, i + 1] for v in neighbours[u]])
+            if (u, i) in X:
+                yield [-X[u, i]] + [X[v, i + 1] for v in neighbours[u] if (v, i + 1) in X]
 
     # Each vertex has a position
     for u in range(n):
-        clauses.append([X[u, i] for i in range(n)])
+        yield [X[u, i] for i in X.positions(u)]
 
     # Each position has a vertex
     for i in range(n):
-        clauses.append([X[u, i] for u in range(n)])
+        yield [X[u, i] for u in X.vertices(i)]
 
     # Cardinality constraints
+    variables = VariablePool(len(X))
     for i in range(n):
-        for u, v in combinations(range(n), 2):
-            clauses.append([-X[u, i], -X[v, i]])
+        yield from at_most_one([X[u, i] for u in X.vertices(i)], variables, encoding)
+    if vertex_at_most_one:
+        for u in range(n):
+            yield from at_most_one([X[u, i] for i in X.positions(u)], variables, encoding)
+
+
+def count_clauses(n: int, encoding: str = "pairwise", vertex_at_most_one: bool = False) -> tuple[int, int]:
+    """
+    Computes the size of the codification of a graph with `n` nodes without generating it.
+
+    :param n: The number of nodes of the graph.
+    :param encoding: The at-most-one encoding of the cardinality constraints.
+    :param vertex_at_most_one: If the codification imposes that each vertex has at most one position.
+    :return: The number of variables and the number of clauses.
+    """
+    n_constraints = 2 * n if vertex_at_most_one else n
+    n_auxiliary, n_amo_clauses = encoding_size(encoding, n)
+    return n * n + n_constraints * n_auxiliary, 2 + (n - 1) * (n - 1) + 2 * n + n_constraints * n_amo_clauses
+
+
+def formula_size(clauses: Iterable[list[int]]) -> tuple[int, int]:
+    """
+    Computes the size of a formula by going through its clauses (for the formulas whose size can not be computed
+    in advance, as the preprocessed ones).
+
+    :param clauses: An iterable of clauses.
+    :return: The number of variables (the largest one) and the number of clauses.
+    """
+    n_variables = n_clauses = 0
+    for clause in clauses:
+        n_variables = max(n_variables, max(map(abs, clause), default=0))
+        n_clauses += 1
+    return n_variables, n_clauses
 
-    return clauses
+
+def generate_clauses(g: nx.Graph, s: int, t: int, encoding: str = "pairwise",
+                     vertex_at_most_one: bool = False) -> list[list[int, ...]]:
+    """
+    Generates a codification for the SAT Solver.
+
+    :param g: A nx.Graph instance.
+    :param s: The start node's id.
+    :param t: The final node's id.
+    :param encoding: The at-most-one encoding of the cardinality constraints.
+    :param vertex_at_most_one: To also impose that each vertex has at most one position.
+    :return: A list of list with the desired clauses.
+    """
+    return list(iter_clauses(g, s, t, encoding, vertex_at_most_one))
+
+
+def write_cnf(clauses: Iterable[list[int]], n_variables: Optional[int], n_clauses: Optional[int],
+              file: Union[str, TextIO]):
+    """
+    Writes clauses in the DIMACS format as they are generated, with the same layout as `CNF.to_file`. The header
+    is written first, so the size of the formula should be known in advance (see `count_clauses`). Otherwise, the
+    clauses are counted while they are written to a temporary file, which is copied after the header.
+
+    :param clauses: An iterable of clauses.
+    :param n_variables: The number of variables of the header, or None if it is not known.
+    :param n_clauses: The number of clauses of the header, or None if it is not known.
+    :param file: The path of the file, or a text stream.
+    :return: Nothing.
+    """
+    if isinstance(file, str):
+        with open(file, "w", buffering=_WRITE_BUFFER_SIZE) as f:
+            return write_cnf(clauses, n_variables, n_clauses, f)
+
+    if n_variables is None or n_clauses is None:
+        with tempfile.TemporaryFile("w+", buffering=_WRITE_BUFFER_SIZE) as body:
+            counted_variables = counted_clauses = 0
+            for clause in clauses:
+                body.write(" ".join(map(str, clause)) + " 0\n")
+                counted_variables = max(counted_variables, max(map(abs, clause), default=0))
+                counted_clauses += 1
+            file.write(f"p cnf {counted_variables} {counted_clauses}\n")
+            body.seek(0)
+            shutil.copyfileobj(body, file, _WRITE_BUFFER_SIZE)
+        return
+
+    file.write(f"p cnf {n_variables} {n_clauses}\n")
+    written = 0
+    for clause in clauses:
+        file.write(" ".join(map(str, clause)) + " 0\n")
+        written += 1
+    if written != n_clauses:
+        raise ValueError(f"The header declares {n_clauses} clauses, but {written} were written.")
+
+
+def _sources(graph: nx.Graph, t: RubikCube) -> set[RubikCube]:
+    """Finds the nodes of the class of the bipartition that does not contain t (the possible start nodes)."""
+    U, V = find_bipartite(graph)
+    return V if t in U else U
 
 
 def generate_cnf_file(graph: nx.Graph, t: RubikCube,
                       source_path="clauses", name_format="rubik-{}.cnf",
-                      verbose=False):
+                      verbose=False, encoding="pairwise", vertex_at_most_one=False, preprocess=False,
+                      preprocessing: GraphPreprocessing = None) -> Optional[GraphPreprocessing]:
     """
     Creates the necessary files with the cnf format.
 
@@ -83,15 +321,21 @@ def generate_cnf_file(graph: nx.Graph, t: RubikCube,
     :param source_path: The source folder where the files will be saved.
     :param name_format: The format of how the files will be saved.
     :param verbose: To see further information of the process of generating clauses.
-    :return: Nothing.
+    :param encoding: The at-most-one encoding of the cardinality constraints.
+    :param vertex_at_most_one: To also impose that each vertex has at most one position.
+    :param preprocess: To make smaller formulas with a GraphPreprocessing, and to skip the start nodes that can not
+     have a Hamiltonian path (no file is written for them).
+    :param preprocessing: The GraphPreprocessing of the graph with the final node t. It implies `preprocess`.
+    :return: The GraphPreprocessing of the files (or None if they are not preprocessed), to read their models with
+     `solve_clause_interpreted` or `interpret_model`.
     """
     if verbose:
         print("Finding the bipartite")
     # t id node
     t_ = graph.nodes[t]["id"]
-    # Finding the bipartite
-    U, V = find_bipartite(graph)
-    W = V if t in U else U
+    W = _sources(graph, t)
+    if preprocessing is None and preprocess:
+        preprocessing = GraphPreprocessing(make_simple_graph(graph), t_)
 
     # Making the directory in the case that it does not exist
     if not os.path.isdir(source_path):
@@ -103,11 +347,17 @@ def generate_cnf_file(graph: nx.Graph, t: RubikCube,
         print(f"Total number of clauses: {len(W)}")
     for i, s in enumerate(W):
         s_ = graph.nodes[s]["id"]
+        if preprocessing is not None and not preprocessing.is_possible(s_):
+            if verbose:
+                print(f"Skipping the clause {i + 1}/{len(W)}: there is no path from the Rubik's Cube with id = {s_}")
+            continue
         if verbose:
             print(f"Generating the clause {i + 1}/{len(W)} of the Rubik's Cube with id = {s_}")
-        clauses = generate_clauses(graph, s_, t_)
-        cnf = CNF(from_clauses=clauses)
-        cnf.to_file(os.path.join(source_path, name_format.format(s_)))
+        # The size of a preprocessed formula is counted while it is written
+        size = (None, None) if preprocessing is not None else count_clauses(len(graph), encoding, vertex_at_most_one)
+        write_cnf(iter_clauses(graph, s_, t_, encoding, vertex_at_most_one, preprocessing), *size,
+                  os.path.join(source_path, name_format.format(s_)))
+    return preprocessing
 
 
 def solve_clause(file_name: str, solver_name="cd", use_timer=False) -> Optional[list[int]]:
@@ -128,18 +378,158 @@ def solve_clause(file_name: str, solver_name="cd", use_timer=False) -> Optional[
     return None
 
 
-def solve_clause_interpreted(g: nx.Graph, file_name: str, solver_name="cd", use_timer=False):
+def solve_incremental(graph: nx.Graph, t: RubikCube, sources: Iterable[RubikCube] = None, solver_name="cd",
+                      encoding="pairwise", vertex_at_most_one=False, preprocess=False, verbose=False,
+                      preprocessing: GraphPreprocessing = None) -> Iterator[tuple[RubikCube, Optional[list[int]]]]:
+    """
+    Solves the codification of `generate_cnf_file` for every start node with a single solver. The clauses shared by
+    every start node are added once, and the start node is given as an assumption, so the solver keeps what it learns
+    between the queries and no file is written.
+
+    :param graph: A graph to make the clauses
+    :param t: The final node as a RubikCube instance
+    :param sources: The start nodes. By default, the nodes of the class of the bipartition that does not contain t.
+    :param solver_name: The name of the SAT Solver.
+    :param encoding: The at-most-one encoding of the cardinality constraints.
+    :param vertex_at_most_one: To also impose that each vertex has at most one position.
+    :param preprocess: To make a smaller formula with a GraphPreprocessing, and to skip the solver for the start nodes
+     that can not have a Hamiltonian path. The models must then be read with the same preprocessing, so it is
+     better to give it with `preprocessing`.
+    :param verbose: To see further information of the process of solving.
+    :param preprocessing: The GraphPreprocessing of the graph with the final node t, to read the models with
+     `decode_model` or `interpret_model`. It implies `preprocess`.
+    :return: An iterator of pairs with the start node and its model (or None if there is no Hamiltonian path).
+    """
+    t_ = graph.nodes[t]["id"]
+    if preprocessing is None and preprocess:
+        preprocessing = GraphPreprocessing(make_simple_graph(graph), t_)
+    X = make_variable_map(len(graph), preprocessing)
+    sources = _sources(graph, t) if sources is None else sources
+
+    with Solver(name=solver_name) as solver:
+        for clause in iter_clauses(graph, None, t_, encoding, vertex_at_most_one, preprocessing):
+            solver.add_clause(clause)
+        for s in sources:
+            s_ = graph.nodes[s]["id"]
+            if preprocessing is not None and not preprocessing.is_possible(s_):
+                if verbose:
+                    print(f"Skipping the Rubik's Cube with id = {s_}: there is no path")
+                yield s, None
+                continue
+            if verbose:
+                print(f"Solving the Rubik's Cube with id = {s_}")
+            model = solver.get_model() if solver.solve(assumptions=[X[s_, 0]]) else None
+            yield s, model
+
+
+class HamiltonianPath(NamedTuple):
+    """A Hamiltonian path decoded from a model: the ids of its nodes, the nodes, and the moves between them."""
+    ids: np.ndarray
+    cubes: list[RubikCube]
+    moves: list[CubeMove]
+
+
+class _GraphLookup:
+    """Lookup tables of a graph, kept while the graph lives to decode several models."""
+
+    def __init__(self, g: nx.Graph):
+        # Node of every id
+        self.cubes: list[RubikCube] = [None] * len(g)
+        for node, i in g.nodes(data="id"):
+            self.cubes[i] = node
+
+        # Move that joins two nodes (by their ids), filled when it is needed
+        self.moves: dict[tuple[int, int], CubeMove] = {}
+
+    def move(self, g: nx.Graph, u: int, v: int) -> CubeMove:
+        """The move that transforms the node u into the node v."""
+        if (u, v) not in self.moves:
+            rc, other_rc = self.cubes[u], self.cubes[v]
+            candidates = sorted(g[rc][other_rc]["move"], key=lambda m: m.value)
+            self.moves[u, v] = next(m for m in candidates if rc.make_movements(m) == other_rc)
+        return self.moves[u, v]
+
+
+_graph_lookups: WeakKeyDictionary[nx.Graph, _GraphLookup] = WeakKeyDictionary()
+
+
+def decode_model(g: nx.Graph, model: list[int], preprocessing: GraphPreprocessing = None) -> HamiltonianPath:
+    """
+    Translates a model of the codification into the Hamiltonian path. The vertex and the position of every variable
+    are computed arithmetically, and the lookup tables of the graph are kept for the next models.
+
+    :param g: The graph of the codification (from `make_graph`).
+    :param model: A model given by the SAT Solver.
+    :param preprocessing: The preprocessing used to make the codification, if any.
+    :return: The path as a HamiltonianPath.
+    """
+    n = len(g)
+    if g not in _graph_lookups:
+        _graph_lookups[g] = _GraphLookup(g)
+    lookup = _graph_lookups[g]
+
+    vertices, positions = make_variable_map(n, preprocessing).decode(model)
+    ids = np.empty(n, dtype=np.int64)
+    ids[positions] = vertices
+    id_list = ids.tolist()
+    return HamiltonianPath(
+        ids=ids,
+        cubes=[lookup.cubes[u] for u in id_list],
+        moves=[lookup.move(g, u, v) for u, v in zip(id_list, id_list[1:])],
+    )
+
+
+def interpret_model(g: nx.Graph, model: list[int],
+                    preprocessing: GraphPreprocessing = None) -> list[tuple[RubikCube, int]]:
+    """
+    Translates a model of the codification into the Hamiltonian path.
+
+    :param g: The graph of the codification.
+    :param model: A model given by the SAT Solver.
+    :param preprocessing: The preprocessing used to make the codification, if any.
+    :return: The nodes of the path (in order) with their ids.
+    """
+    path = decode_model(g, model, preprocessing)
+    return list(zip(path.cubes, path.ids.tolist()))
+
+
+def solve_clause_interpreted(g: nx.Graph, file_name: str, solver_name="cd", use_timer=False,
+                             preprocessing: GraphPreprocessing = None):
     model = solve_clause(file_name, solver_name, use_timer)
+    return interpret_model(g, model, preprocessing)
 
-    _, X_ = generate_variables(g)
 
-    answer = [X_[k] for k in model if k > 0]
-    answer.sort(key=lambda x: x[1])
+class EncodingBenchmark(NamedTuple):
+    """The size of the codification with an encoding and the time to solve it."""
+    encoding: str
+    n_variables: int
+    n_clauses: int
+    seconds: float
+    satisfiable: bool
 
-    id_to_rc = {g.nodes[n]["id"]: n for n in g.nodes}
 
-    answer_ = []
-    for i, _ in answer:
-        answer_.append((id_to_rc[i], i))
+def benchmark_encodings(g: nx.Graph, s: int, t: int, encodings: Iterable[str] = tuple(ENCODINGS),
+                        vertex_at_most_one: bool = False, solver_name="cd") -> list[EncodingBenchmark]:
+    """
+    Compares the at-most-one encodings on the codification of a graph: the number of variables and clauses, and the
+    time to solve it (without writing files).
 
-    return answer_
+    :param g: A nx.Graph instance.
+    :param s: The start node's id.
+    :param t: The final node's id.
+    :param encodings: The names of the encodings to compare.
+    :param vertex_at_most_one: To also impose that each vertex has at most one position.
+    :param solver_name: The name of the SAT Solver.
+    :return: A list with the results of every encoding.
+    """
+    results = []
+    for encoding in encodings:
+        n_variables, n_clauses = count_clauses(len(g), encoding, vertex_at_most_one)
+        with Solver(name=solver_name) as solver:
+            for clause in iter_clauses(g, s, t, encoding, vertex_at_most_one):
+                solver.add_clause(clause)
+            start = time.perf_counter()
+            satisfiable = solver.solve()
+            seconds = time.perf_counter() - start
+        results.append(EncodingBenchmark(encoding, n_variables, n_clauses, seconds, satisfiable))
+    return results
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from rubiks_cube.compact import CompactRubikCube, to_compact
+from rubiks_cube.cube import RubikCube
+from rubiks_cube.movements import CubeMove
+from rubiks_cube.ranking import state_keys
+from rubiks_cube.tables import get_move_table
+
+
+def find_path(start: RubikCube | CompactRubikCube, goal: RubikCube | CompactRubikCube,
+              permitted_movements: set[CubeMove] = None, max_depth: int = None) -> list[CubeMove] | None:
+    """
+    Finds a shortest sequence of permitted movements that transforms `start` into `goal`, with a bidirectional
+    breadth-first search: one frontier grows from `start` with the movements and the other grows from `goal` with
+    their inverses, always expanding the smaller one, until they meet. The graph is never built.
+
+    :param start: The initial cube.
+    :param goal: The final cube.
+    :param permitted_movements: A set of permitted movements. By default, the permitted movements of `start`.
+    :param max_depth: The largest length of the path to search. By default, there is no limit.
+    :return: A list of CubeMoves, or None if `goal` can not be reached.
+    """
+    start, goal = to_compact(start), to_compact(goal)
+    if start.dims != goal.dims:
+        raise ValueError("The cubes must have the same dimensions.")
+    table = get_move_table(start.dims, permitted_movements or start.permitted_movements)
+    n_moves = len(table)
+
+    # For every side: parent key, move and depth of every visited key
+    forward: dict[bytes, tuple[bytes | None, int, int]] = {start.key: (None, -1, 0)}
+    backward: dict[bytes, tuple[bytes | None, int, int]] = {goal.key: (None, -1, 0)}
+    frontiers = [start.stickers[None, :], goal.stickers[None, :]]
+
+    def path_to(parents: dict[bytes, tuple[bytes | None, int, int]], key: bytes) -> list[int]:
+        """Returns the moves from the root of `parents` to `key`."""
+        moves = []
+        while parents[key][0] is not None:
+            key, move, _ = parents[key]
+            moves.append(move)
+        return moves[::-1]
+
+    meeting = start.key if start.key in backward else None
+    depths = [0, 0]
+    while meeting is None and all(len(f) for f in frontiers):
+        if max_depth is not None and sum(depths) >= max_depth:
+            return None
+        # Expand a whole layer of the smaller frontier
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        parents, others = (forward, backward) if side == 0 else (backward, forward)
+        permutations = table.permutations if side == 0 else table.inverse_permutations
+        depths[side] += 1
+
+        frontier = frontiers[side]
+        children = frontier[:, permutations].reshape(-1, frontier.shape[1])
+        frontier_keys = [k.tobytes() for k in state_keys(frontier)]
+        new_rows = []
+        for row, key in enumerate(k.tobytes() for k in state_keys(children)):
+            if key in parents:
+                continue
+            parents[key] = (frontier_keys[row // n_moves], row % n_moves, depths[side])
+            new_rows.append(row)
+            # Keep the meeting state closest to the other root
+            if key in others and (meeting is None or others[key][2] < others[meeting][2]):
+                meeting = key
+        frontiers[side] = children[new_rows]
+
+    if meeting is None:
+        return None
+    moves = path_to(forward, meeting) + path_to(backward, meeting)[::-1]
+    return [table.moves[k] for k in moves]
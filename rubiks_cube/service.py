@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import itertools
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Iterable, Iterator, NamedTuple
+
+import numpy as np
+
+from rubiks_cube.compact import CompactRubikCube
+from rubiks_cube.cube import NotPermittedMovementError
+from rubiks_cube.movements import CubeMove
+from rubiks_cube.solver import IDAStarSolver, PatternDatabase
+from rubiks_cube.utils import Color
+
+# Solver of every process of the pool, with the shared memory blocks that back its pattern databases
+_solver: IDAStarSolver | None = None
+_blocks: list[shared_memory.SharedMemory] = []
+
+
+class SolveResult(NamedTuple):
+    """
+    The solution of a scramble of a batch. If the scramble is not valid, the solution is None and `error` describes
+    the problem.
+    """
+    index: int
+    scramble: str
+    solution: list[CubeMove] | None
+    seconds: float
+    error: str | None = None
+
+
+# Descriptor of an array in shared memory: name of the block, shape and dtype
+_SharedArray = tuple[str, tuple[int, ...], str]
+
+
+def _share(array: np.ndarray, blocks: list[shared_memory.SharedMemory]) -> _SharedArray:
+    """Function that copies an array into a new shared memory block."""
+    block = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+    blocks.append(block)
+    return block.name, array.shape, array.dtype.str
+
+
+def _attach(descriptor: _SharedArray) -> np.ndarray:
+    """Function that maps an array of a shared memory block (created by another process) without copying it."""
+    name, shape, dtype = descriptor
+    block = shared_memory.SharedMemory(name=name)
+    _blocks.append(block)
+    array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+    array.flags.writeable = False
+    return array
+
+
+def _init_worker(dims: tuple[int, int, int], moves: tuple[CubeMove, ...],
+                 databases: list[tuple[tuple[Color, ...], _SharedArray | None, _SharedArray]]):
+    """Initializer of the processes of the pool: builds the solver over the shared pattern databases."""
+    global _solver
+    pattern_databases = [PatternDatabase(dims, moves, colors, None if ranks is None else _attach(ranks),
+                                         _attach(distances))
+                         for colors, ranks, distances in databases]
+    _solver = IDAStarSolver(dims, set(moves), pattern_databases)
+
+
+def _solve_chunk(chunk: list[tuple[int, str]], max_depth: int) -> list[SolveResult]:
+    """Solves a chunk of (index, scramble) pairs with the solver of the process."""
+    results = []
+    for index, scramble in chunk:
+        start = time.perf_counter()
+        try:
+            cube = CompactRubikCube.from_dims(_solver.dims, set(_solver.table.moves)).make_movements(scramble)
+        except (NotPermittedMovementError, ValueError) as e:
+            # An invalid scramble only fails its own result
+            results.append(SolveResult(index, scramble, None, time.perf_counter() - start, f"{type(e).__name__}: {e}"))
+            continue
+        solution = _solver.solve(cube, max_depth)
+        results.append(SolveResult(index, scramble, solution, time.perf_counter() - start))
+    return results
+
+
+def solve_batch(scrambles: Iterable[str], dims: tuple[int, int, int], permitted_movements: set[CubeMove] = None,
+                processes: int = None, pattern_databases: list[PatternDatabase] = None, max_depth: int = 50,
+                chunksize: int = 16) -> Iterator[SolveResult]:
+    """
+    Solves a stream of scrambles with a pool of processes, each one running an IDAStarSolver. The pattern databases
+    are built (or given) once and placed in shared memory, so every process reads the same copy. The scrambles are
+    sent in chunks, and only a few chunks per process are pending at the same time, so the stream is consumed lazily.
+
+    :param scrambles: An iterable of scrambles, as the strings accepted by `RubikCube.make_movements`.
+    :param dims: A tuple with the dimensions of a Rubik's Cube
+    :param permitted_movements: A set of permitted movements
+    :param processes: The number of processes. By default, the number of CPUs.
+    :param pattern_databases: The pattern databases of the solver. By default, the ones of `IDAStarSolver`.
+    :param max_depth: The largest length of the solutions to search.
+    :param chunksize: The number of scrambles sent to a process at the same time.
+    :return: An iterator of SolveResult, in the same order as the scrambles. The invalid scrambles have an error
+     instead of a solution.
+    """
+    processes = processes or os.cpu_count() or 1
+    solver = IDAStarSolver(dims, permitted_movements, pattern_databases)
+
+    blocks: list[shared_memory.SharedMemory] = []
+    try:
+        databases = [(pdb.colors, None if pdb.ranks is None else _share(pdb.ranks, blocks),
+                      _share(pdb.distances, blocks))
+                     for pdb in solver.pattern_databases]
+        initargs = (solver.dims, solver.table.moves, databases)
+        with ProcessPoolExecutor(processes, initializer=_init_worker, initargs=initargs) as executor:
+            chunks = iter(lambda it=enumerate(scrambles): list(itertools.islice(it, chunksize)), [])
+            pending: deque[Future] = deque()
+            for chunk in itertools.chain(chunks, [None]):
+                if chunk is not None:
+                    pending.append(executor.submit(_solve_chunk, chunk, max_depth))
+                # Yield the finished chunks in order when enough of them are pending (or at the end)
+                while pending and (chunk is None or len(pending) > 2 * processes):
+                    yield from pending.popleft().result()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
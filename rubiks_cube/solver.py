@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+
+from rubiks_cube.compact import CompactRubikCube, to_compact
+from rubiks_cube.cube import RubikCube
+from rubiks_cube.movements import MOVES, CubeMove
+from rubiks_cube.ranking import MultisetRanking
+from rubiks_cube.tables import MoveTable, get_move_table
+from rubiks_cube.utils import COLORS, Color
+
+# Code of the stickers whose color is not tracked by a pattern.
+WILDCARD: int = len(COLORS)
+
+# Nibble of the abstract states that can not be reached.
+_UNREACHABLE: int = 15
+
+# Largest distance that fits in a nibble. Larger distances are saved as this one (so it is still a lower bound).
+_MAX_DISTANCE: int = _UNREACHABLE - 1
+
+# The distances are kept for every rank (without the ranks) if there are at most this number of ranks per reachable
+# abstract state: a nibble per rank takes less memory than an int64 rank and a nibble per reachable state.
+_DENSE_FACTOR: int = 16
+
+# Default patterns: the colors of every pair of opposite faces.
+DEFAULT_PATTERNS: tuple[tuple[Color, ...], ...] = (
+    (Color.WHITE, Color.YELLOW), (Color.GREEN, Color.BLUE), (Color.RED, Color.ORANGE)
+)
+
+
+def _pack_nibbles(values: np.ndarray) -> np.ndarray:
+    """Function that packs an array of integers in [0, 15] into half of the bytes."""
+    values = np.asarray(values, dtype=np.uint8)
+    if len(values) % 2:
+        values = np.append(values, np.uint8(_UNREACHABLE))
+    return values[0::2] | (values[1::2] << 4)
+
+
+def _unpack_nibbles(packed: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """Function that reads the nibbles at the given positions."""
+    return (packed[positions >> 1] >> ((positions & 1) << 2).astype(np.uint8)) & 0xF
+
+
+class PatternDatabase:
+    """
+    Class that holds the distances to the solved cube of the abstract states of a pattern: the states where only the
+    stickers of some colors are kept and the rest are replaced by a wildcard. The distance of the abstract state is a
+    lower bound of the distance of the state, so it is an admissible heuristic.
+
+    The abstract states are not kept: they are identified by their rank in a `MultisetRanking`, and their distances
+    are saved as nibbles (two per byte). If the reachable abstract states are a large enough part of the ranks, the
+    nibbles are indexed by the rank (and `ranks` is None); otherwise, `ranks` holds the sorted ranks of the reachable
+    abstract states, in the order of the nibbles.
+    """
+
+    def __init__(self, dims: tuple[int, int, int], moves: Iterable[CubeMove], colors: Iterable[Color],
+                 ranks: np.ndarray | None, distances: np.ndarray):
+        self.dims: tuple[int, int, int] = tuple(dims)
+        self.moves: tuple[CubeMove, ...] = tuple(m for m in CubeMove if m in set(moves))
+        self.colors: tuple[Color, ...] = tuple(sorted(colors, key=lambda c: c.code))
+
+        # Map of the color codes into the abstract ones
+        self._projection: np.ndarray = np.full(256, WILDCARD, dtype=np.uint8)
+        for color in self.colors:
+            self._projection[color.code] = color.code
+
+        # Ranking of the abstract states, with the sorted ranks (if any) and the (packed) distances
+        self.ranking: MultisetRanking = MultisetRanking(self.project(CompactRubikCube.from_dims(dims).stickers))
+        self.ranks: np.ndarray | None = ranks
+        self.distances: np.ndarray = distances
+
+    @classmethod
+    def build(cls, dims: tuple[int, int, int], permitted_movements: set[CubeMove] = None,
+              colors: Iterable[Color] = DEFAULT_PATTERNS[0]) -> PatternDatabase:
+        """
+        Builds the pattern database with a breadth-first search from the solved abstract state, using the inverse of
+        the permitted movements.
+
+        :param dims: A tuple with the dimensions of a Rubik's Cube
+        :param permitted_movements: A set of permitted movements
+        :param colors: The colors tracked by the pattern.
+        :return: The pattern database.
+        """
+        table = get_move_table(dims, permitted_movements)
+        empty = cls(table.dims, table.moves, colors, np.empty(0, dtype=np.int64), np.empty(0, dtype=np.uint8))
+        ranking = empty.ranking
+        n_stickers = ranking.n_stickers
+
+        # The visited and frontier states are kept as sorted ranks
+        visited = ranking.rank_states(empty.project(CompactRubikCube.from_dims(dims).stickers[None, :]))
+        frontier = visited
+        rank_layers, depth_layers = [visited], [np.zeros(1, dtype=np.uint8)]
+        while len(frontier):
+            children = ranking.unrank_states(frontier)[:, table.inverse_permutations].reshape(-1, n_stickers)
+            frontier = np.setdiff1d(np.unique(ranking.rank_states(children)), visited, assume_unique=True)
+            visited = np.union1d(visited, frontier)
+            rank_layers.append(frontier)
+            depth_layers.append(np.full(len(frontier), min(len(depth_layers), _MAX_DISTANCE), dtype=np.uint8))
+
+        ranks = np.concatenate(rank_layers)
+        depth = np.concatenate(depth_layers)
+        if len(ranking) <= _DENSE_FACTOR * len(ranks):
+            distances = np.full(len(ranking), _UNREACHABLE, dtype=np.uint8)
+            distances[ranks] = depth
+            return cls(table.dims, table.moves, colors, None, _pack_nibbles(distances))
+        order = np.argsort(ranks)
+        return cls(table.dims, table.moves, colors, ranks[order], _pack_nibbles(depth[order]))
+
+    def __len__(self) -> int:
+        if self.ranks is not None:
+            return len(self.ranks)
+        return int(np.count_nonzero(self.distances & 0xF != _UNREACHABLE)
+                   + np.count_nonzero(self.distances >> 4 != _UNREACHABLE))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(dims={self.dims}, colors={[c.name for c in self.colors]}, size={len(self)})"
+
+    def project(self, states: np.ndarray) -> np.ndarray:
+        """Returns the abstract states of the pattern."""
+        return self._projection[states]
+
+    def lookup(self, states: np.ndarray) -> np.ndarray:
+        """
+        Returns a lower bound of the distance to the solved cube of several states.
+
+        :param states: An (N, stickers) array of color codes.
+        :return: An uint8 array with N distances.
+        """
+        ranks = self.ranking.rank_states(self.project(states), default=-1)
+        found = ranks >= 0
+        positions = ranks
+        if self.ranks is not None:
+            positions = np.minimum(np.searchsorted(self.ranks, ranks), len(self.ranks) - 1)
+            found &= self.ranks[positions] == ranks
+        positions[~found] = 0
+        distances = _unpack_nibbles(self.distances, positions)
+        if not found.all() or (distances == _UNREACHABLE).any():
+            raise KeyError("Some states can not be reached with the moves of the pattern database.")
+        return distances
+
+    def save(self, path: str):
+        """Saves the pattern database in a `.npz` file."""
+        ranks = {} if self.ranks is None else {"ranks": self.ranks}
+        np.savez(path, dims=np.array(self.dims), moves=np.array([m.code for m in self.moves]),
+                 colors=np.array([c.code for c in self.colors]), distances=self.distances, **ranks)
+
+    @classmethod
+    def load(cls, path: str) -> PatternDatabase:
+        """Loads a pattern database saved with `save`."""
+        with np.load(path) as data:
+            return cls(tuple(data["dims"].tolist()), [MOVES[m] for m in data["moves"]],
+                       [Color.from_code(c) for c in data["colors"]], data["ranks"] if "ranks" in data else None,
+                       data["distances"])
+
+
+class IDAStarSolver:
+    """
+    Class that finds shortest solutions of a Rubik's Cube with an iterative deepening A* search, guided by the
+    maximum of several pattern databases.
+    """
+
+    def __init__(self, dims: tuple[int, int, int], permitted_movements: set[CubeMove] = None,
+                 pattern_databases: list[PatternDatabase] = None):
+        self.table: MoveTable = get_move_table(dims, permitted_movements)
+        self.dims: tuple[int, int, int] = self.table.dims
+        if pattern_databases is None:
+            pattern_databases = [PatternDatabase.build(dims, permitted_movements, colors)
+                                 for colors in DEFAULT_PATTERNS]
+        for pdb in pattern_databases:
+            if pdb.dims != self.dims or pdb.moves != self.table.moves:
+                raise ValueError("The pattern databases must have the same dimensions and movements as the solver.")
+        self.pattern_databases: list[PatternDatabase] = pattern_databases
+        self.solved: np.ndarray = CompactRubikCube.from_dims(dims).stickers
+
+        # Row of the inverse of every move (-1 if it is not permitted), to avoid undoing the last move
+        n_stickers = len(self.solved)
+        identity = np.arange(n_stickers)
+        self._inverse_move: list[int] = [-1] * len(self.table)
+        for i, p in enumerate(self.table.permutations):
+            for j, q in enumerate(self.table.permutations):
+                if (p[q] == identity).all():
+                    self._inverse_move[i] = j
+
+    def heuristic(self, states: np.ndarray) -> np.ndarray:
+        """Returns the maximum lower bound of the pattern databases for every state."""
+        bound = np.zeros(len(states), dtype=np.uint8)
+        for pdb in self.pattern_databases:
+            bound = np.maximum(bound, pdb.lookup(states))
+        return bound
+
+    def solve(self, cube: RubikCube | CompactRubikCube, max_depth: int = 50) -> list[CubeMove] | None:
+        """
+        Finds a shortest sequence of permitted movements that solves the cube.
+
+        :param cube: A Rubik's Cube of the same dimensions as the solver.
+        :param max_depth: The largest length of the solution to search.
+        :return: A list of CubeMoves, or None if there is no solution of length at most `max_depth`.
+        """
+        cube = to_compact(cube)
+        if cube.dims != self.dims:
+            raise ValueError(f"The cube must have dimensions {self.dims}, not {cube.dims}.")
+        permutations = self.table.permutations
+        path: list[int] = []
+
+        def search(state: np.ndarray, depth: int, bound: int, last: int) -> int:
+            """Depth-first search up to `bound`. Returns -1 if it is solved, or the next bound otherwise."""
+            if np.array_equal(state, self.solved):
+                return -1
+            children = state[permutations]
+            estimates = depth + 1 + self.heuristic(children).astype(int)
+            next_bound = np.iinfo(np.int32).max
+            for k in np.argsort(estimates, kind="stable").tolist():
+                if last >= 0 and k == self._inverse_move[last]:
+                    continue
+                if estimates[k] > bound:
+                    next_bound = min(next_bound, int(estimates[k]))
+                    continue
+                path.append(k)
+                result = search(children[k], depth + 1, bound, k)
+                if result < 0:
+                    return result
+                next_bound = min(next_bound, result)
+                path.pop()
+            return next_bound
+
+        try:
+            bound = int(self.heuristic(cube.stickers[None, :])[0])
+        except KeyError:
+            # The cube can not be solved with the permitted movements
+            return None
+        while bound <= max_depth:
+            bound = search(cube.stickers, 0, bound, -1)
+            if bound < 0:
+                return [self.table.moves[k] for k in path]
+        return None
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import os
+import struct
+from typing import BinaryIO
+
+import numpy as np
+
+from rubiks_cube.explorer import StateGraph
+from rubiks_cube.graph import generate_file
+from rubiks_cube.movements import MOVES
+
+# Signature and version of the binary graph files
+MAGIC = b"RCGRAPH\0"
+VERSION = 1
+
+# Header: magic, version, dims, number of moves, number of stickers, number of states and number of edges, followed
+# by the (offset, size in bytes) of every section. The codes of the permitted moves go right after the header.
+_HEADER = struct.Struct("<8s6I2Q")
+_SECTION = struct.Struct("<2Q")
+
+# Sections of the file, with their dtypes, in the order of the file
+_SECTIONS: tuple[tuple[str, np.dtype], ...] = (
+    ("states", np.dtype(np.uint8)),
+    ("indptr", np.dtype("<i4")),
+    ("indices", np.dtype("<i4")),
+    ("moves", np.dtype(np.uint8)),
+    ("depth", np.dtype(np.uint8)),
+)
+
+# Every section starts at a multiple of this number of bytes
+_ALIGNMENT = 64
+
+
+def _aligned(offset: int) -> int:
+    """Function that rounds up an offset to the next multiple of the alignment."""
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _write_array(f: BinaryIO, array: np.ndarray, dtype: np.dtype, block: int = 1 << 24) -> None:
+    """Function that writes an array in blocks of rows, so a memory-mapped array is not loaded at once."""
+    rows = max(1, block // max(1, array[:1].nbytes))
+    for start in range(0, len(array), rows):
+        f.write(np.ascontiguousarray(array[start:start + rows], dtype=dtype).tobytes())
+
+
+def save_graph(graph: StateGraph, path: str) -> None:
+    """
+    Saves a StateGraph in a binary file: a header with the dimensions and the permitted movements, followed by the
+    states, the CSR adjacency, the codes of the moves and the depth of the states as raw little-endian arrays. Every
+    array starts at an aligned offset, so `load_graph` maps them into memory without parsing them.
+
+    :param graph: A StateGraph (as the one of `explore`).
+    :param path: The path of the file.
+    :return: Nothing.
+    """
+    n_states, n_stickers = graph.states.shape
+    codes = bytes(sorted(m.code for m in graph.permitted_movements))
+
+    # Offsets of the sections (the depth is optional)
+    arrays = {"states": graph.states, "indptr": graph.indptr, "indices": graph.indices, "moves": graph.moves,
+              "depth": graph.depth}
+    offset = _HEADER.size + _SECTION.size * len(_SECTIONS) + len(codes)
+    sections = []
+    for name, dtype in _SECTIONS:
+        array = arrays[name]
+        if array is None:
+            sections.append((0, 0))
+            continue
+        offset = _aligned(offset)
+        sections.append((offset, array.size * dtype.itemsize))
+        offset += array.size * dtype.itemsize
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, *graph.dims, len(codes), n_stickers, n_states, graph.n_edges))
+        for section in sections:
+            f.write(_SECTION.pack(*section))
+        f.write(codes)
+        for (name, dtype), (start, size) in zip(_SECTIONS, sections):
+            if size == 0:
+                continue
+            f.write(bytes(start - f.tell()))
+            _write_array(f, arrays[name], dtype)
+
+
+def _read_section(path: str, offset: int, dtype: np.dtype, shape: tuple[int, ...], mmap: bool) -> np.ndarray:
+    """Function that reads a section of a binary graph file, as a read-only memory-mapped array if `mmap`."""
+    if np.prod(shape) == 0:
+        return np.empty(shape, dtype=dtype)
+    if mmap:
+        return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape)
+    return np.fromfile(path, dtype=dtype, count=int(np.prod(shape)), offset=offset).reshape(shape)
+
+
+def load_graph(path: str, mmap: bool = True) -> StateGraph:
+    """
+    Loads a StateGraph saved with `save_graph`. By default, the arrays are read-only memory maps of the file, so
+    nothing is read until it is used.
+
+    :param path: The path of the file.
+    :param mmap: Whether to map the arrays into memory. If it is False, they are read into memory.
+    :return: The StateGraph.
+    """
+    with open(path, "rb") as f:
+        header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size or not header.startswith(MAGIC):
+            raise ValueError(f"'{path}' is not a graph file.")
+        _, version, x, y, z, n_moves, n_stickers, n_states, n_edges = _HEADER.unpack(header)
+        if version != VERSION:
+            raise ValueError(f"The version {version} of the graph file '{path}' is not supported.")
+        sections = [_SECTION.unpack(f.read(_SECTION.size)) for _ in _SECTIONS]
+        codes = f.read(n_moves)
+
+    shapes = {"states": (n_states, n_stickers), "indptr": (n_states + 1,), "indices": (n_edges,),
+              "moves": (n_edges,), "depth": (n_states,)}
+    size = os.path.getsize(path)
+    arrays = {}
+    for (name, dtype), (offset, nbytes) in zip(_SECTIONS, sections):
+        if name == "depth" and nbytes == 0:
+            arrays[name] = None
+            continue
+        if nbytes != int(np.prod(shapes[name])) * dtype.itemsize or offset + nbytes > size:
+            raise ValueError(f"The section '{name}' of the graph file '{path}' is corrupted.")
+        arrays[name] = _read_section(path, offset, dtype, shapes[name], mmap)
+
+    return StateGraph((x, y, z), {MOVES[code] for code in codes}, **arrays)
+
+
+def read_edge_list(path: str) -> tuple[int, np.ndarray]:
+    """
+    Reads a file in the text format of `graph.generate_file`: a line with the number of nodes and the number of
+    edges, followed by a line with the nodes of every edge.
+
+    :param path: The path of the file.
+    :return: The number of nodes and the edges as an (E, 2) array of ids.
+    """
+    with open(path) as f:
+        n, m = (int(value) for value in f.readline().split())
+        edges = np.array(f.read().split(), dtype=np.int64).reshape(-1, 2)
+    if len(edges) != m:
+        raise ValueError(f"The file '{path}' has {len(edges)} edges instead of {m}.")
+    return n, edges
+
+
+def load_simple_graph(path: str) -> dict[int, set[int]]:
+    """
+    Reads a file in the text format of `graph.generate_file` as the simple graph of `graph.make_simple_graph`.
+
+    :param path: The path of the file.
+    :return: The neighbours of every node.
+    """
+    n, edges = read_edge_list(path)
+    simple_graph: dict[int, set[int]] = {u: set() for u in range(n)}
+    for u, v in edges.tolist():
+        simple_graph[u].add(v)
+        simple_graph[v].add(u)
+    return simple_graph
+
+
+def convert_to_edge_list(graph_path: str, path: str = None) -> None:
+    """
+    Writes the graph of a binary graph file in the text format of `graph.generate_file`. The text format only keeps
+    the ids of the edges, so it can not be converted back into a binary graph file.
+
+    :param graph_path: The path of a file of `save_graph`.
+    :param path: The path of the text file. By default, "graph.txt".
+    :return: Nothing.
+    """
+    generate_file(load_graph(graph_path), path)
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import itertools
+from typing import NamedTuple
+
+import numpy as np
+
+from rubiks_cube.compact import CompactRubikCube
+from rubiks_cube.explorer import StateGraph, VisitedStates
+from rubiks_cube.movements import CubeMove
+from rubiks_cube.tables import MoveTable, get_move_table
+from rubiks_cube.utils import face_shapes
+
+
+class Symmetry(NamedTuple):
+    """
+    A spatial symmetry of a cuboid (a rotation or a reflection) acting on the states: the state `s` is mapped
+    into `colors[s[permutation]]`. The colors are relabelled so the solved cube is mapped into itself.
+    """
+    permutation: np.ndarray
+    colors: np.ndarray
+
+
+def _sticker_geometry(dims: tuple[int, int, int]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Function that computes the position of the center of every sticker (doubled, so they are integers) and the
+    normal of its face, with x from left to right, y from down to up and z from front to back.
+    """
+    height, width, length = dims
+    positions, normals = [], []
+
+    def add_face(shape, normal, position):
+        for r, c in itertools.product(range(shape[0]), range(shape[1])):
+            positions.append(position(2 * r + 1, 2 * c + 1))
+            normals.append(normal)
+
+    up, left, front, right, back, down = face_shapes(dims)
+    h, w, ln = 2 * height, 2 * width, 2 * length
+    add_face(up, (0, 1, 0), lambda r, c: (c, h, ln - r))
+    add_face(left, (-1, 0, 0), lambda r, c: (0, h - r, ln - c))
+    add_face(front, (0, 0, -1), lambda r, c: (c, h - r, 0))
+    add_face(right, (1, 0, 0), lambda r, c: (w, h - r, c))
+    add_face(back, (0, 0, 1), lambda r, c: (w - c, h - r, ln))
+    add_face(down, (0, -1, 0), lambda r, c: (c, 0, r))
+    return np.array(positions), np.array(normals)
+
+
+def _spatial_symmetries(dims: tuple[int, int, int]) -> list[np.ndarray]:
+    """Function that returns the permutations of stickers made by every rotation and reflection of the cuboid."""
+    height, width, length = dims
+    extents = np.array([2 * width, 2 * height, 2 * length])
+    positions, normals = _sticker_geometry(dims)
+    index = {(tuple(p), tuple(n)): i for i, (p, n) in enumerate(zip(positions.tolist(), normals.tolist()))}
+
+    permutations = []
+    for axes in itertools.permutations(range(3)):
+        if not (extents[list(axes)] == extents).all():
+            continue
+        for signs in itertools.product([1, -1], repeat=3):
+            matrix = np.zeros((3, 3), dtype=int)
+            matrix[range(3), axes] = signs
+            # Transform the positions around the center of the cuboid
+            new_positions = (positions - extents // 2) @ matrix.T + extents // 2
+            new_normals = normals @ matrix.T
+            sigma = [index[(tuple(p), tuple(n))] for p, n in zip(new_positions.tolist(), new_normals.tolist())]
+            # The sticker i goes to sigma[i], so the new state is the old one gathered by the inverse
+            permutations.append(np.argsort(sigma))
+    return permutations
+
+
+def symmetry_group(dims: tuple[int, int, int], permitted_movements: set[CubeMove] = None) -> list[Symmetry]:
+    """
+    Computes the spatial symmetries of the cuboid that are compatible with the permitted movements: those that map
+    the set of permutations of the movements into itself. Two states related by one of these symmetries have the
+    same distance to the solved cube and equivalent neighbourhoods.
+
+    :param dims: A tuple with the dimensions of a Rubik's Cube
+    :param permitted_movements: A set of permitted movements
+    :return: A list with the symmetries (the identity is the first one).
+    """
+    table = get_move_table(dims, permitted_movements)
+    solved = CompactRubikCube.from_dims(dims).stickers
+    group = []
+    for permutation in _spatial_symmetries(table.dims):
+        # Relabel the colors, so the solved cube is fixed
+        colors = np.arange(256, dtype=np.uint8)
+        colors[solved[permutation]] = solved
+        # Every move m must have a move m' such that g(m(s)) = m'(g(s))
+        conjugated = {p[permutation].tobytes() for p in table.permutations}
+        if conjugated == {permutation[p].tobytes() for p in table.permutations}:
+            group.append(Symmetry(permutation, colors))
+    group.sort(key=lambda g: not (g.permutation == np.arange(len(solved))).all())
+    return group
+
+
+def apply_symmetry(states: np.ndarray, symmetry: Symmetry) -> np.ndarray:
+    """
+    Applies a symmetry to several states.
+
+    :param states: An (N, stickers) array of color codes.
+    :param symmetry: A symmetry.
+    :return: An (N, stickers) array with the images of the states.
+    """
+    return symmetry.colors[states[:, symmetry.permutation]]
+
+
+def apply_symmetries(states: np.ndarray, group: list[Symmetry]) -> np.ndarray:
+    """
+    Applies every symmetry of the group to several states. It takes G times the memory of the states, so prefer
+    `apply_symmetry` over the symmetries for many states.
+
+    :param states: An (N, stickers) array of color codes.
+    :param group: A list of symmetries.
+    :return: A (G, N, stickers) array, where [g, i] is the g-th symmetry applied to the i-th state.
+    """
+    return np.stack([apply_symmetry(states, g) for g in group])
+
+
+def canonicalize(states: np.ndarray, group: list[Symmetry]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the representative of every state: the element with the smallest key of its orbit under the group.
+    The symmetries are applied one at a time, keeping the smallest image found so far.
+
+    :param states: An (N, stickers) array of color codes.
+    :param group: A list of symmetries.
+    :return: The (N, stickers) array of representatives and the size of the orbit of every state.
+    """
+    states = np.asarray(states, dtype=np.uint8)
+    rows = np.arange(len(states))
+    representatives = states.copy()
+    stabilizer = np.zeros(len(states), dtype=np.int64)
+    for g in group:
+        image = apply_symmetry(states, g)
+        stabilizer += (image == states).all(axis=1)
+        # The image is smaller if it is smaller at the first sticker where they differ
+        different = image != representatives
+        first = np.argmax(different, axis=1)
+        smaller = different[rows, first] & (image[rows, first] < representatives[rows, first])
+        representatives[smaller] = image[smaller]
+    return representatives, len(group) // stabilizer
+
+
+class ReducedStateGraph(StateGraph):
+    """
+    State space where every state is a representative of its orbit under a symmetry group. The edges join
+    representatives, and `orbit_sizes` gives the number of states represented by every node.
+    """
+
+    def __init__(self, *args, group: list[Symmetry], orbit_sizes: np.ndarray, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.group: list[Symmetry] = group
+        self.orbit_sizes: np.ndarray = orbit_sizes
+
+    @property
+    def n_full_states(self) -> int:
+        """Number of states of the full (not reduced) state space."""
+        return int(self.orbit_sizes.sum())
+
+    def full_depth_distribution(self) -> np.ndarray:
+        """Returns the number of states of the full state space at every distance of the solved cube."""
+        return np.bincount(self.depth, weights=self.orbit_sizes).astype(np.int64)
+
+    def full_states(self) -> np.ndarray:
+        """Returns every state of the full state space (sorted by their keys)."""
+        visited = VisitedStates(self.states.shape[1])
+        for g in self.group:
+            visited.add(apply_symmetry(self.states, g))
+        return visited.states()
+
+
+def reduced_explore(dims: tuple[int, int, int], permitted_movements: set[CubeMove] = None,
+                    group: list[Symmetry] = None) -> ReducedStateGraph:
+    """
+    Enumerates the states reachable from the solved Rubik's Cube up to symmetry: only one representative per
+    orbit is stored and expanded, which divides the memory and the time by up to the size of the group.
+
+    :param dims: A tuple with the dimensions of a Rubik's Cube
+    :param permitted_movements: A set of permitted movements
+    :param group: The symmetries to use. By default, `symmetry_group(dims, permitted_movements)`.
+    :return: The reduced state space.
+    """
+    table: MoveTable = get_move_table(dims, permitted_movements)
+    group = group if group is not None else symmetry_group(dims, permitted_movements)
+    start = CompactRubikCube.from_dims(dims, permitted_movements).stickers
+    n_moves, n_stickers = len(table), len(start)
+
+    visited = VisitedStates(n_stickers)
+    frontier = visited.add(start[None, :])[1]
+    states_layers: list[np.ndarray] = [frontier]
+    indices_layers: list[np.ndarray] = []
+    while len(frontier):
+        if len(states_layers) > np.iinfo(np.uint8).max + 1:
+            raise OverflowError("The depth of the states does not fit in an uint8.")
+        children, _ = canonicalize(frontier[:, table.permutations].reshape(-1, n_stickers), group)
+        ids, frontier = visited.add(children)
+        indices_layers.append(ids)
+        states_layers.append(frontier)
+    n_states = len(visited)
+    states = np.concatenate(states_layers)
+
+    return ReducedStateGraph(
+        dims, table.moves,
+        states=states,
+        indptr=np.arange(0, n_states * n_moves + 1, n_moves, dtype=np.int32),
+        indices=np.concatenate(indices_layers).astype(np.int32),
+        moves=np.tile(np.array([m.code for m in table.moves], dtype=np.uint8), n_states),
+        depth=np.repeat(np.arange(len(states_layers)), [len(layer) for layer in states_layers]).astype(np.uint8),
+        group=group,
+        orbit_sizes=canonicalize(states, group)[1],
+    )
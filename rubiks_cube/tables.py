@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import functools
+
+import numpy as np
+
+from rubiks_cube.cube import NotPermittedMovementError, RubikCube
+from rubiks_cube.faces import Face
+from rubiks_cube.movements import CubeMove
+from rubiks_cube.utils import face_shapes, sticker_count
+
+
+@functools.lru_cache(maxsize=None)
+def compile_move(dims: tuple[int, int, int], move: CubeMove) -> np.ndarray:
+    """
+    Computes the permutation of stickers made by a move on a cube of dimensions `dims`. The permutation is derived
+    by moving a cube whose faces hold the index of every sticker, so it follows the wiring of `Face.add_faces`.
+    Applying the move is then a gather: `new_stickers = stickers[permutation]`.
+
+    :param dims: The dimensions in the standard (height, width, length).
+    :param move: The move to compile.
+    :return: A read-only array with the permutation of the stickers.
+    """
+    dims = tuple(dims)
+    shapes = face_shapes(dims)
+    index = np.arange(sticker_count(dims))
+
+    # Faces filled with the index of their stickers
+    faces, start = [], 0
+    for shape in shapes:
+        end = start + shape[0] * shape[1]
+        faces.append(Face(index[start:end].reshape(shape).copy()))
+        start = end
+    rc = RubikCube(*faces)
+
+    # Make the movement and check that the cube keeps its shape
+    try:
+        move.move_the_cube(rc)
+    except ValueError as e:
+        raise NotPermittedMovementError(f"{move!r} cannot be applied on a cube of dimensions {dims}.") from e
+    if tuple(f.central_face.shape for f in rc.faces) != shapes:
+        raise NotPermittedMovementError(f"{move!r} cannot be applied on a cube of dimensions {dims}.")
+
+    permutation = np.concatenate([f.central_face.ravel() for f in rc.faces]).astype(np.intp)
+    permutation.flags.writeable = False
+    return permutation
+
+
+class MoveTable:
+    """Class that holds the permutations of stickers of a set of moves, for cubes of the same dimensions."""
+
+    def __init__(self, dims: tuple[int, int, int], moves: set[CubeMove] = None):
+        # Dimensions
+        self.dims: tuple[int, int, int] = tuple(dims)
+
+        # Moves, in the order of the CubeMove enumerator
+        moves = set(moves or CubeMove)
+        self.moves: tuple[CubeMove, ...] = tuple(m for m in CubeMove if m in moves)
+        self._index: dict[CubeMove, int] = {m: i for i, m in enumerate(self.moves)}
+
+        # Permutations of every move (one row per move) and their inverses
+        self.permutations: np.ndarray = np.stack([compile_move(self.dims, m) for m in self.moves])
+        self.inverse_permutations: np.ndarray = np.argsort(self.permutations, axis=1)
+        self.permutations.flags.writeable = False
+        self.inverse_permutations.flags.writeable = False
+
+    @classmethod
+    def from_permutations(cls, dims: tuple[int, int, int], moves: set[CubeMove],
+                          permutations: np.ndarray) -> MoveTable:
+        """
+        Makes a table with permutations that are already computed (e.g. loaded from a file), without compiling the
+        moves again.
+
+        :param dims: The dimensions in the standard (height, width, length).
+        :param moves: The set of moves.
+        :param permutations: The permutations of the moves, one row per move in the order of the CubeMove enumerator.
+        :return: A MoveTable instance.
+        """
+        table = cls.__new__(cls)
+        table.dims = tuple(dims)
+        table.moves = tuple(m for m in CubeMove if m in set(moves))
+        table._index = {m: i for i, m in enumerate(table.moves)}
+        if permutations.shape[0] != len(table.moves):
+            raise ValueError(f"There are {permutations.shape[0]} permutations for {len(table.moves)} moves.")
+        table.permutations = np.array(permutations, dtype=np.intp)
+        table.inverse_permutations = np.argsort(table.permutations, axis=1)
+        table.permutations.flags.writeable = False
+        table.inverse_permutations.flags.writeable = False
+        return table
+
+    def __len__(self) -> int:
+        return len(self.moves)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(dims={self.dims}, moves={list(self.moves)})"
+
+    def index(self, move: CubeMove) -> int:
+        """Returns the row of the table that corresponds to `move`."""
+        try:
+            return self._index[move]
+        except KeyError:
+            raise NotPermittedMovementError(
+                f"Movement not allowed. Please choose one of the list: {set(self.moves)}.") from None
+
+    def apply(self, stickers: np.ndarray, move: CubeMove) -> np.ndarray:
+        """
+        Applies a move on one or several vectors of stickers.
+
+        :param stickers: An array whose last axis are the stickers of a cube.
+        :param move: The move to apply.
+        :return: A new array with the move applied.
+        """
+        return stickers[..., self.permutations[self.index(move)]]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_move_table(dims: tuple[int, int, int], moves: frozenset[CubeMove]) -> MoveTable:
+    return MoveTable(dims, moves)
+
+
+def get_move_table(dims: tuple[int, int, int], moves: set[CubeMove] = None) -> MoveTable:
+    """
+    Returns the (cached) table of permutations for the dimensions `dims` and the set of moves `moves`.
+
+    :param dims: The dimensions in the standard (height, width, length).
+    :param moves: A set of moves. By default, every move.
+    :return: A MoveTable instance shared by every caller with the same arguments.
+    """
+    return _get_move_table(tuple(dims), frozenset(moves or CubeMove))
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from enum import Enum
 from typing import Union
 
@@ -31,11 +33,33 @@ class Color(Enum):
         return _COLORS[str(self.value)].format(self.name[0])
 
     def __hash__(self) -> int:
-        return {
-            "green": 1, "red": 2, "yellow": 3,
-            "orange": 4, "blue": 5, "white": 6
-        }.get(str(self.value), 0)
+        return _COLOR_HASHES[self._value_]
+
+    @property
+    def code(self) -> int:
+        """Small integer that identifies the color in the compact representations."""
+        return _COLOR_CODES[self.value]
+
+    @classmethod
+    def from_code(cls, code: int) -> Color:
+        """Returns the color identified by the integer `code`."""
+        return COLORS[code]
+
+
+# Hash codes of the colors. They are fixed so the hash of a cube does not depend on the process.
+_COLOR_HASHES: dict[str, int] = {
+    "green": 1, "red": 2, "yellow": 3,
+    "orange": 4, "blue": 5, "white": 6
+}
+
+# Integer codes of the colors, used to store a Rubik's Cube as an array of integers.
+_COLOR_CODES: dict[str, int] = {
+    "green": 0, "red": 1, "yellow": 2,
+    "orange": 3, "blue": 4, "white": 5
+}
 
+# Colors ordered by its code.
+COLORS: tuple[Color, ...] = tuple(sorted(Color, key=lambda c: _COLOR_CODES[c.value]))
 
 G, R, Y, O, B, W = Color.GREEN, Color.RED, Color.YELLOW, Color.ORANGE, Color.BLUE, Color.WHITE
 
@@ -62,3 +86,20 @@ class Direction(Enum):
 
     def generate_slice(self) -> TupleSlice:
         return _DICT_TUPLE_SLICES.get(self.value, (_ALL, _ALL))
+
+
+def face_shapes(dims: tuple[int, int, int]) -> tuple[tuple[int, int], ...]:
+    """
+    Returns the shapes of the faces of a Rubik's Cube with dimensions `dims`, in the order
+    (up, left, front, right, back, down).
+
+    :param dims: The dimensions in the standard (height, width, length).
+    :return: A tuple with the shape of every face.
+    """
+    height, width, length = dims
+    return (length, width), (height, length), (height, width), (height, length), (height, width), (length, width)
+
+
+def sticker_count(dims: tuple[int, int, int]) -> int:
+    """Returns the total number of stickers of a Rubik's Cube with dimensions `dims`."""
+    return sum(h * w for h, w in face_shapes(dims))
@@ -0,0 +1,58 @@
+import unittest
+
+import numpy as np
+
+from rubiks_cube.batch import CubeBatch
+from rubiks_cube.compact import CompactRubikCube
+from rubiks_cube.cube import NotPermittedMovementError, RubikCube
+from rubiks_cube.movements import CubeMove
+
+
+class TestCubeBatch(unittest.TestCase):
+    def setUp(self) -> None:
+        self.moves = {CubeMove.R2, CubeMove.L2, CubeMove.U2}
+        self.cubes = [RubikCube.from_dims((3, 2, 1), self.moves).make_movements(m) for m in ["R2", "L2 U2", "U2 R2"]]
+        self.batch: CubeBatch = CubeBatch.from_cubes(self.cubes)
+
+    def test_conversion(self):
+        self.assertEqual(
+            [rc.to_rubik_cube() for rc in self.batch.to_cubes()], self.cubes,
+            "Converting back and forth must return the same cubes.")
+        self.assertEqual(
+            self.batch.states.shape, (3, 22),
+            "The batch must hold one row per cube.")
+
+    def test_apply(self):
+        moved = self.batch.apply(CubeMove.L2)
+        self.assertEqual(
+            [rc.to_rubik_cube() for rc in moved.to_cubes()], [rc.make_movements(CubeMove.L2) for rc in self.cubes],
+            "'apply' does not agree with RubikCube.")
+        with self.assertRaises(NotPermittedMovementError):
+            self.batch.apply(CubeMove.D2)
+
+    def test_apply_each(self):
+        moves = [CubeMove.U2, CubeMove.R2, CubeMove.L2]
+        moved = self.batch.apply_each(moves)
+        self.assertEqual(
+            [rc.to_rubik_cube() for rc in moved.to_cubes()],
+            [rc.make_movements(m) for rc, m in zip(self.cubes, moves)],
+            "'apply_each' does not agree with RubikCube.")
+        for moves in [np.array(0), np.zeros((len(self.cubes), 1), dtype=np.intp), [CubeMove.U2]]:
+            with self.assertRaises(ValueError):
+                self.batch.apply_each(moves)
+
+    def test_expand(self):
+        expanded = self.batch.expand()
+        table = self.batch.table
+        self.assertEqual(
+            expanded.shape, (len(self.cubes) * len(table), 22),
+            "'expand' must return one row per cube and move.")
+        for i, rc in enumerate(self.cubes):
+            for k, move in enumerate(table.moves):
+                np.testing.assert_array_equal(
+                    expanded[i * len(table) + k], CompactRubikCube.from_rubik_cube(rc.make_movements(move)).stickers,
+                    "'expand' does not agree with RubikCube.")
+
+
+if __name__ == '__main__':
+    unittest.main()
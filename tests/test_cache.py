@@ -0,0 +1,121 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from rubiks_cube.cache import GraphCache
+from rubiks_cube.compact import CompactRubikCube
+from rubiks_cube.explorer import explore
+from rubiks_cube.graph import make_graph
+from rubiks_cube.movements import CubeMove
+from rubiks_cube.solver import PatternDatabase
+from rubiks_cube.tables import get_move_table
+
+
+class TestGraphCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = GraphCache(self.directory.name)
+        self.dims = (1, 3, 2)
+        self.moves = {CubeMove.R2, CubeMove.L2, CubeMove.B2}
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_make_graph(self):
+        expected = make_graph(self.dims, self.moves)
+        for _ in range(2):
+            g = make_graph(self.dims, self.moves, cache=self.cache)
+            self.assertEqual(set(g.nodes), set(expected.nodes), "The nodes must be the same as 'make_graph'.")
+            for n in expected.nodes:
+                self.assertEqual(g.nodes[n], expected.nodes[n], "The ids and depths must be the same.")
+            for u, v in expected.edges:
+                self.assertEqual(g[u][v]["move"], expected[u][v]["move"], "The movements must be the same.")
+
+    def test_make_graph_ids(self):
+        expected = make_graph(self.dims, self.moves)
+        g = make_graph(self.dims, self.moves, CompactRubikCube, cache=self.cache)
+        for crc in g.nodes:
+            self.assertEqual(g.nodes[crc]["id"], expected.nodes[crc.to_rubik_cube()]["id"],
+                             "The ids must be the same as 'make_graph' (and not depend on the process).")
+
+    def test_corrupted_entry(self):
+        for kind, get in [("graph", lambda: self.cache.state_graph(self.dims, self.moves)),
+                          ("table", lambda: self.cache.move_table(self.dims, self.moves)),
+                          ("pdb", lambda: self.cache.pattern_database(self.dims, self.moves))]:
+            get()
+            name = next(name for name in os.listdir(self.directory.name) if name.startswith(kind))
+            path = os.path.join(self.directory.name, name)
+            size = os.path.getsize(path)
+            with open(path, "r+b") as f:
+                f.truncate(size // 2)
+            value = get()
+            self.assertEqual(os.path.getsize(path), size, f"A corrupted {kind} must be made again.")
+            del value
+
+    def test_entry_removed_after_load(self):
+        self.cache.state_graph(self.dims, self.moves)
+        with mock.patch("rubiks_cube.cache.os.utime", side_effect=FileNotFoundError):
+            sg = self.cache.state_graph(self.dims, self.moves)
+        self.assertEqual(len(sg), len(explore(self.dims, self.moves)), "The loaded graph must be returned.")
+        del sg
+
+    def test_explored_once(self):
+        with mock.patch("rubiks_cube.cache.explore", wraps=explore) as explore_mock:
+            for _ in range(3):
+                sg = self.cache.state_graph(self.dims, self.moves)
+            self.assertEqual(explore_mock.call_count, 1, "The states must be explored only once.")
+        np.testing.assert_array_equal(sg.indices, explore(self.dims, self.moves).indices,
+                                      "The graph must be the one of 'explore'.")
+        self.assertEqual(len(os.listdir(self.directory.name)), 1, "Only the entry must be kept.")
+        del sg
+
+    def test_key(self):
+        key = self.cache.key("graph", self.dims, self.moves)
+        self.assertEqual(key, self.cache.key("graph", list(self.dims), sorted(self.moves, key=lambda m: m.code)),
+                         "The key must not depend on the order of the movements.")
+        self.assertNotEqual(key, self.cache.key("graph", self.dims, self.moves - {CubeMove.B2}),
+                            "The key must depend on the movements.")
+        self.assertNotEqual(key, self.cache.key("graph", (1, 2, 3), self.moves), "The key must depend on the dims.")
+        with mock.patch("rubiks_cube.cache.__version__", "0.0.0"):
+            self.assertNotEqual(key, self.cache.key("graph", self.dims, self.moves),
+                                "The key must depend on the version.")
+
+    def test_move_table_and_pattern_database(self):
+        dims, moves = (2, 2, 2), {CubeMove.R, CubeMove.U}
+        for _ in range(2):
+            table = self.cache.move_table(dims, moves)
+            expected = get_move_table(dims, moves)
+            self.assertEqual(table.moves, expected.moves, "The moves must be the same.")
+            np.testing.assert_array_equal(table.inverse_permutations, expected.inverse_permutations,
+                                          "The permutations must be the same.")
+            pdb = self.cache.pattern_database(dims, moves)
+            np.testing.assert_array_equal(pdb.distances, PatternDatabase.build(dims, moves).distances,
+                                          "The pattern database must be the same.")
+
+    def test_eviction(self):
+        names = []
+        for moves in [{CubeMove.R2}, {CubeMove.R2, CubeMove.L2}, {CubeMove.R2, CubeMove.B2}]:
+            sg = self.cache.state_graph(self.dims, moves)
+            names.append(self.cache.key("graph", self.dims, moves))
+            os.utime(os.path.join(self.directory.name, names[-1]), (time.time() - 100 + len(names),) * 2)
+            del sg
+        # Use the first entry, so the second one is the least recently used
+        self.cache.state_graph(self.dims, {CubeMove.R2})
+        sizes = {name: os.path.getsize(os.path.join(self.directory.name, name)) for name in names}
+        self.cache.max_bytes = sum(sizes.values()) - 1
+        self.cache.evict()
+        self.assertEqual(sorted(os.listdir(self.directory.name)), sorted([names[0], names[2]]),
+                         "The least recently used entry must be removed.")
+        self.cache.max_bytes = 0
+        self.cache.evict(keep=names[0])
+        self.assertEqual(os.listdir(self.directory.name), [names[0]], "The kept entry must not be removed.")
+        self.cache.clear()
+        self.assertEqual(self.cache.size(), 0, "The cache must be empty.")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+import numpy as np
+
+from rubiks_cube.compact import CompactRubikCube, to_compact
+from rubiks_cube.cube import NotPermittedMovementError, RubikCube
+from rubiks_cube.graph import make_graph
+from rubiks_cube.movements import CubeMove
+from tests.test_base import TestBase
+
+
+class TestCompactRubikCube(TestBase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.rc: RubikCube = RubikCube(*self.faces)
+        self.crc: CompactRubikCube = CompactRubikCube.from_rubik_cube(self.rc)
+
+    def test_stickers(self):
+        self.assertEqual(
+            self.crc.stickers.dtype, np.uint8,
+            "The stickers must be stored as uint8.")
+        self.assertEqual(
+            self.crc.stickers.nbytes, 22,
+            "A cube of 3x2x1 must use one byte per sticker.")
+
+    def test_conversion(self):
+        self.assertEqual(
+            self.crc.to_rubik_cube(), self.rc,
+            "Converting back and forth must return the same cube.")
+        self.assertEqual(
+            CompactRubikCube.from_dims((3, 2, 1)).to_rubik_cube(), RubikCube.from_dims((3, 2, 1)),
+            "'from_dims' does not create the solved cube.")
+
+    def test_to_compact(self):
+        self.assertIs(to_compact(self.crc), self.crc, "A compact cube must be returned as it is.")
+        self.assertEqual(to_compact(self.rc), self.crc, "A RubikCube must be converted.")
+
+    def test_make_movements(self):
+        for moves in ["R2", "L2", "U2", "D2", "R2 U2 L2 D2 R2"]:
+            self.assertEqual(
+                self.crc.make_movements(moves).to_rubik_cube(), self.rc.make_movements(moves),
+                f"'{moves}' does not agree with RubikCube.")
+        with self.assertRaises(NotPermittedMovementError):
+            CompactRubikCube.from_dims((3, 2, 1), {CubeMove.R2}).make_movements(CubeMove.L2)
+
+    def test_hash(self):
+        other = CompactRubikCube.from_rubik_cube(self.rc)
+        self.assertEqual(
+            hash(self.crc), hash(other),
+            "Similar instances must have the same hash code.")
+        self.assertEqual(
+            len({self.crc, other, self.crc.make_movements("L2")}), 2,
+            "Creating a set does not work correctly.")
+
+    def test_make_graph(self):
+        moves = {CubeMove.R2, CubeMove.L2, CubeMove.B2}
+        g = make_graph((1, 3, 2), moves)
+        g_compact = make_graph((1, 3, 2), moves, cube_class=CompactRubikCube)
+        self.assertEqual(
+            (len(g_compact), g_compact.number_of_edges()), (len(g), g.number_of_edges()),
+            "The graphs must have the same size.")
+        for crc in g_compact.nodes:
+            self.assertEqual(
+                g_compact.nodes[crc]["id"], g.nodes[crc.to_rubik_cube()]["id"],
+                "The ids must not depend on the class of the cubes.")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -114,6 +114,23 @@ class TestRubikCube(TestBase):
             new_rc, expected,
             "'make_movements_from_str' method does not work.")
 
+    def test_make_movements_is_immutable(self):
+        original: RubikCube = copy.deepcopy(self.rc)
+        new_rc = self.rc.make_movements("R2 U2 L2")
+        self.assertEqual(
+            self.rc, original,
+            "Making a movement must not modify the original cube.")
+        self.assertEqual(
+            new_rc.permitted_movements, self.rc.permitted_movements,
+            "The permitted movements must be the same.")
+        new_rc.permitted_movements.clear()
+        self.assertEqual(
+            self.rc.permitted_movements, original.permitted_movements,
+            "Changing the permitted movements of a moved cube must not modify the original cube.")
+        self.assertIs(
+            new_rc.up.central_face.base, new_rc.down.central_face.base,
+            "The faces of a moved cube must share a single buffer.")
+
     def test_deepcopy(self):
         other_rc: RubikCube = copy.deepcopy(self.rc)
 
@@ -123,6 +140,19 @@ class TestRubikCube(TestBase):
             self.rc, other_rc,
             "Method deepcopy does not work.")
 
+    def test_hash_after_copy_and_move(self):
+        hash(self.rc)
+        other_rc: RubikCube = copy.deepcopy(self.rc)
+        hash(other_rc)
+        # Move the copy in place
+        CubeMove.R2.move_the_cube(other_rc)
+        expected = self.rc.make_movements([CubeMove.R2])
+        self.assertEqual(other_rc, expected, "The moved copy must be equal to the moved cube.")
+        self.assertEqual(
+            hash(other_rc), hash(expected),
+            "A cube moved in place must have the hash code of its new state.")
+        self.assertIn(other_rc, {expected}, "A cube moved in place must be found in a set.")
+
 
 if __name__ == '__main__':
     unittest.main()
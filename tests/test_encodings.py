@@ -0,0 +1,42 @@
+import itertools
+import unittest
+
+from pysat.solvers import Solver
+
+from rubiks_cube.encodings import ENCODINGS, VariablePool, at_most_one, encoding_size, exactly_one
+
+
+class TestEncodings(unittest.TestCase):
+    def test_at_most_one(self):
+        for encoding in ENCODINGS:
+            for n in range(8):
+                literals = list(range(1, n + 1))
+                variables = VariablePool(n)
+                clauses = list(at_most_one(literals, variables, encoding))
+                self.assertEqual(
+                    encoding_size(encoding, n), (variables.top - n, len(clauses)),
+                    f"The size of '{encoding}' must be computed exactly.")
+                with Solver(name="cd", bootstrap_with=clauses) as solver:
+                    for values in itertools.product([False, True], repeat=n):
+                        assumptions = [x if value else -x for x, value in zip(literals, values)]
+                        self.assertEqual(
+                            solver.solve(assumptions=assumptions), sum(values) <= 1,
+                            f"'{encoding}' must allow exactly the assignments with at most one true literal.")
+
+    def test_exactly_one(self):
+        clauses = list(exactly_one([1, 2, 3], VariablePool(3), "sequential"))
+        with Solver(name="cd", bootstrap_with=clauses) as solver:
+            self.assertFalse(solver.solve(assumptions=[-1, -2, -3]))
+            self.assertTrue(solver.solve(assumptions=[-1, 2, -3]))
+
+    def test_linear_size(self):
+        for encoding in ["sequential", "commander", "totalizer", "ladder"]:
+            self.assertLess(encoding_size(encoding, 100)[1], encoding_size("pairwise", 100)[1] // 10)
+
+    def test_unknown_encoding(self):
+        with self.assertRaises(ValueError):
+            list(at_most_one([1, 2], VariablePool(2), "unknown"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+
+import networkx as nx
+import numpy as np
+
+from rubiks_cube.compact import CompactRubikCube
+from rubiks_cube.explorer import StateGraph, explore
+from rubiks_cube.graph import find_bipartite, generate_file, make_graph, make_simple_graph
+from rubiks_cube.movements import CubeMove
+
+
+class TestExplore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dims = (1, 3, 2)
+        self.moves = {CubeMove.R2, CubeMove.L2, CubeMove.B2}
+        self.sg: StateGraph = explore(self.dims, self.moves)
+        self.g: nx.Graph = make_graph(self.dims, self.moves)
+
+    def test_arrays(self):
+        self.assertEqual(len(self.sg), len(self.g), "The number of states is not correct.")
+        self.assertEqual(self.sg.indptr.dtype, np.int32)
+        self.assertEqual(self.sg.indices.dtype, np.int32)
+        self.assertEqual(self.sg.moves.dtype, np.uint8)
+        self.assertEqual(
+            self.sg.n_edges, len(self.sg) * len(self.moves),
+            "There must be an edge per state and movement.")
+        for i in [0, 7, 31]:
+            for v, m in zip(self.sg.neighbours(i), self.sg.moves[self.sg.indptr[i]:self.sg.indptr[i + 1]]):
+                self.assertEqual(
+                    self.sg.cube(i).make_movements(CubeMove.from_code(m)), self.sg.cube(v),
+                    "An edge does not agree with its movement.")
+
+    def test_depth(self):
+        self.assertEqual(self.sg.depth.dtype, np.uint8)
+        self.assertEqual(self.sg.depth[0], 0, "The solved cube must have depth 0.")
+        self.assertEqual(
+            self.sg.depth_distribution().sum(), len(self.sg),
+            "The depth distribution must count every state.")
+        # The depth is the distance in the graph of 'make_graph'
+        solved = self.sg.cube(0).to_rubik_cube()
+        distances = nx.single_source_shortest_path_length(self.g, solved)
+        for i in range(len(self.sg)):
+            rc = self.sg.cube(i).to_rubik_cube()
+            self.assertEqual(self.sg.depth[i], distances[rc], "The depth is not the distance to the solved cube.")
+            self.assertEqual(self.g.nodes[rc]["depth"], distances[rc], "'make_graph' must save the depth.")
+        self.assertTrue(
+            (np.diff(self.sg.depth.astype(int)) >= 0).all(),
+            "The states must be numbered layer by layer.")
+
+    def test_to_networkx(self):
+        g = self.sg.to_networkx()
+        self.assertEqual(set(g.nodes), set(self.g.nodes), "The nodes must be the same as 'make_graph'.")
+        self.assertEqual({frozenset(e) for e in g.edges}, {frozenset(e) for e in self.g.edges},
+                         "The edges must be the same as 'make_graph'.")
+        for n in self.g.nodes:
+            self.assertEqual(g.nodes[n], self.g.nodes[n], "The ids and depths must be the same as 'make_graph'.")
+        for u, v in self.g.edges:
+            self.assertEqual(
+                g[u][v]["move"], self.g[u][v]["move"],
+                "The movements of the edges must be the same as 'make_graph'.")
+        compact = self.sg.to_networkx(CompactRubikCube, label=False)
+        for i in range(len(self.sg)):
+            self.assertEqual(compact.nodes[self.sg.cube(i)]["id"], i, "The ids must be the ones of the StateGraph.")
+
+    def test_simple_graph(self):
+        simple_graph = make_simple_graph(self.sg)
+        g = self.sg.to_networkx(label=False)
+        self.assertEqual(
+            simple_graph, make_simple_graph(g),
+            "The simple graph must not depend on the representation.")
+
+    def test_find_bipartite(self):
+        U, V = find_bipartite(self.sg)
+        self.assertEqual((len(U), len(V)), (24, 24), "The bipartite is not correct.")
+        for u, neighbours in make_simple_graph(self.sg).items():
+            for v in neighbours:
+                self.assertNotEqual(self.sg.bipartite[u], self.sg.bipartite[v], "The bipartite is not correct.")
+
+    def test_generate_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            generate_file(self.sg, os.path.join(directory, "sg.txt"))
+            generate_file(self.sg.to_networkx(label=False), os.path.join(directory, "g.txt"))
+            with open(os.path.join(directory, "sg.txt")) as f_sg, open(os.path.join(directory, "g.txt")) as f_g:
+                self.assertEqual(f_sg.read(), f_g.read(), "The files must be the same.")
+
+
+if __name__ == '__main__':
+    unittest.main()
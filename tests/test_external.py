@@ -0,0 +1,40 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from rubiks_cube.explorer import explore
+from rubiks_cube.external import external_explore
+from rubiks_cube.movements import CubeMove
+
+
+class TestExternalExplore(unittest.TestCase):
+    def test_same_as_explore(self):
+        for dims, moves in [((1, 3, 2), {CubeMove.R2, CubeMove.L2, CubeMove.B2}),
+                            ((1, 3, 3), {CubeMove.R2, CubeMove.L2, CubeMove.B2, CubeMove.F2})]:
+            expected = explore(dims, moves)
+            with tempfile.TemporaryDirectory() as directory:
+                # A small budget forces several chunks and runs per layer
+                sg = external_explore(dims, moves, directory, memory_budget=2000)
+                for name in ["states", "indptr", "indices", "moves", "depth"]:
+                    np.testing.assert_array_equal(
+                        getattr(sg, name), getattr(expected, name),
+                        f"'{name}' must be the same as 'explore'.")
+                self.assertEqual(
+                    sorted(os.listdir(directory)),
+                    ["depth.bin", "indices.bin", "indptr.bin", "moves.bin", "states.bin"],
+                    "Only the final files must be kept.")
+                del sg
+
+    def test_failed_search(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with mock.patch("rubiks_cube.external._merge_unique", side_effect=OSError("No space left on device")):
+                with self.assertRaises(OSError):
+                    external_explore((1, 3, 2), {CubeMove.R2, CubeMove.L2, CubeMove.B2}, directory)
+            self.assertEqual(os.listdir(directory), [], "The work files must be removed.")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import itertools
+import random
+import unittest
+
+from rubiks_cube.cube import RubikCube
+from rubiks_cube.graph import make_graph
+from rubiks_cube.hamiltonian import benchmark_engines, find_hamiltonian_paths, hamiltonian_cycle, hamiltonian_path
+from rubiks_cube.movements import CubeMove
+from rubiks_cube.satisfiability import solve_incremental
+
+
+def is_path(neighbours: dict[int, set[int]], path: list[int]) -> bool:
+    return sorted(path) == list(range(len(neighbours))) and all(v in neighbours[u] for u, v in zip(path, path[1:]))
+
+
+class TestHamiltonianSearch(unittest.TestCase):
+    def test_small_graphs(self):
+        rng = random.Random(20220901)
+        for _ in range(300):
+            n = rng.randint(2, 7)
+            neighbours = {u: set() for u in range(n)}
+            for u, v in itertools.combinations(range(n), 2):
+                if rng.random() < 0.5:
+                    neighbours[u].add(v)
+                    neighbours[v].add(u)
+            s, t = rng.sample(range(n), 2)
+            expected = any(p[0] == s and p[-1] == t and is_path(neighbours, list(p))
+                           for p in itertools.permutations(range(n)))
+            path = hamiltonian_path(neighbours, s, t)
+            self.assertEqual(path is not None, expected, "The search must find a path if and only if it exists.")
+            if path is not None:
+                self.assertTrue(is_path(neighbours, path) and (path[0], path[-1]) == (s, t))
+
+    def test_cycle(self):
+        n = 10
+        cycle = {u: {(u - 1) % n, (u + 1) % n} for u in range(n)}
+        found = hamiltonian_cycle(cycle)
+        self.assertTrue(is_path(cycle, found) and found[0] in cycle[found[-1]])
+        del cycle[n - 1]
+        cycle[0].discard(n - 1)
+        cycle[n - 2].discard(n - 1)
+        self.assertIsNone(hamiltonian_cycle(cycle), "A path graph has no Hamiltonian cycle.")
+        self.assertEqual(hamiltonian_path(cycle, 0), list(range(n - 1)))
+
+    def test_timeout(self):
+        # A complete bipartite graph with classes of sizes 12 and 14 has no Hamiltonian path, and nothing is pruned
+        neighbours = {u: set(range(12, 26)) if u < 12 else set(range(12)) for u in range(26)}
+        with self.assertRaises(TimeoutError):
+            hamiltonian_path(neighbours, 0, time_limit=0.1)
+
+
+class TestFindHamiltonianPaths(unittest.TestCase):
+    def setUp(self) -> None:
+        self.g = make_graph((1, 3, 2), {CubeMove.R2, CubeMove.B2})
+        self.t = RubikCube.from_dims((1, 3, 2))
+
+    def test_same_as_sat(self):
+        expected = {s: model is not None for s, model in solve_incremental(self.g, self.t)}
+        results = list(find_hamiltonian_paths(self.g, self.t))
+        self.assertEqual({r.source: r.status == "found" for r in results}, expected)
+        for r in results:
+            if r.path is not None:
+                self.assertEqual((r.path[0], r.path[-1]), (r.source, self.t))
+                self.assertEqual(len(set(r.path)), len(self.g))
+                self.assertTrue(all(self.g.has_edge(u, v) for u, v in zip(r.path, r.path[1:])))
+
+    def test_benchmark_engines(self):
+        results = benchmark_engines(self.g, self.t)
+        self.assertEqual([r.engine for r in results], ["backtracking", "sat"])
+        self.assertEqual(results[0].n_paths, results[1].n_paths, "Both engines must find the same paths.")
+
+
+if __name__ == '__main__':
+    unittest.main()
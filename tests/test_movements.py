@@ -1,8 +1,10 @@
 import unittest
 
+import numpy as np
+
 from rubiks_cube.cube import RubikCube
 from rubiks_cube.faces import Face
-from rubiks_cube.movements import CubeMove
+from rubiks_cube.movements import MOVES, CubeMove, parse_algorithms, parse_moves
 from rubiks_cube.utils import R, Y, G, W, B
 from tests.test_base import TestBase
 
@@ -88,5 +90,35 @@ class TestD2(TestBaseMove):
         self._test_move_the_cube(CubeMove.D2, expected)
 
 
+class TestParseMoves(unittest.TestCase):
+    def test_parse_move(self):
+        for move in CubeMove:
+            self.assertIs(
+                CubeMove.parse_move(move.name), move,
+                f"'{move.name}' is not parsed correctly.")
+        self.assertIsNone(CubeMove.parse_move("hola"))
+
+    def test_codes(self):
+        for i, move in enumerate(MOVES):
+            self.assertEqual(move.code, i, "The code must be the position in the enumerator.")
+            self.assertIs(CubeMove.from_code(i), move, "'from_code' does not work.")
+
+    def test_parse_moves(self):
+        np.testing.assert_array_equal(
+            parse_moves("R2 U  Fp\nB L2"), [m.code for m in [CubeMove.R2, CubeMove.U, CubeMove.Fp, CubeMove.B,
+                                                            CubeMove.L2]],
+            "'parse_moves' does not work.")
+        for wrong in ["R U3", "Rpp", "hola", "Ü"]:
+            with self.assertRaises(ValueError):
+                parse_moves(wrong)
+
+    def test_parse_algorithms(self):
+        codes, offsets = parse_algorithms(["R2 U", "", "F2 Dp D"])
+        np.testing.assert_array_equal(offsets, [0, 2, 2, 5], "The offsets are not correct.")
+        np.testing.assert_array_equal(
+            codes[offsets[2]:offsets[3]], parse_moves("F2 Dp D"),
+            "The codes of every algorithm must agree with 'parse_moves'.")
+
+
 if __name__ == '__main__':
     unittest.main()
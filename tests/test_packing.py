@@ -0,0 +1,62 @@
+import unittest
+
+import numpy as np
+
+from rubiks_cube.compact import CompactRubikCube
+from rubiks_cube.cube import RubikCube
+from rubiks_cube.explorer import VisitedStates
+from rubiks_cube.movements import CubeMove
+from rubiks_cube.packing import WORD, hash_packed, n_words, pack, pack_cubes, packed_keys, unpack, unpack_cubes
+from rubiks_cube.ranking import state_keys
+
+
+class TestPacking(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rng = np.random.default_rng(0)
+
+    def test_round_trip(self):
+        for n_stickers in [1, 20, 21, 22, 24, 42, 54]:
+            states = self.rng.integers(0, 7, (100, n_stickers), dtype=np.uint8)
+            packed = pack(states)
+            self.assertEqual(packed.shape, (100, n_words(n_stickers)), "There must be 21 stickers per word.")
+            self.assertEqual(packed.dtype, WORD, "The words must be big-endian.")
+            np.testing.assert_array_equal(unpack(packed, n_stickers), states, "The states must be the same.")
+
+    def test_order_and_equality(self):
+        states = self.rng.integers(0, 6, (200, 24), dtype=np.uint8)
+        states[100:] = states[:100]
+        states[150:, -1] = (states[150:, -1] + 1) % 6
+        keys = packed_keys(pack(states))
+        np.testing.assert_array_equal(
+            np.argsort(keys, kind="stable"), np.argsort(state_keys(states), kind="stable"),
+            "The packed states must be sorted as the states.")
+        np.testing.assert_array_equal(keys[:100] == keys[100:], np.arange(100) < 50,
+                                      "The packed states must be equal if and only if the states are equal.")
+        hashes = hash_packed(pack(states))
+        np.testing.assert_array_equal(hashes[:50], hashes[100:150], "Equal states must have the same hash.")
+        self.assertEqual(len(np.unique(hashes)), 150, "Different states must have different hashes.")
+
+    def test_cubes(self):
+        rc = RubikCube.from_dims((3, 3, 3))
+        cubes = [rc, rc.make_movements([CubeMove.R, CubeMove.U]), rc.make_movements([CubeMove.F2])]
+        packed = pack_cubes(cubes)
+        self.assertEqual(packed.shape, (3, 3), "A 3x3x3 cube must take three words.")
+        self.assertEqual(unpack_cubes(packed, (3, 3, 3)), cubes, "The cubes must be the same.")
+        compact = unpack_cubes(packed, (3, 3, 3), cube_class=CompactRubikCube)
+        self.assertEqual([c.to_rubik_cube() for c in compact], cubes, "The compact cubes must be the same.")
+
+    def test_visited_states(self):
+        states = self.rng.integers(0, 6, (50, 22), dtype=np.uint8)
+        visited = VisitedStates(22)
+        ids, new = visited.add(np.concatenate([states, states[:10]]))
+        np.testing.assert_array_equal(ids[50:], ids[:10], "Repeated states must have the same id.")
+        np.testing.assert_array_equal(new[ids[:50]], states, "The new states must be in the order of their ids.")
+        _, new = visited.add(states[::-1])
+        self.assertEqual(len(new), 0, "There must not be new states.")
+        sorted_states = visited.states()
+        np.testing.assert_array_equal(sorted_states, states[np.argsort(state_keys(states))],
+                                      "The states must be in the order of their keys.")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from rubiks_cube.explorer import explore
+from rubiks_cube.movements import CubeMove
+from rubiks_cube.parallel import _exchange, parallel_explore
+
+
+def _failing_exchange(w, *args):
+    """Exchange where the second process fails, so the others are blocked waiting for it."""
+    if w == 1:
+        raise RuntimeError("The process failed.")
+    return _exchange(w, *args)
+
+
+class TestParallelExplore(unittest.TestCase):
+    def test_same_as_explore(self):
+        for dims, moves in [((1, 3, 2), {CubeMove.R2, CubeMove.L2, CubeMove.B2}),
+                            ((1, 3, 3), {CubeMove.R2, CubeMove.L2, CubeMove.B2, CubeMove.F2})]:
+            expected = explore(dims, moves)
+            sg = parallel_explore(dims, moves, processes=3)
+            for name in ["states", "indptr", "indices", "moves", "depth"]:
+                np.testing.assert_array_equal(
+                    getattr(sg, name), getattr(expected, name),
+                    f"'{name}' must be the same as 'explore'.")
+
+    def test_failed_process(self):
+        with mock.patch("rubiks_cube.parallel._exchange", _failing_exchange):
+            with self.assertRaises(RuntimeError):
+                parallel_explore((1, 3, 2), {CubeMove.R2, CubeMove.L2, CubeMove.B2}, processes=3)
+
+
+if __name__ == '__main__':
+    unittest.main()
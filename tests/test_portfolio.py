@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+
+from pysat.formula import CNF
+
+from rubiks_cube.portfolio import format_table, run_portfolio
+
+
+class TestRunPortfolio(unittest.TestCase):
+    def setUp(self) -> None:
+        self.formulas = {
+            "sat": [[1, 2], [-1, 2], [-2, 3]],
+            "unsat": CNF(from_clauses=[[1, 2], [-1], [-2]]),
+        }
+
+    def test_statuses(self):
+        results = run_portfolio(self.formulas, ["cd", "g4"], processes=2)
+        self.assertEqual(
+            [(r.formula, r.solver) for r in results], [("sat", "cd"), ("sat", "g4"), ("unsat", "cd"), ("unsat", "g4")],
+            "There must be a result for every formula and solver, in order.")
+        for name in self.formulas:
+            statuses = {r.status for r in results if r.formula == name}
+            self.assertIn(name, statuses, "At least one solver must answer.")
+            self.assertLessEqual(statuses, {name, "cancelled"}, "The other solvers must be cancelled.")
+
+    def test_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for name, formula in self.formulas.items():
+                formula = formula if isinstance(formula, CNF) else CNF(from_clauses=formula)
+                formula.to_file(os.path.join(directory, f"{name}.cnf"))
+            results = run_portfolio(directory, ["cd"], processes=1)
+        self.assertEqual([(r.formula, r.status) for r in results], [("sat.cnf", "sat"), ("unsat.cnf", "unsat")])
+
+    def test_timeout(self):
+        # The pigeonhole principle with 13 pigeons and 12 holes is hard for every solver
+        holes = 12
+        x = lambda p, h: p * holes + h + 1
+        clauses = [[x(p, h) for h in range(holes)] for p in range(holes + 1)]
+        clauses += [[-x(p, h), -x(q, h)] for h in range(holes) for p in range(holes + 1) for q in range(p)]
+        results = run_portfolio({"php": clauses}, ["cd"], processes=1, timeout=0.5)
+        self.assertEqual(results[0].status, "timeout")
+        self.assertLess(results[0].seconds, 5)
+
+    def test_format_table(self):
+        table = format_table(run_portfolio(self.formulas, ["cd"], processes=1))
+        lines = table.splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(lines[0].split(), ["formula", "solver", "status", "time", "conflicts"])
+        self.assertEqual(lines[1].split()[:3], ["sat", "cd", "sat"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import itertools
+import random
+import unittest
+
+from rubiks_cube.preprocessing import GraphPreprocessing
+
+
+def hamiltonian_paths(neighbours: dict[int, set[int]], s: int, t: int) -> list[list[int]]:
+    """Finds every Hamiltonian path from s to t by brute force."""
+    n = len(neighbours)
+    paths = []
+
+    def extend(path: list[int]):
+        if len(path) == n:
+            if path[-1] == t:
+                paths.append(list(path))
+            return
+        for v in neighbours[path[-1]]:
+            if v not in path:
+                path.append(v)
+                extend(path)
+                path.pop()
+
+    extend([s])
+    return paths
+
+
+class TestGraphPreprocessing(unittest.TestCase):
+    def test_cycle(self):
+        n = 8
+        cycle = {u: {(u - 1) % n, (u + 1) % n} for u in range(n)}
+        preprocessing = GraphPreprocessing(cycle, 0)
+        self.assertEqual(
+            [s for s in range(n) if preprocessing.is_possible(s)], [1, n - 1],
+            "In a cycle, the only Hamiltonian paths join neighbours.")
+        self.assertTrue(preprocessing.feasible(0, n - 1))
+        self.assertFalse(preprocessing.feasible(0, n - 2), "The parity of the positions must be fixed.")
+        self.assertFalse(preprocessing.feasible(2, n - 2))
+
+    def test_sound(self):
+        rng = random.Random(20220901)
+        for _ in range(300):
+            n = rng.randint(2, 8)
+            bipartite = rng.random() < 0.5
+            neighbours = {u: set() for u in range(n)}
+            for u, v in itertools.combinations(range(n), 2):
+                if (not bipartite or u % 2 != v % 2) and rng.random() < 0.45:
+                    neighbours[u].add(v)
+                    neighbours[v].add(u)
+            t = rng.randrange(n)
+            preprocessing = GraphPreprocessing(neighbours, t)
+            for s in range(n):
+                pruned = preprocessing.prune(s)
+                for path in hamiltonian_paths(neighbours, s, t):
+                    self.assertIsNotNone(pruned, "A pair with a Hamiltonian path must not be rejected.")
+                    self.assertTrue(
+                        all(v in pruned[u] for u, v in zip(path, path[1:])),
+                        "The edges of a Hamiltonian path must not be removed.")
+                    self.assertTrue(all(preprocessing.feasible(u, i) for i, u in enumerate(path)))
+
+
+if __name__ == '__main__':
+    unittest.main()
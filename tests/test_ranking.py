@@ -0,0 +1,99 @@
+import itertools
+import unittest
+
+import numpy as np
+
+from rubiks_cube.compact import CompactRubikCube
+from rubiks_cube.cube import RubikCube
+from rubiks_cube.movements import CubeMove
+from rubiks_cube.ranking import MultisetRanking, StateRanking, state_id, state_key, state_keys
+
+
+class TestStateKeys(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rc: RubikCube = RubikCube.from_dims((3, 2, 1)).make_movements("R2 U2")
+
+    def test_state_key(self):
+        crc = CompactRubikCube.from_rubik_cube(self.rc)
+        self.assertEqual(
+            state_key(self.rc), crc.stickers.tobytes(),
+            "The key must be the bytes of the color codes.")
+        self.assertEqual(
+            state_id(self.rc), state_id(crc),
+            "The integer id must not depend on the representation.")
+        self.assertNotEqual(
+            state_key(self.rc), state_key(self.rc.make_movements("L2")),
+            "Different states must have different keys.")
+
+    def test_state_keys(self):
+        states = np.stack([CompactRubikCube.from_rubik_cube(self.rc.make_movements(m)).stickers
+                           for m in ["R2", "L2", "R2"]])
+        keys = state_keys(states)
+        self.assertEqual(
+            [k.tobytes() for k in keys], [state_key(self.rc.make_movements(m)) for m in ["R2", "L2", "R2"]],
+            "The keys of an array must agree with 'state_key'.")
+        self.assertEqual(
+            len(np.unique(keys)), 2,
+            "The keys must be comparable.")
+
+
+class TestStateRanking(unittest.TestCase):
+    def setUp(self) -> None:
+        moves = {CubeMove.R2, CubeMove.L2, CubeMove.U2}
+        solved = CompactRubikCube.from_dims((3, 2, 1), moves)
+        self.cubes = [solved.make_movements(m) for m in ["R2", "L2", "U2", "R2 L2", "U2 R2"]]
+        self.ranking: StateRanking = StateRanking.from_cubes(self.cubes)
+
+    def test_rank(self):
+        for i, rc in enumerate(self.cubes):
+            self.assertEqual(
+                self.ranking.rank(rc), i,
+                "The rank must be the position of the cube.")
+            self.assertEqual(
+                self.ranking.unrank(i), rc,
+                "Unranking must return the same cube.")
+
+    def test_rank_states(self):
+        states = self.ranking.unrank_states([4, 0, 2])
+        np.testing.assert_array_equal(
+            self.ranking.rank_states(states), [4, 0, 2],
+            "Ranking several states does not work.")
+        solved = CompactRubikCube.from_dims((3, 2, 1))
+        self.assertNotIn(solved, self.ranking)
+        self.assertIn(self.cubes[3].to_rubik_cube(), self.ranking)
+        with self.assertRaises(KeyError):
+            self.ranking.rank(solved)
+
+    def test_repeated_states(self):
+        with self.assertRaises(ValueError):
+            StateRanking.from_cubes(self.cubes + self.cubes[:1])
+
+
+class TestMultisetRanking(unittest.TestCase):
+    def setUp(self) -> None:
+        self.solved = np.array([0, 0, 1, 1, 1, 2, 6, 6], dtype=np.uint8)
+        self.ranking = MultisetRanking(self.solved)
+        self.states = np.array(sorted(set(itertools.permutations(self.solved.tolist()))), dtype=np.uint8)
+
+    def test_perfect(self):
+        ranks = self.ranking.rank_states(self.states)
+        self.assertEqual(len(self.ranking), len(self.states), "There must be a rank per permutation.")
+        np.testing.assert_array_equal(np.sort(ranks), np.arange(len(self.states)),
+                                      "The ranks must be the integers in [0, N).")
+        np.testing.assert_array_equal(self.ranking.unrank_states(ranks), self.states,
+                                      "The states of the ranks must be the same.")
+
+    def test_other_stickers(self):
+        states = np.array([[0, 0, 0, 1, 1, 2, 6, 6], [0, 0, 1, 1, 1, 2, 6, 5]], dtype=np.uint8)
+        np.testing.assert_array_equal(self.ranking.rank_states(states, default=-1), [-1, -1],
+                                      "States with other stickers must have the default rank.")
+        with self.assertRaises(KeyError):
+            self.ranking.rank_states(states)
+
+    def test_too_many_states(self):
+        with self.assertRaises(ValueError):
+            MultisetRanking(np.repeat(np.arange(6, dtype=np.uint8), 9))
+
+
+if __name__ == '__main__':
+    unittest.main()
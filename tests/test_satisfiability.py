@@ -0,0 +1,182 @@
+import io
+import itertools
+import os
+import tempfile
+import unittest
+
+import networkx as nx
+import numpy as np
+from pysat.formula import CNF
+
+from rubiks_cube.cube import RubikCube
+from rubiks_cube.encodings import ENCODINGS
+from rubiks_cube.graph import make_graph, make_simple_graph
+from rubiks_cube.movements import CubeMove
+from rubiks_cube.preprocessing import GraphPreprocessing
+from rubiks_cube.satisfiability import (ParityVariableMap, VariableMap, benchmark_encodings, count_clauses,
+                                        decode_model, generate_clauses, generate_cnf_file, generate_variables,
+                                        interpret_model, iter_clauses, solve_clause, solve_clause_interpreted,
+                                        solve_incremental, write_cnf)
+
+
+class TestVariableMap(unittest.TestCase):
+    def check(self, variable_map: VariableMap):
+        n = variable_map.n
+        pairs = [(u, i) for u, i in itertools.product(range(n), repeat=2) if (u, i) in variable_map]
+        variables = [variable_map[p] for p in pairs]
+        self.assertEqual(sorted(variables), list(range(1, len(variable_map) + 1)), "The numbering must be dense.")
+        self.assertEqual([variable_map.pair(v) for v in variables], pairs)
+        vertices, positions = variable_map.decode(np.array(variables + [-1, len(variable_map) + 1]))
+        self.assertEqual(
+            sorted(zip(vertices.tolist(), positions.tolist())), pairs,
+            "Decoding must invert the numbering and ignore the other literals.")
+        for i in range(n):
+            self.assertEqual(variable_map.vertices(i), [u for u in range(n) if (u, i) in variable_map])
+        for u in range(n):
+            self.assertEqual(variable_map.positions(u), [i for i in range(n) if (u, i) in variable_map])
+
+    def test_dense(self):
+        variable_map = VariableMap(7)
+        self.check(variable_map)
+        self.assertEqual(variable_map[3, 5], 3 * 7 + 5 + 1)
+        X, X_ = generate_variables(nx.empty_graph(7))
+        self.assertEqual(list(X.items()), [((u, i), u * 7 + i + 1) for u, i in itertools.product(range(7), repeat=2)])
+        self.assertEqual(X_[22], (3, 0))
+
+    def test_parity(self):
+        side = [0, 1, 1, 0, 1, 0, 0]
+        variable_map = ParityVariableMap(side, 2)
+        self.check(variable_map)
+        self.assertIn((2, 6), variable_map)
+        self.assertNotIn((2, 5), variable_map)
+        self.assertNotIn((0, 6), variable_map)
+        with self.assertRaises(KeyError):
+            variable_map[0, 6]
+
+
+class TestCnfWriting(unittest.TestCase):
+    def setUp(self) -> None:
+        self.g = make_graph((1, 3, 2), {CubeMove.R2, CubeMove.L2, CubeMove.B2})
+        self.n = len(self.g)
+
+    def test_count_clauses(self):
+        clauses = generate_clauses(self.g, 1, 0)
+        n_variables, n_clauses = count_clauses(self.n)
+        self.assertEqual(n_clauses, len(clauses), "The number of clauses must be computed exactly.")
+        self.assertEqual(n_variables, max(abs(x) for c in clauses for x in c))
+
+    def test_same_as_pysat(self):
+        expected = io.StringIO()
+        CNF(from_clauses=generate_clauses(self.g, 1, 0)).to_fp(expected)
+        stream = io.StringIO()
+        write_cnf(iter_clauses(self.g, 1, 0), *count_clauses(self.n), stream)
+        self.assertEqual(stream.getvalue(), expected.getvalue(), "The file must be the same as the one of pysat.")
+
+    def test_wrong_header(self):
+        n_variables, n_clauses = count_clauses(self.n)
+        with self.assertRaises(ValueError):
+            write_cnf(iter_clauses(self.g, 1, 0), n_variables, n_clauses + 1, io.StringIO())
+
+    def test_unknown_size(self):
+        expected = io.StringIO()
+        write_cnf(iter_clauses(self.g, 1, 0), *count_clauses(self.n), expected)
+        stream = io.StringIO()
+        write_cnf(iter_clauses(self.g, 1, 0), None, None, stream)
+        self.assertEqual(stream.getvalue(), expected.getvalue(), "The size must be counted while it is written.")
+
+
+class TestCardinalityEncodings(unittest.TestCase):
+    def setUp(self) -> None:
+        self.g = make_graph((1, 3, 2), {CubeMove.R2, CubeMove.B2})
+        self.n = len(self.g)
+
+    def test_count_clauses(self):
+        for encoding in ENCODINGS:
+            for vertex_at_most_one in [False, True]:
+                clauses = generate_clauses(self.g, 1, 0, encoding, vertex_at_most_one)
+                self.assertEqual(
+                    count_clauses(self.n, encoding, vertex_at_most_one),
+                    (max(abs(x) for c in clauses for x in c), len(clauses)),
+                    f"The size with '{encoding}' must be computed exactly.")
+
+    def test_same_satisfiability(self):
+        for s in range(1, self.n):
+            results = benchmark_encodings(self.g, s, 0)
+            self.assertEqual(
+                {r.encoding for r in results}, set(ENCODINGS))
+            self.assertEqual(
+                len({r.satisfiable for r in results}), 1,
+                "Every encoding must give the same answer.")
+
+
+class TestSolveIncremental(unittest.TestCase):
+    def setUp(self) -> None:
+        self.g = make_graph((1, 3, 2), {CubeMove.R2, CubeMove.B2})
+        self.t = RubikCube.from_dims((1, 3, 2))
+
+    def test_same_as_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            generate_cnf_file(self.g, self.t, directory)
+            for s, model in solve_incremental(self.g, self.t):
+                expected = solve_clause(os.path.join(directory, f"rubik-{self.g.nodes[s]['id']}.cnf"))
+                self.assertEqual(
+                    model is None, expected is None,
+                    "The incremental solver must give the same answer as the files.")
+
+    def test_preprocess(self):
+        results = {s: model is not None for s, model in solve_incremental(self.g, self.t)}
+        preprocessed = {s: model is not None for s, model in solve_incremental(self.g, self.t, preprocess=True)}
+        self.assertEqual(preprocessed, results, "The preprocessing must not change the answers.")
+        with tempfile.TemporaryDirectory() as directory:
+            generate_cnf_file(self.g, self.t, directory, preprocess=True)
+            self.assertEqual(
+                len(os.listdir(directory)), sum(results.values()),
+                "Only the start nodes that were not rejected must have a file.")
+            for name in os.listdir(directory):
+                self.assertIsNotNone(solve_clause(os.path.join(directory, name)))
+
+    def test_interpret_preprocessed_files(self):
+        moves = {CubeMove.R2, CubeMove.L2, CubeMove.B2, CubeMove.F2}
+        g, t = make_graph((1, 2, 2), moves), RubikCube.from_dims((1, 2, 2), moves)
+        with tempfile.TemporaryDirectory() as directory:
+            preprocessing = generate_cnf_file(g, t, directory, preprocess=True)
+            self.assertIsNotNone(preprocessing, "The preprocessing of the files must be returned.")
+            for name in os.listdir(directory):
+                path = solve_clause_interpreted(g, os.path.join(directory, name), preprocessing=preprocessing)
+                self.assertEqual(
+                    [i for _, i in path], [g.nodes[rc]["id"] for rc, _ in path],
+                    "The ids must be the ones of the nodes.")
+                self.assertEqual(len({i for _, i in path}), len(g), "The path must visit every node once.")
+                self.assertEqual(f"rubik-{path[0][1]}.cnf", name, "The path must start at the node of the file.")
+                self.assertEqual(path[-1][0], t, "The path must end at t.")
+                for (rc, _), (other_rc, _) in zip(path, path[1:]):
+                    self.assertIn(other_rc, g[rc], "Consecutive nodes of the path must be adjacent.")
+
+    def test_decode_model(self):
+        preprocessing = GraphPreprocessing(make_simple_graph(self.g), self.g.nodes[self.t]["id"])
+        for preprocess in [False, True]:
+            models = solve_incremental(self.g, self.t, preprocessing=preprocessing if preprocess else None)
+            for s, model in models:
+                if model is None:
+                    continue
+                path = decode_model(self.g, model, preprocessing if preprocess else None)
+                self.assertEqual(path.ids.tolist(), [self.g.nodes[rc]["id"] for rc in path.cubes])
+                self.assertEqual(len(path.moves), len(self.g) - 1)
+                self.assertEqual(
+                    s.make_movements(path.moves), self.t,
+                    "The moves must go through the path.")
+
+    def test_hamiltonian_path(self):
+        results = dict(solve_incremental(self.g, self.t, encoding="ladder"))
+        self.assertTrue(any(model is not None for model in results.values()))
+        for s, model in results.items():
+            if model is None:
+                continue
+            path = [rc for rc, _ in interpret_model(self.g, model)]
+            self.assertEqual((path[0], path[-1]), (s, self.t))
+            self.assertEqual(len(set(path)), len(self.g), "The path must visit every node once.")
+            self.assertTrue(all(self.g.has_edge(u, v) for u, v in zip(path, path[1:])))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+
+import networkx as nx
+
+from rubiks_cube.compact import CompactRubikCube
+from rubiks_cube.explorer import explore
+from rubiks_cube.graph import make_graph
+from rubiks_cube.movements import CubeMove
+from rubiks_cube.search import find_path
+
+
+class TestFindPath(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dims = (1, 3, 3)
+        self.pm = {CubeMove.R2, CubeMove.L2, CubeMove.B2, CubeMove.F2}
+        self.solved = CompactRubikCube.from_dims(self.dims, self.pm)
+        self.sg = explore(self.dims, self.pm)
+
+    def test_shortest_path_from_solved(self):
+        for i in range(0, len(self.sg), 7):
+            goal = self.sg.cube(i)
+            path = find_path(self.solved, goal)
+            self.assertEqual(
+                len(path), self.sg.depth[i],
+                "The path must be as short as the distance found by the explorer.")
+            self.assertEqual(
+                self.solved.make_movements(path), goal,
+                "The path must transform the start into the goal.")
+
+    def test_shortest_path_between_states(self):
+        g = make_graph(self.dims, self.pm)
+        nodes = list(g.nodes)
+        for start, goal in zip(nodes[::5], nodes[3::5]):
+            path = find_path(start, goal)
+            self.assertEqual(
+                len(path), nx.shortest_path_length(g, start, goal),
+                "The path must be a shortest path of the graph.")
+            self.assertEqual(
+                start.make_movements(path), goal,
+                "The path must transform the start into the goal.")
+
+    def test_same_state(self):
+        self.assertEqual(
+            find_path(self.solved, self.solved), [],
+            "The path from a state to itself must be empty.")
+
+    def test_unreachable(self):
+        goal = self.solved.make_movements("R2 F2")
+        self.assertIsNone(
+            find_path(self.solved, goal, {CubeMove.R2, CubeMove.L2}),
+            "A state that can not be reached must give None.")
+        self.assertIsNone(
+            find_path(self.solved, goal, max_depth=1),
+            "A state farther than 'max_depth' must give None.")
+        self.assertEqual(
+            len(find_path(self.solved, goal, max_depth=2)), 2,
+            "A state at exactly 'max_depth' must be found.")
+
+    def test_different_dims(self):
+        with self.assertRaises(ValueError):
+            find_path(self.solved, CompactRubikCube.from_dims((2, 2, 2)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from rubiks_cube.compact import CompactRubikCube
+from rubiks_cube.explorer import explore
+from rubiks_cube.movements import CubeMove
+from rubiks_cube.service import solve_batch
+
+
+class TestSolveBatch(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dims = (1, 3, 3)
+        self.moves = {CubeMove.R2, CubeMove.L2, CubeMove.B2, CubeMove.F2}
+        self.scrambles = ["R2 F2 L2", "", "B2 R2 B2 L2 F2", "R2 R2", "F2 B2 L2 R2 F2 L2"] * 4
+
+    def test_in_order(self):
+        results = list(solve_batch((s for s in self.scrambles), self.dims, self.moves, processes=2, chunksize=3))
+        self.assertEqual(
+            [(r.index, r.scramble) for r in results], list(enumerate(self.scrambles)),
+            "The results must be in the order of the scrambles.")
+        self.assertTrue(all(r.seconds >= 0 for r in results))
+
+    def test_optimal(self):
+        solved = CompactRubikCube.from_dims(self.dims, self.moves)
+        sg = explore(self.dims, self.moves)
+        depth = {sg.cube(i): sg.depth[i] for i in range(len(sg))}
+        for result in solve_batch(self.scrambles, self.dims, self.moves, processes=2):
+            rc = solved.make_movements(result.scramble)
+            self.assertEqual(
+                len(result.solution), depth[rc],
+                "The solutions must be shortest ones.")
+            self.assertEqual(rc.make_movements(result.solution), solved, "The solution must solve the cube.")
+            self.assertIsNone(result.error, "A valid scramble must not have an error.")
+
+    def test_invalid_scrambles(self):
+        scrambles = ["R2 F2", "R2 X", "U", "L2"]
+        results = list(solve_batch(scrambles, self.dims, self.moves, processes=2, chunksize=2))
+        self.assertEqual([r.scramble for r in results], scrambles, "Every scramble must have a result.")
+        for i in [1, 2]:
+            self.assertIsNone(results[i].solution, "An invalid scramble must not have a solution.")
+            self.assertIsNotNone(results[i].error, "An invalid scramble must have an error.")
+        for i in [0, 3]:
+            self.assertIsNone(results[i].error, "The other scrambles must be solved.")
+            self.assertIsNotNone(results[i].solution, "The other scrambles must be solved.")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from rubiks_cube.compact import CompactRubikCube
+from rubiks_cube.explorer import explore
+from rubiks_cube.movements import CubeMove
+from rubiks_cube.solver import IDAStarSolver, PatternDatabase
+from rubiks_cube.utils import Color
+
+
+class TestPatternDatabase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dims = (1, 3, 3)
+        self.moves = {CubeMove.R2, CubeMove.L2, CubeMove.B2, CubeMove.F2}
+        self.pdb: PatternDatabase = PatternDatabase.build(self.dims, self.moves, (Color.GREEN, Color.BLUE))
+
+    def test_admissible(self):
+        sg = explore(self.dims, self.moves)
+        bounds = self.pdb.lookup(sg.states)
+        self.assertEqual(bounds[0], 0, "The solved cube must have distance 0.")
+        self.assertTrue((bounds <= sg.depth).all(), "The pattern database must be a lower bound.")
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "pdb.npz")
+            self.pdb.save(path)
+            loaded = PatternDatabase.load(path)
+        self.assertEqual((loaded.dims, loaded.moves, loaded.colors), (self.pdb.dims, self.pdb.moves, self.pdb.colors))
+        np.testing.assert_array_equal(loaded.distances, self.pdb.distances)
+        np.testing.assert_array_equal(loaded.ranks, self.pdb.ranks)
+
+    def test_dense(self):
+        with mock.patch("rubiks_cube.solver._DENSE_FACTOR", len(self.pdb.ranking)):
+            dense = PatternDatabase.build(self.dims, self.moves, (Color.GREEN, Color.BLUE))
+        self.assertIsNone(dense.ranks, "The distances must be indexed by the rank.")
+        self.assertEqual(len(dense), len(self.pdb), "The number of abstract states must be the same.")
+        states = explore(self.dims, self.moves).states
+        np.testing.assert_array_equal(dense.lookup(states), self.pdb.lookup(states),
+                                      "The distances must be the same.")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "pdb.npz")
+            dense.save(path)
+            loaded = PatternDatabase.load(path)
+        self.assertIsNone(loaded.ranks, "The loaded distances must be indexed by the rank.")
+        np.testing.assert_array_equal(loaded.lookup(states), self.pdb.lookup(states),
+                                      "The loaded distances must be the same.")
+
+    def test_unreachable(self):
+        states = CompactRubikCube.from_dims(self.dims).make_movements([CubeMove.R2, CubeMove.U2]).stickers[None, :]
+        self.assertRaises(KeyError, self.pdb.lookup, states)
+
+
+class TestIDAStarSolver(unittest.TestCase):
+    def test_optimal(self):
+        dims, moves = (1, 3, 3), {CubeMove.R2, CubeMove.L2, CubeMove.B2, CubeMove.F2}
+        solver = IDAStarSolver(dims, moves)
+        sg = explore(dims, moves)
+        solved = CompactRubikCube.from_dims(dims, moves)
+        for i in range(0, len(sg), 7):
+            solution = solver.solve(sg.cube(i))
+            self.assertEqual(len(solution), sg.depth[i], "The solution must be a shortest one.")
+            self.assertEqual(sg.cube(i).make_movements(solution), solved, "The solution must solve the cube.")
+
+    def test_quarter_turns(self):
+        moves = {CubeMove.R, CubeMove.Rp, CubeMove.U, CubeMove.Up, CubeMove.F, CubeMove.Fp}
+        solver = IDAStarSolver((2, 2, 2), moves)
+        rc = CompactRubikCube.from_dims((2, 2, 2), moves).make_movements("R U Fp R Up F")
+        solution = solver.solve(rc)
+        self.assertLessEqual(len(solution), 6)
+        self.assertEqual(rc.make_movements(solution), CompactRubikCube.from_dims((2, 2, 2), moves))
+
+    def test_unreachable(self):
+        moves = {CubeMove.R, CubeMove.Rp, CubeMove.U, CubeMove.Up}
+        solver = IDAStarSolver((2, 2, 2), moves)
+        rc = CompactRubikCube.from_dims((2, 2, 2)).make_movements([CubeMove.F])
+        self.assertIsNone(solver.solve(rc), "A cube that can not be solved with the movements must return None.")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from rubiks_cube.explorer import explore
+from rubiks_cube.graph import generate_file, make_simple_graph
+from rubiks_cube.movements import CubeMove
+from rubiks_cube.storage import convert_to_edge_list, load_graph, load_simple_graph, read_edge_list, save_graph
+
+
+class TestGraphFile(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sg = explore((1, 3, 2), {CubeMove.R2, CubeMove.L2, CubeMove.B2})
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "graph.bin")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_save_and_load(self):
+        save_graph(self.sg, self.path)
+        for mmap in [True, False]:
+            sg = load_graph(self.path, mmap=mmap)
+            self.assertEqual(sg.dims, self.sg.dims, "The dims must be the same.")
+            self.assertEqual(sg.permitted_movements, self.sg.permitted_movements,
+                             "The permitted movements must be the same.")
+            for name in ["states", "indptr", "indices", "moves", "depth"]:
+                np.testing.assert_array_equal(getattr(sg, name), getattr(self.sg, name),
+                                              f"'{name}' must be the same.")
+            self.assertEqual(isinstance(sg.states, np.memmap), mmap, "The states must be mapped only with 'mmap'.")
+            del sg
+
+    def test_aligned_sections(self):
+        save_graph(self.sg, self.path)
+        sg = load_graph(self.path)
+        for name in ["states", "indptr", "indices", "moves", "depth"]:
+            self.assertEqual(getattr(sg, name).offset % 64, 0, f"The section '{name}' must be aligned.")
+        del sg
+
+    def test_without_depth(self):
+        self.sg.depth = None
+        save_graph(self.sg, self.path)
+        sg = load_graph(self.path)
+        self.assertIsNone(sg.depth, "The depth must not be known.")
+        np.testing.assert_array_equal(sg.indices, self.sg.indices, "The indices must be the same.")
+        del sg
+
+    def test_invalid_file(self):
+        with open(self.path, "wb") as f:
+            f.write(b"48 72\n")
+        self.assertRaises(ValueError, load_graph, self.path)
+        save_graph(self.sg, self.path)
+        with open(self.path, "r+b") as f:
+            f.truncate(os.path.getsize(self.path) - 1)
+        self.assertRaises(ValueError, load_graph, self.path)
+
+
+class TestEdgeList(unittest.TestCase):
+    def test_round_trip(self):
+        sg = explore((1, 3, 2), {CubeMove.R2, CubeMove.L2, CubeMove.B2})
+        with tempfile.TemporaryDirectory() as directory:
+            graph_path = os.path.join(directory, "graph.bin")
+            path = os.path.join(directory, "graph.txt")
+            save_graph(sg, graph_path)
+            convert_to_edge_list(graph_path, path)
+            n, edges = read_edge_list(path)
+            self.assertEqual(n, len(sg), "The number of nodes must be the same.")
+            expected = sg.edge_list()
+            np.testing.assert_array_equal(edges, expected[expected[:, 0] < expected[:, 1]],
+                                          "The edges must be the ones of the graph.")
+            self.assertEqual(load_simple_graph(path), make_simple_graph(sg),
+                             "The simple graph must be the same.")
+
+            expected_path = os.path.join(directory, "expected.txt")
+            generate_file(sg, expected_path)
+            with open(path) as f, open(expected_path) as g:
+                self.assertEqual(f.read(), g.read(), "The text file must be the one of 'generate_file'.")
+
+    def test_wrong_number_of_edges(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "graph.txt")
+            with open(path, "w") as f:
+                f.write("3 2\n0 1\n")
+            self.assertRaises(ValueError, read_edge_list, path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+
+import numpy as np
+
+from rubiks_cube.compact import CompactRubikCube
+from rubiks_cube.explorer import explore
+from rubiks_cube.movements import CubeMove
+from rubiks_cube.symmetry import apply_symmetries, canonicalize, reduced_explore, symmetry_group
+
+
+class TestSymmetryGroup(unittest.TestCase):
+    def test_size(self):
+        self.assertEqual(len(symmetry_group((2, 2, 2))), 48, "A cube with every move has 48 symmetries.")
+        self.assertEqual(
+            len(symmetry_group((2, 2, 2), {CubeMove.R, CubeMove.U, CubeMove.F})), 3,
+            "Only the rotations around the fixed corner preserve <R, U, F>.")
+        self.assertEqual(
+            len(symmetry_group((1, 3, 2), {CubeMove.R2, CubeMove.L2, CubeMove.B2})), 4,
+            "The symmetries of a cuboid must preserve the permitted movements.")
+
+    def test_commutes_with_moves(self):
+        moves = {CubeMove.R2, CubeMove.L2, CubeMove.B2}
+        group = symmetry_group((1, 3, 2), moves)
+        solved = CompactRubikCube.from_dims((1, 3, 2), moves)
+        np.testing.assert_array_equal(
+            apply_symmetries(solved.stickers[None, :], group)[:, 0], np.tile(solved.stickers, (len(group), 1)),
+            "The symmetries must fix the solved cube.")
+        rc = solved.make_movements("R2 B2 L2 B2")
+        images = apply_symmetries(rc.stickers[None, :], group)[:, 0]
+        for move in moves:
+            moved_images = apply_symmetries(rc.make_movements(move).stickers[None, :], group)[:, 0]
+            for image, moved_image in zip(images, moved_images):
+                self.assertIn(
+                    moved_image.tobytes(), {CompactRubikCube(image, rc.dims).make_movements(m).key for m in moves},
+                    "The image of a neighbour must be a neighbour of the image.")
+
+    def test_canonicalize(self):
+        moves = {CubeMove.R2, CubeMove.L2, CubeMove.B2}
+        group = symmetry_group((1, 3, 2), moves)
+        rc = CompactRubikCube.from_dims((1, 3, 2), moves).make_movements("R2 B2")
+        images = apply_symmetries(rc.stickers[None, :], group)[:, 0]
+        representatives, orbit_sizes = canonicalize(images, group)
+        self.assertEqual(
+            len({row.tobytes() for row in representatives}), 1,
+            "Every element of an orbit must have the same representative.")
+        self.assertEqual(
+            orbit_sizes[0], len({row.tobytes() for row in images}),
+            "The size of the orbit is not correct.")
+
+    def test_canonicalize_minimum(self):
+        group = symmetry_group((2, 2, 2))
+        rng = np.random.default_rng(0)
+        states = np.stack([rng.permutation(CompactRubikCube.from_dims((2, 2, 2)).stickers) for _ in range(20)])
+        states[10:] = apply_symmetries(states[:10], group)[5]
+        representatives, orbit_sizes = canonicalize(states, group)
+        for state, representative, orbit_size in zip(states, representatives, orbit_sizes):
+            images = {row.tobytes() for row in apply_symmetries(state[None, :], group)[:, 0]}
+            self.assertEqual(representative.tobytes(), min(images), "The representative must be the smallest image.")
+            self.assertEqual(orbit_size, len(images), "The size of the orbit is not correct.")
+
+
+class TestReducedExplore(unittest.TestCase):
+    def test_full_counts(self):
+        for dims, moves in [((1, 3, 2), {CubeMove.R2, CubeMove.L2, CubeMove.B2}),
+                            ((1, 3, 3), {CubeMove.R2, CubeMove.L2, CubeMove.B2, CubeMove.F2})]:
+            expected = explore(dims, moves)
+            reduced = reduced_explore(dims, moves)
+            self.assertLess(len(reduced), len(expected), "The reduced graph must be smaller.")
+            self.assertEqual(reduced.n_full_states, len(expected), "The number of states is not correct.")
+            np.testing.assert_array_equal(
+                reduced.full_depth_distribution(), expected.depth_distribution(),
+                "The depth distribution is not correct.")
+            np.testing.assert_array_equal(
+                reduced.full_states(), np.unique(expected.states, axis=0),
+                "The expanded states are not correct.")
+
+
+if __name__ == '__main__':
+    unittest.main()
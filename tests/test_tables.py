@@ -0,0 +1,70 @@
+import unittest
+
+import numpy as np
+
+from rubiks_cube.compact import CompactRubikCube
+from rubiks_cube.cube import NotPermittedMovementError, RubikCube
+from rubiks_cube.movements import CubeMove
+from rubiks_cube.tables import MoveTable, compile_move, get_move_table
+from tests.test_base import TestBase
+
+
+class TestCompileMove(TestBase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.rc: RubikCube = RubikCube(*self.faces)
+        self.crc: CompactRubikCube = CompactRubikCube.from_rubik_cube(self.rc)
+
+    def test_agrees_with_faces(self):
+        for move in [CubeMove.R2, CubeMove.L2, CubeMove.U2, CubeMove.D2, CubeMove.F2, CubeMove.B2]:
+            stickers = self.crc.stickers[compile_move(self.rc.dims, move)]
+            expected = CompactRubikCube.from_rubik_cube(self.rc.make_movements(move)).stickers
+            np.testing.assert_array_equal(
+                stickers, expected,
+                f"The permutation of '{repr(move)}' does not agree with the faces.")
+
+    def test_quarter_turns(self):
+        rc = RubikCube.from_dims((2, 2, 2)).make_movements("R2 U2 F2")
+        crc = CompactRubikCube.from_rubik_cube(rc)
+        for move in CubeMove:
+            self.assertEqual(
+                crc.make_movements(move).to_rubik_cube(), rc.make_movements(move),
+                f"'{repr(move)}' does not agree with RubikCube.")
+
+    def test_not_permitted(self):
+        with self.assertRaises(NotPermittedMovementError):
+            compile_move((3, 2, 1), CubeMove.R)
+
+    def test_cache(self):
+        self.assertIs(
+            compile_move((2, 2, 2), CubeMove.R), compile_move((2, 2, 2), CubeMove.R),
+            "The permutations must be cached.")
+
+
+class TestMoveTable(unittest.TestCase):
+    def setUp(self) -> None:
+        self.table: MoveTable = get_move_table((2, 2, 2), {CubeMove.U, CubeMove.R, CubeMove.Rp})
+
+    def test_order(self):
+        self.assertEqual(
+            self.table.moves, (CubeMove.U, CubeMove.R, CubeMove.Rp),
+            "The moves must follow the order of CubeMove.")
+        self.assertIs(
+            self.table, get_move_table((2, 2, 2), [CubeMove.Rp, CubeMove.R, CubeMove.U]),
+            "The tables must be cached.")
+
+    def test_inverse(self):
+        stickers = CompactRubikCube.from_dims((2, 2, 2)).make_movements("U R").stickers
+        moved = self.table.apply(stickers, CubeMove.R)
+        np.testing.assert_array_equal(
+            self.table.apply(moved, CubeMove.Rp), stickers,
+            "R' must undo R.")
+        np.testing.assert_array_equal(
+            moved[self.table.inverse_permutations[self.table.index(CubeMove.R)]], stickers,
+            "The inverse permutation must undo the move.")
+        with self.assertRaises(NotPermittedMovementError):
+            self.table.index(CubeMove.L)
+
+
+if __name__ == '__main__':
+    unittest.main()